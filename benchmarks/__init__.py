@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for the converter.
+
+corpus.py generates synthetic .docx files of a chosen shape and run.py times
+parsing and writing separately, saving the results as JSON so runs can be
+compared across commits:
+
+    python -m benchmarks.run -o results.json
+    python -m benchmarks.run --compare results.json
+"""
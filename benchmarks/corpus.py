@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+"""
+Generator for synthetic .docx benchmark documents.
+
+Documents are built with python-docx from a CorpusSpec, so their size and
+shape (paragraph count, run fragmentation, tables with merged cells, images,
+heading depth) can be scaled independently.
+"""
+import argparse
+import io
+import os
+import random
+import struct
+import zlib
+from typing import Dict, List, Optional
+
+from docx import Document as DocxDocument
+from docx.shared import Pt, Inches
+
+_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua enim ad minim veniam quis nostrud "
+    "exercitation ullamco laboris nisi aliquip ex ea commodo consequat"
+).split()
+
+
+class CorpusSpec:
+    """
+    Shape of a generated benchmark document.
+    """
+
+    def __init__(self, name: str, paragraphs: int = 100, runs_per_paragraph: int = 1,
+                 tables: int = 0, table_rows: int = 5, table_cols: int = 4,
+                 merges: bool = False, images: int = 0, heading_depth: int = 3,
+                 section_length: int = 10, seed: int = 0):
+        self.name: str = name                              # File name without extension
+        self.paragraphs: int = paragraphs                  # Number of body paragraphs
+        self.runs_per_paragraph: int = runs_per_paragraph  # Runs each paragraph is split into
+        self.tables: int = tables                          # Number of tables
+        self.table_rows: int = table_rows                  # Rows per table
+        self.table_cols: int = table_cols                  # Columns per table
+        self.merges: bool = merges                         # Add horizontally and vertically merged cells
+        self.images: int = images                          # Number of inline images
+        self.heading_depth: int = heading_depth            # Deepest heading level used (0 for none)
+        self.section_length: int = section_length          # Body paragraphs between headings
+        self.seed: int = seed                              # Seed for the generated text
+
+    def to_dict(self) -> dict:
+        """Return the spec as a plain dictionary (e.g. for JSON reports)"""
+        return dict(vars(self))
+
+
+# Named document shapes used by the runner
+PRESETS: Dict[str, CorpusSpec] = {
+    spec.name: spec for spec in [
+        CorpusSpec('small', paragraphs=50, tables=1, images=1),
+        CorpusSpec('text', paragraphs=5000, runs_per_paragraph=4, heading_depth=4),
+        CorpusSpec('fragmented', paragraphs=2000, runs_per_paragraph=20),
+        CorpusSpec('tables', paragraphs=200, tables=50, table_rows=20, table_cols=6, merges=True),
+        CorpusSpec('images', paragraphs=200, images=100),
+        CorpusSpec('mixed', paragraphs=3000, runs_per_paragraph=3, tables=30, table_rows=10,
+                   table_cols=5, merges=True, images=30, heading_depth=5),
+    ]
+}
+
+
+def png_bytes(width: int, height: int, seed: int = 0) -> bytes:
+    """
+    Build a small RGB PNG without any imaging library
+
+    Args:
+        width: Width in pixels
+        height: Height in pixels
+        seed: Varies the pixel colours so images are not identical
+
+    Returns:
+        bytes: The encoded PNG file
+    """
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (struct.pack('>I', len(data)) + kind + data
+                + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+    rows = b''.join(
+        b'\x00' + bytes((x * 7 + seed) % 256 for x in range(width)) * 3
+        for _ in range(height)
+    )
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(rows)) + chunk(b'IEND', b''))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """Build a sentence of random filler words"""
+    return ' '.join(rng.choice(_WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _add_paragraph(doc, rng: random.Random, runs: int) -> None:
+    """Add a body paragraph split into the given number of runs"""
+    paragraph = doc.add_paragraph()
+    for index in range(runs):
+        run = paragraph.add_run(_sentence(rng, rng.randint(4, 12)) + ' ')
+        # Alternate formatting so neighbouring runs cannot be merged by Word
+        run.bold = index % 3 == 1
+        run.italic = index % 3 == 2
+
+
+def _add_table(doc, rng: random.Random, spec: CorpusSpec) -> None:
+    """Add a table, optionally with merged cells"""
+    table = doc.add_table(rows=spec.table_rows, cols=spec.table_cols)
+    for row in table.rows:
+        for cell in row.cells:
+            cell.text = _sentence(rng, rng.randint(1, 4))
+
+    if spec.merges and spec.table_rows >= 3 and spec.table_cols >= 2:
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 0).merge(table.cell(2, 0))
+
+
+def _add_image(doc, index: int) -> None:
+    """Add a paragraph with an inline picture"""
+    image = png_bytes(32 + index % 32, 24, seed=index)
+    doc.add_picture(io.BytesIO(image), width=Inches(1))
+
+
+def _spread(count: int, total: int) -> List[int]:
+    """Distribute count items evenly over total positions"""
+    if count <= 0 or total <= 0:
+        return []
+    return [position * total // count for position in range(count)]
+
+
+def generate_docx(path: str, spec: CorpusSpec) -> str:
+    """
+    Generate a .docx file with the shape described by a spec
+
+    Args:
+        path: Output file path
+        spec: Shape of the document
+
+    Returns:
+        str: The path of the generated file
+    """
+    rng = random.Random(spec.seed)
+    doc = DocxDocument()
+    doc.styles['Normal'].font.size = Pt(11)
+
+    tables_at = _spread(spec.tables, spec.paragraphs)
+    images_at = _spread(spec.images, spec.paragraphs)
+    heading_level = 0
+
+    for index in range(spec.paragraphs):
+        if spec.heading_depth and index % spec.section_length == 0:
+            # Walk down to the deepest level and start over
+            heading_level = heading_level % spec.heading_depth + 1
+            doc.add_heading(_sentence(rng, 3), level=heading_level)
+
+        _add_paragraph(doc, rng, spec.runs_per_paragraph)
+
+        for _ in range(tables_at.count(index)):
+            _add_table(doc, rng, spec)
+        for image_index in range(images_at.count(index)):
+            _add_image(doc, index + image_index)
+
+    doc.save(path)
+    return path
+
+
+def generate_corpus(output_dir: str, names: Optional[List[str]] = None) -> List[str]:
+    """
+    Generate the documents of several presets, reusing files that already exist
+
+    Args:
+        output_dir: Directory to write the documents into
+        names: Preset names (default: all presets)
+
+    Returns:
+        List[str]: Paths of the documents
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for name in names or list(PRESETS):
+        path = os.path.join(output_dir, f"{name}.docx")
+        if not os.path.exists(path):
+            generate_docx(path, PRESETS[name])
+        paths.append(path)
+    return paths
+
+
+def main():
+    """CLI entry point for the corpus generator"""
+    parser = argparse.ArgumentParser(description='Generate synthetic .docx benchmark documents')
+    parser.add_argument('output_dir', help='Directory to write the documents into')
+    parser.add_argument('--preset', action='append', choices=sorted(PRESETS),
+                        help='Preset to generate (repeatable, default: all)')
+    args = parser.parse_args()
+
+    for path in generate_corpus(args.output_dir, args.preset):
+        print(f"{path} ({os.path.getsize(path) // 1024} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of Markdown escaping.
+
+Times escape_markdown against the escaping it replaced (kept here as the
+reference, although it covers fewer characters) and against the two
+single-pass designs it was chosen over, a compiled regex and a str.translate
+table, on run-sized texts with few and with many special characters.
+"""
+import argparse
+import random
+import re
+import timeit
+from typing import Dict, List
+
+from src.writer.escaping import MARKDOWN_SPECIAL_CHARS, escape_markdown
+from .corpus import _WORDS
+
+# Texts of the sizes Word runs usually have
+SAMPLE_LENGTHS = (16, 80, 400, 2000)
+
+
+def legacy_escape(text: str) -> str:
+    """The former escaping: a pre-scan, then one str.replace pass per character"""
+    if not any(c in text for c in '*_#`[]()'):
+        return text
+    text = text.replace('\\', '\\\\')
+    for char in '*_#`[]()':
+        text = text.replace(char, '\\' + char)
+    return text
+
+
+_SPECIAL_PATTERN = re.compile('[' + re.escape(MARKDOWN_SPECIAL_CHARS) + ']')
+_ESCAPE_TABLE = str.maketrans({char: '\\' + char for char in MARKDOWN_SPECIAL_CHARS})
+
+
+def regex_escape(text: str) -> str:
+    """Single pass with a compiled regex (without the line-start rules)"""
+    return _SPECIAL_PATTERN.sub(r'\\\g<0>', text)
+
+
+def translate_escape(text: str) -> str:
+    """Single pass with a str.translate table (without the line-start rules)"""
+    return text.translate(_ESCAPE_TABLE)
+
+
+# Functions timed by benchmark_escaping, by column name
+ESCAPE_FUNCTIONS = {
+    'legacy': legacy_escape,
+    'regex': regex_escape,
+    'translate': translate_escape,
+    'escape_markdown': escape_markdown,
+}
+
+
+def sample_text(length: int, special_ratio: float, seed: int = 0) -> str:
+    """
+    Build a text of about length characters
+
+    Args:
+        length: Number of characters
+        special_ratio: Share of words that carry a special character
+        seed: Random seed, so runs are comparable
+
+    Returns:
+        str: Words separated by spaces, some with specials such as (x) or well-known
+    """
+    rng = random.Random(seed)
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(_WORDS)
+        if rng.random() < special_ratio:
+            word = rng.choice(('({})', '*{}*', '{}-based', '[{}]', '{}_id', '<{}>', 'a|{}')).format(word)
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)[:length]
+
+
+def benchmark_escaping(number: int = 2000, repeat: int = 5) -> List[Dict]:
+    """
+    Time the escaping functions on the sample texts
+
+    Args:
+        number: Calls per timing
+        repeat: Timings per text (the best one is kept)
+
+    Returns:
+        List[Dict]: One result per text with the time per call of each function
+                    (see ESCAPE_FUNCTIONS) in microseconds
+    """
+    results = []
+    for special_ratio in (0.0, 0.05, 0.5):
+        for length in SAMPLE_LENGTHS:
+            text = sample_text(length, special_ratio)
+            timings = {}
+            for name, function in ESCAPE_FUNCTIONS.items():
+                best = min(timeit.repeat(lambda: function(text), number=number, repeat=repeat))
+                timings[name] = best / number * 1e6
+            results.append({"length": length, "special_ratio": special_ratio, **timings})
+    return results
+
+
+def main():
+    """CLI entry point for the escaping micro-benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark Markdown escaping')
+    parser.add_argument('-n', '--number', type=int, default=2000, help='Calls per timing')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Timings per text')
+    args = parser.parse_args()
+
+    print("Time per call in microseconds")
+    print(f"{'length':>7} {'specials':>8}" + "".join(f" {name:>15}" for name in ESCAPE_FUNCTIONS))
+    for result in benchmark_escaping(args.number, args.repeat):
+        print(f"{result['length']:>7} {result['special_ratio']:>8.2f}"
+              + "".join(f" {result[name]:>15.2f}" for name in ESCAPE_FUNCTIONS))
+
+
+if __name__ == "__main__":
+    main()
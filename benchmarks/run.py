@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+"""
+Benchmark runner.
+
+Times DocxParser.parse_document and MarkdownWriter.write_document separately
+on each corpus document, measures peak memory with tracemalloc in a separate
+pass (so tracing does not distort the timings) and saves the results as JSON.
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from src.parser import PARSER_ENGINES
+from src.writer import MarkdownWriter
+from .corpus import PRESETS, generate_corpus
+
+DEFAULT_CORPUS_DIR = os.path.join(tempfile.gettempdir(), 'docx_to_md_corpus')
+
+
+def _git_commit() -> Optional[str]:
+    """Get the current commit hash, if running inside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    """Summarize timing samples in seconds"""
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def _convert_once(path: str, engine: str, output_dir: str):
+    """
+    Parse and write a document once
+
+    Returns:
+        Tuple[float, float, Document]: Parse time, write time and the parsed document
+    """
+    parser = PARSER_ENGINES[engine]()
+    start = time.perf_counter()
+    document = parser.parse_document(path)
+    parsed = time.perf_counter()
+
+    writer = MarkdownWriter()
+    writer.write_document(document, os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0]))
+    written = time.perf_counter()
+
+    return parsed - start, written - parsed, document
+
+
+def _peak_memory(path: str, engine: str, output_dir: str) -> int:
+    """Measure the peak traced memory of one conversion in bytes"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _convert_once(path, engine, output_dir)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_document(path: str, engine: str = 'docx', repeat: int = 5) -> dict:
+    """
+    Benchmark the conversion of one document
+
+    Args:
+        path: Path to the DOCX file
+        engine: Parser engine to use
+        repeat: Number of timed conversions
+
+    Returns:
+        dict: Timings of parse and write, peak memory and document statistics
+    """
+    parse_times, write_times = [], []
+    with tempfile.TemporaryDirectory() as output_dir:
+        # Warm up imports and caches before measuring
+        _, _, document = _convert_once(path, engine, output_dir)
+        for _ in range(repeat):
+            gc.collect()
+            parse_time, write_time, _ = _convert_once(path, engine, output_dir)
+            parse_times.append(parse_time)
+            write_times.append(write_time)
+        peak_memory = _peak_memory(path, engine, output_dir)
+
+    return {
+        "document": os.path.basename(path),
+        "engine": engine,
+        "file_size": os.path.getsize(path),
+        "paragraphs": len(document.paragraphs),
+        "tables": len(document.get_tables()),
+        "images": len(document.get_images()),
+        "repeat": repeat,
+        "parse": _summary(parse_times),
+        "write": _summary(write_times),
+        "peak_memory": peak_memory,
+    }
+
+
+def run_benchmarks(paths: List[str], engines: List[str], repeat: int = 5) -> dict:
+    """
+    Benchmark several documents with several engines
+
+    Args:
+        paths: Paths to DOCX files
+        engines: Parser engines to use
+        repeat: Number of timed conversions per document
+
+    Returns:
+        dict: The report, with environment information and one result per document and engine
+    """
+    results = []
+    for path in paths:
+        for engine in engines:
+            result = benchmark_document(path, engine, repeat)
+            results.append(result)
+            print(_format_result(result), file=sys.stderr)
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def _format_result(result: dict) -> str:
+    """Format one result as a line of text"""
+    return (f"{result['document']:<20} {result['engine']:<7} "
+            f"parse {result['parse']['median'] * 1000:9.1f} ms  "
+            f"write {result['write']['median'] * 1000:9.1f} ms  "
+            f"peak {result['peak_memory'] / (1024 * 1024):7.1f} MiB")
+
+
+def compare_reports(baseline: dict, current: dict) -> List[str]:
+    """
+    Compare two reports document by document
+
+    Args:
+        baseline: An earlier report
+        current: The report to compare against it
+
+    Returns:
+        List[str]: One line per document and engine present in both reports
+    """
+    previous = {(result["document"], result["engine"]): result for result in baseline["results"]}
+    lines = [f"Baseline {baseline.get('commit')} -> current {current.get('commit')} "
+             f"(ratios < 1.00 are improvements)"]
+    for result in current["results"]:
+        old = previous.get((result["document"], result["engine"]))
+        if old is None:
+            continue
+        ratios = [
+            result[key]["median"] / old[key]["median"] if old[key]["median"] else float('nan')
+            for key in ("parse", "write")
+        ]
+        memory = result["peak_memory"] / old["peak_memory"] if old["peak_memory"] else float('nan')
+        lines.append(f"{result['document']:<20} {result['engine']:<7} "
+                     f"parse x{ratios[0]:.2f}  write x{ratios[1]:.2f}  peak x{memory:.2f}")
+    return lines
+
+
+def main():
+    """CLI entry point for the benchmark runner"""
+    parser = argparse.ArgumentParser(description='Benchmark DOCX parsing and Markdown writing')
+    parser.add_argument('documents', nargs='*',
+                        help='DOCX files to benchmark (default: the generated corpus)')
+    parser.add_argument('--corpus-dir', default=DEFAULT_CORPUS_DIR,
+                        help='Directory of the generated corpus (default: %(default)s)')
+    parser.add_argument('--preset', action='append', choices=sorted(PRESETS),
+                        help='Corpus preset to benchmark (repeatable, default: all)')
+    parser.add_argument('--engine', action='append', choices=sorted(PARSER_ENGINES),
+                        help='Parser engine to benchmark (repeatable, default: docx)')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='Timed runs per document')
+    parser.add_argument('-o', '--output', help='Save the report as JSON to this file')
+    parser.add_argument('--compare', help='Compare against a previously saved report')
+    args = parser.parse_args()
+
+    paths = args.documents or generate_corpus(args.corpus_dir, args.preset)
+    report = run_benchmarks(paths, args.engine or ['docx'], args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results saved to: {args.output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print('\n'.join(compare_reports(baseline, report)))
+
+
+if __name__ == "__main__":
+    main()
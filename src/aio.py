@@ -0,0 +1,212 @@
+"""
+asyncio interface for conversions.
+
+Parsing and rendering are CPU bound and take seconds on large files, so
+they run in an executor (threads or processes) and never on the event loop.
+A semaphore bounds how many conversions are in flight; all file I/O happens
+inside the executor as well.
+
+    async with AsyncConverter(concurrency=4, executor='process') as converter:
+        zip_path = await converter.convert('report.docx', 'out')
+
+Cancelling the awaiting task cancels a conversion that has not started yet.
+With threads, a running conversion also stops at its next block; a worker
+process finishes its current file and the result is dropped.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+from .batch import ConversionResult, collect_tasks, _convert_task
+from .cache import ConversionCache, DEFAULT_CACHE_SIZE
+from .main import convert_docx_to_markdown
+
+# Kinds of executor AsyncConverter can create itself
+EXECUTOR_KINDS = ('thread', 'process')
+
+
+def _convert_file(input_file: str, output_dir: Optional[str] = None, cache_dir: Optional[str] = None,
+                  cache_size: int = DEFAULT_CACHE_SIZE, **options) -> Any:
+    """
+    Convert one file inside the executor
+
+    Module-level so it can be sent to worker processes; the cache is opened
+    per call, like in batch conversion.
+    """
+    cache = ConversionCache(cache_dir, cache_size) if cache_dir else None
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    return convert_docx_to_markdown(input_file, output_dir, cache=cache, **options)
+
+
+class _TaskCancelEvent:
+    """Cancellation event of one task, also set while the caller's own event is"""
+
+    __slots__ = ('_event', '_caller_event')
+
+    def __init__(self, caller_event: Optional[threading.Event] = None):
+        self._event = threading.Event()
+        self._caller_event = caller_event
+
+    def set(self) -> None:
+        self._event.set()
+
+    def is_set(self) -> bool:
+        return self._event.is_set() or (self._caller_event is not None and self._caller_event.is_set())
+
+
+class AsyncConverter:
+    """
+    Runs conversions for an asyncio application with bounded concurrency.
+    """
+
+    def __init__(self, concurrency: Optional[int] = None, executor: Union[str, Executor] = 'thread',
+                 cache_dir: Optional[str] = None, cache_size: int = DEFAULT_CACHE_SIZE, **options):
+        """
+        Args:
+            concurrency: Maximum number of conversions in flight (default: CPU count)
+            executor: 'thread', 'process' or an existing Executor (which is not shut down)
+            cache_dir: Optional directory of a conversion cache
+            cache_size: Size limit of the cache directory in bytes
+            **options: Default conversion options (engine, output_format, ...)
+        """
+        if isinstance(executor, str) and executor not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor: {executor!r} (expected one of {', '.join(EXECUTOR_KINDS)})")
+
+        self.concurrency: int = max(1, concurrency or os.cpu_count() or 1)
+        self.cache_dir: Optional[str] = cache_dir
+        self.cache_size: int = cache_size
+        self.options: dict = options
+        self._executor_kind: Union[str, Executor] = executor
+        self._executor: Optional[Executor] = executor if isinstance(executor, Executor) else None
+        self._owns_executor: bool = self._executor is None
+        # Created in the running loop, since before Python 3.10 it binds to the loop current at creation
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def executor(self) -> Executor:
+        """The executor running the conversions (created on first use)"""
+        if self._executor is None:
+            if self._executor_kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.concurrency)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency,
+                                                    thread_name_prefix='docx-to-md')
+        return self._executor
+
+    async def convert(self, input_file: str, output_dir: Optional[str] = None, **options) -> Any:
+        """
+        Convert a DOCX file without blocking the event loop
+
+        Args:
+            input_file: Path to the input DOCX file
+            output_dir: Optional directory to save output files (default: same as input)
+            **options: Conversion options overriding the defaults (see convert_docx_to_markdown)
+
+        Returns:
+            The result of convert_docx_to_markdown (e.g. the path to the ZIP archive)
+        """
+        return await self._run(_convert_file, input_file, output_dir, cache_dir=self.cache_dir,
+                               cache_size=self.cache_size, **{**self.options, **options})
+
+    async def convert_many(self, inputs: Union[str, Iterable[str]], output_dir: Optional[str] = None,
+                           recursive: bool = False) -> List[ConversionResult]:
+        """
+        Convert many DOCX files concurrently, capturing errors per file
+
+        Args:
+            inputs: A path or a list of paths to DOCX files and/or directories
+            output_dir: Root directory for the output (default: next to each input)
+            recursive: Whether to descend into subdirectories of input directories
+
+        Returns:
+            List[ConversionResult]: One result per file, in the order the files were found
+        """
+        loop = asyncio.get_running_loop()
+        # Walking directories is file I/O too
+        tasks = await loop.run_in_executor(None, collect_tasks, inputs, output_dir, recursive)
+        return list(await asyncio.gather(*(
+            self._run(_convert_task, task, cache_dir=self.cache_dir, cache_size=self.cache_size, **self.options)
+            for task in tasks
+        )))
+
+    async def _run(self, function: Callable, *args, **kwargs) -> Any:
+        """Run a conversion function in the executor once a slot is free"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            executor = self.executor
+            cancel_event = None
+            if isinstance(executor, ThreadPoolExecutor):
+                # Threads cannot be interrupted, but the conversion checks this between blocks;
+                # an event passed by the caller still stops it too
+                cancel_event = kwargs['cancel_event'] = _TaskCancelEvent(kwargs.get('cancel_event'))
+
+            future = asyncio.get_running_loop().run_in_executor(executor, partial(function, *args, **kwargs))
+            try:
+                return await future
+            except asyncio.CancelledError:
+                if cancel_event is not None:
+                    cancel_event.set()
+                raise
+
+    async def aclose(self) -> None:
+        """Shut down the executor if the converter created it"""
+        if self._owns_executor and self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self) -> 'AsyncConverter':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+
+async def convert_docx_to_markdown_async(input_file: str, output_dir: Optional[str] = None,
+                                         executor: Union[str, Executor] = 'thread', **options) -> Any:
+    """
+    Convert a DOCX file to Markdown without blocking the event loop
+
+    For many conversions, keep one AsyncConverter instead, so the executor
+    and the concurrency limit are shared.
+
+    Args:
+        input_file: Path to the input DOCX file
+        output_dir: Optional directory to save output files (default: same as input)
+        executor: 'thread', 'process' or an existing Executor
+        **options: Conversion options (see convert_docx_to_markdown)
+
+    Returns:
+        The result of convert_docx_to_markdown (e.g. the path to the ZIP archive)
+    """
+    async with AsyncConverter(1, executor) as converter:
+        return await converter.convert(input_file, output_dir, **options)
+
+
+async def convert_batch_async(inputs: Union[str, Iterable[str]], output_dir: Optional[str] = None,
+                              recursive: bool = False, concurrency: Optional[int] = None,
+                              executor: Union[str, Executor] = 'thread',
+                              cache_dir: Optional[str] = None, cache_size: int = DEFAULT_CACHE_SIZE,
+                              **options) -> List[ConversionResult]:
+    """
+    Convert many DOCX files without blocking the event loop
+
+    Args:
+        inputs: A path or a list of paths to DOCX files and/or directories
+        output_dir: Root directory for the output (default: next to each input)
+        recursive: Whether to descend into subdirectories of input directories
+        concurrency: Maximum number of conversions in flight (default: CPU count)
+        executor: 'thread', 'process' or an existing Executor
+        cache_dir: Optional directory of a conversion cache
+        cache_size: Size limit of the cache directory in bytes
+        **options: Conversion options (engine, output_format, ...)
+
+    Returns:
+        List[ConversionResult]: One result per file, in the order the files were found
+    """
+    async with AsyncConverter(concurrency, executor, cache_dir, cache_size, **options) as converter:
+        return await converter.convert_many(inputs, output_dir, recursive)
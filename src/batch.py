@@ -0,0 +1,181 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, List, Optional, Tuple, Union
+
+from . import tracing
+from .cache import ConversionCache, DEFAULT_CACHE_SIZE
+from .main import convert_docx_to_markdown
+from .memory import limit_process_memory
+
+
+class ConversionResult:
+    """
+    Outcome of converting a single file in a batch.
+    """
+
+    def __init__(self, input_file: str, output_path: str = "", error: str = "", elapsed: float = 0.0,
+                 cache_hit: Optional[bool] = None):
+        self.input_file: str = input_file      # Path to the source DOCX file
+        self.output_path: str = output_path    # Path to the generated output ("" on failure)
+        self.error: str = error                # Error message ("" on success)
+        self.elapsed: float = elapsed          # Wall time spent on the file, in seconds
+        self.cache_hit: Optional[bool] = cache_hit  # Whether the output came from the cache (None without a cache)
+
+    @property
+    def success(self) -> bool:
+        """Check if the file was converted without errors"""
+        return not self.error
+
+    def to_dict(self) -> dict:
+        """Return the result as a plain dictionary (e.g. for JSON reports)"""
+        return {
+            "input_file": self.input_file,
+            "output_path": self.output_path,
+            "success": self.success,
+            "error": self.error,
+            "elapsed": self.elapsed,
+            "cache_hit": self.cache_hit,
+        }
+
+    def __repr__(self) -> str:
+        status = "ok" if self.success else f"error={self.error!r}"
+        return f"ConversionResult({self.input_file!r}, {status}, {self.elapsed:.3f}s)"
+
+
+def _is_docx(file_name: str) -> bool:
+    """Check if a file name looks like a convertible DOCX file (skipping Word lock files)"""
+    return file_name.lower().endswith('.docx') and not file_name.startswith('~$')
+
+
+def collect_tasks(inputs: Union[str, Iterable[str]], output_dir: Optional[str] = None,
+                  recursive: bool = False) -> List[Tuple[str, Optional[str]]]:
+    """
+    Expand input files and directories into (input_file, output_dir) pairs
+
+    Files found inside an input directory keep their relative location under
+    output_dir, so the source tree is mirrored in the output.
+
+    Args:
+        inputs: A path or a list of paths to DOCX files and/or directories
+        output_dir: Root directory for the output (default: next to each input)
+        recursive: Whether to descend into subdirectories
+
+    Returns:
+        List[Tuple[str, Optional[str]]]: Conversion tasks in a stable order
+    """
+    if isinstance(inputs, str):
+        inputs = [inputs]
+
+    tasks = []
+    for input_path in inputs:
+        if not os.path.isdir(input_path):
+            tasks.append((input_path, output_dir))
+            continue
+
+        for root, dirs, files in os.walk(input_path):
+            dirs.sort()
+            if not recursive:
+                dirs.clear()
+
+            target_dir = None
+            if output_dir is not None:
+                rel_dir = os.path.relpath(root, input_path)
+                target_dir = os.path.normpath(os.path.join(output_dir, rel_dir))
+
+            for file_name in sorted(files):
+                if _is_docx(file_name):
+                    tasks.append((os.path.join(root, file_name), target_dir))
+
+    return tasks
+
+
+def _convert_task(task: Tuple[str, Optional[str]], cache_dir: Optional[str] = None,
+                  cache_size: int = DEFAULT_CACHE_SIZE, trace_file: Optional[str] = None,
+                  **options) -> ConversionResult:
+    """
+    Convert one file, capturing any error instead of raising it
+
+    Runs inside the worker processes, so it must stay a module-level function.
+    The cache is opened per task; entries are shared between processes on disk.
+    """
+    input_file, output_dir = task
+    if trace_file and not tracing.is_enabled():
+        # Each worker appends its spans to the shared trace file
+        tracing.enable(tracing.JsonLinesExporter(trace_file))
+    cache = ConversionCache(cache_dir, cache_size) if cache_dir else None
+    start = time.perf_counter()
+    try:
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+        output_path = convert_docx_to_markdown(input_file, output_dir, cache=cache, **options)
+        return ConversionResult(input_file, output_path=output_path,
+                                elapsed=time.perf_counter() - start,
+                                cache_hit=cache.hits > 0 if cache else None)
+    except Exception as e:
+        return ConversionResult(input_file, error=f"{type(e).__name__}: {e}",
+                                elapsed=time.perf_counter() - start)
+
+
+def convert_batch(inputs: Union[str, Iterable[str]], output_dir: Optional[str] = None,
+                  recursive: bool = False, jobs: Optional[int] = None,
+                  cache_dir: Optional[str] = None, cache_size: int = DEFAULT_CACHE_SIZE,
+                  trace_file: Optional[str] = None, **options) -> List[ConversionResult]:
+    """
+    Convert many DOCX files, fanning the work out over a process pool
+
+    Args:
+        inputs: A path or a list of paths to DOCX files and/or directories
+        output_dir: Root directory for the output (default: next to each input)
+        recursive: Whether to descend into subdirectories of input directories
+        jobs: Number of worker processes (default: number of CPUs, 1 runs in-process)
+        cache_dir: Optional directory of a conversion cache shared by all workers
+        cache_size: Size limit of the cache directory in bytes
+        trace_file: Optional file that every worker appends its tracing spans to (JSON lines)
+        **options: Conversion options passed to convert_docx_to_markdown (engine, output_format, ...)
+
+    Returns:
+        List[ConversionResult]: One result per file, in the order the files were found
+    """
+    tasks = collect_tasks(inputs, output_dir, recursive)
+    return convert_tasks(tasks, jobs, cache_dir=cache_dir, cache_size=cache_size, trace_file=trace_file,
+                         **options)
+
+
+def convert_tasks(tasks: List[Tuple[str, Optional[str]]], jobs: Optional[int] = None,
+                  cache_dir: Optional[str] = None, cache_size: int = DEFAULT_CACHE_SIZE,
+                  trace_file: Optional[str] = None, **options) -> List[ConversionResult]:
+    """
+    Convert (input_file, output_dir) pairs, fanning the work out over a process pool
+
+    Args:
+        tasks: Conversion tasks, e.g. from collect_tasks()
+        jobs: Number of worker processes (default: number of CPUs, 1 runs in-process)
+        cache_dir: Optional directory of a conversion cache shared by all workers
+        cache_size: Size limit of the cache directory in bytes
+        trace_file: Optional file that every worker appends its tracing spans to (JSON lines)
+        **options: Conversion options passed to convert_docx_to_markdown (engine, output_format, ...)
+
+    Returns:
+        List[ConversionResult]: One result per task, in order
+    """
+    if not tasks:
+        return []
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(tasks)))
+
+    convert_task = partial(_convert_task, cache_dir=cache_dir, cache_size=cache_size,
+                           trace_file=trace_file, **options)
+    if jobs == 1:
+        return [convert_task(task) for task in tasks]
+
+    # Hand out work in chunks to keep IPC overhead low on very large batches
+    chunksize = max(1, len(tasks) // (jobs * 8))
+    # Workers with a memory budget fail with MemoryError instead of being killed
+    max_memory = options.get('max_memory')
+    initializer, initargs = (limit_process_memory, (max_memory,)) if max_memory else (None, ())
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as executor:
+        return list(executor.map(convert_task, tasks, chunksize=chunksize))
@@ -0,0 +1,212 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+import zipfile
+from typing import Any, Optional
+
+from .models import Image
+from .writer import OutputSink, ZipSink
+from .writer.archive import MediaSources
+
+# Bump whenever a change affects the produced Markdown or media
+CONVERTER_VERSION = "7"
+
+# Default size limit of the cache directory
+DEFAULT_CACHE_SIZE = 1024 * 1024 * 1024
+
+# Eviction scans the whole cache, so it runs at most this often (in seconds)
+_EVICTION_INTERVAL = 60
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def default_cache_dir() -> str:
+    """Get the default cache directory (DOCX2MD_CACHE_DIR or ~/.cache/docx_to_md)"""
+    return os.environ.get('DOCX2MD_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'docx_to_md')
+
+
+class ConversionCache:
+    """
+    Content-addressed on-disk cache of conversion results.
+
+    Entries are keyed by a hash of the input bytes, the converter version and
+    the options that influence the output. Each entry is the ZIP archive of a
+    conversion (Markdown and media), which can be replayed into any output sink.
+    Least recently used entries are evicted once the cache exceeds max_size.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_CACHE_SIZE):
+        self.cache_dir: str = cache_dir
+        self.max_size: int = max_size
+        self.hits: int = 0      # Lookups answered from the cache
+        self.misses: int = 0    # Lookups that required a conversion
+
+    def make_key(self, input_file: str, **options: Any) -> str:
+        """
+        Compute the cache key of a conversion
+
+        Args:
+            input_file: Path to the input DOCX file
+            **options: Options that influence the output (engine, document name, ...)
+
+        Returns:
+            str: Hex digest identifying the conversion
+        """
+        digest = hashlib.sha256()
+        digest.update(f"docx_to_md/{CONVERTER_VERSION}\0".encode('utf-8'))
+        digest.update(json.dumps(options, sort_keys=True).encode('utf-8'))
+        digest.update(b'\0')
+        with open(input_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        """Get the archive path of a cache entry"""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.zip")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cache entry and record the hit or miss
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Optional[str]: Path to the cached archive, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            # Refresh the access time used for LRU eviction
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return path
+
+    def open_entry(self) -> ZipSink:
+        """
+        Create a sink that records a conversion for the cache
+
+        Returns:
+            ZipSink: Sink writing to a temporary file; pass it to commit() or discard()
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix='.entry-', suffix='.tmp', dir=self.cache_dir)
+        os.close(fd)
+        return ZipSink(temp_path)
+
+    def commit(self, key: str, sink: ZipSink) -> None:
+        """
+        Store a recorded conversion under its key
+
+        Args:
+            key: Cache key from make_key()
+            sink: Closed sink returned by open_entry()
+        """
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Atomic, so concurrent readers never see a partial entry
+        os.replace(sink.target, path)
+        self._maybe_evict()
+
+    def discard(self, sink: ZipSink) -> None:
+        """
+        Drop a recorded conversion (e.g. after an error)
+
+        Args:
+            sink: Sink returned by open_entry()
+        """
+        try:
+            sink.archive.close()
+        except Exception:
+            pass
+        try:
+            os.remove(sink.target)
+        except OSError:
+            pass
+
+    def _maybe_evict(self) -> None:
+        """Run eviction unless it already ran recently (possibly in another process)"""
+        marker = os.path.join(self.cache_dir, '.last-eviction')
+        try:
+            if time.time() - os.path.getmtime(marker) < _EVICTION_INTERVAL:
+                return
+        except OSError:
+            pass
+
+        with open(marker, 'a'):
+            pass
+        os.utime(marker)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits into max_size
+        """
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for file_name in files:
+                if not file_name.endswith('.zip'):
+                    continue
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # Removed concurrently
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+
+
+def replay_archive(archive_path: str, sink: OutputSink) -> Any:
+    """
+    Write a cached conversion archive into an output sink
+
+    The Markdown entry is streamed into the sink and the media entries are
+    handed over as images backed by the archive, so zip sinks copy them raw.
+    The archive is opened once before anything is written and stays open, so
+    an entry evicted meanwhile either fails up front or replays completely.
+
+    Args:
+        archive_path: Path to a cached archive
+        sink: Destination for the output
+
+    Returns:
+        The sink's result
+
+    Raises:
+        FileNotFoundError, zipfile.BadZipFile: If the entry is gone or damaged; nothing was written then
+    """
+    with zipfile.ZipFile(archive_path) as archive, MediaSources() as sources:
+        sources.add(archive_path, archive)
+        for info in archive.infolist():
+            if info.filename.endswith('.md') and '/' not in info.filename:
+                with archive.open(info) as entry, sink.open_markdown(info.filename) as stream:
+                    reader = io.TextIOWrapper(entry, encoding='utf-8')
+                    for chunk in iter(lambda: reader.read(_HASH_CHUNK_SIZE), ''):
+                        stream.write(chunk)
+            else:
+                image = Image()
+                image.source_file = archive_path
+                image.source_member = info.filename
+                image.new_file_name = info.filename.rsplit('/', 1)[-1]
+                sink.add_image(image, info.filename, sources)
+
+    return sink.close()
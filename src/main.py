@@ -1,63 +1,308 @@
 #!/usr/bin/env python
+import contextlib
 import os
 import argparse
 import sys
-from typing import Optional
+import threading
+import zipfile
+from typing import Any, List, Optional
 
-from .parser import DocxParser
-from .writer import MarkdownWriter
+from . import tracing
+from .parser import PARSER_ENGINES
+from .writer import (
+    MarkdownWriter, OutputSink, DirectorySink, ZipSink, CompositeSink, CheckedSink, CancellableSink,
+    create_stream_sink, create_stdout_sink,
+)
+from .cache import ConversionCache, DEFAULT_CACHE_SIZE, default_cache_dir, replay_archive
+from .memory import MemoryBudget, limit_process_memory
+from .parallel import write_document_parallel
 
+# Output formats: 'both' writes the .md file, media folder and ZIP archive;
+# the others write a single kind of output
+OUTPUT_FORMATS = ('both', 'zip', 'dir', 'tar', 'md')
 
-def convert_docx_to_markdown(input_file: str, output_dir: Optional[str] = None) -> str:
+
+def convert_docx_to_markdown(input_file: str, output_dir: Optional[str] = None,
+                             engine: str = 'docx', output_format: str = 'both',
+                             sink: Optional[OutputSink] = None,
+                             cache: Optional[ConversionCache] = None,
+                             sized_images: bool = False, align_tables: bool = False,
+                             cancel_event: Optional[threading.Event] = None,
+                             max_memory: Optional[int] = None, render_jobs: Optional[int] = None) -> Any:
     """
     Convert a DOCX file to Markdown format
     
     Args:
         input_file: Path to the input DOCX file
         output_dir: Optional directory to save output files (default: same as input)
+        engine: Parser engine to use ('docx' for python-docx, 'stream' for the streaming parser)
+        output_format: One of OUTPUT_FORMATS; 'zip', 'tar' and 'md' produce a single file,
+                       'dir' only the .md file and media folder
+        sink: Optional output sink to write to instead (e.g. BytesSink); overrides output_format
+        cache: Optional conversion cache; on a hit the cached output is reused without parsing
+        sized_images: Whether to add the picture size to image references
+        align_tables: Whether to pad table cells so the columns line up
+        cancel_event: Optional event that stops the conversion (with ConversionCancelled)
+                      once set, e.g. from another thread
+        max_memory: Optional memory budget of the process in bytes; a conversion that
+                    would exceed it fails with MemoryBudgetExceeded
+        render_jobs: Number of worker processes that parse and render the document in
+                     chunks (stream engine only; default: a single process)
         
     Returns:
-        str: Path to the generated ZIP archive
+        str: Path to the generated ZIP archive (or to the output of the chosen format),
+        or the sink's result when a sink is given
     """
+    if render_jobs is not None and render_jobs > 1 and engine != 'stream':
+        raise ValueError("Parallel rendering needs the stream engine")
+    
     # Get output directory
     if output_dir is None:
         output_dir = os.path.dirname(os.path.abspath(input_file))
     
-    # Create parser and writer
-    parser = DocxParser()
-    writer = MarkdownWriter()
+    doc_name = os.path.splitext(os.path.basename(input_file))[0]
+    output_path = os.path.join(output_dir, doc_name)
+    if sink is None:
+        sink = _create_sink(output_format, output_dir, output_path)
+    if cancel_event is not None:
+        sink = CancellableSink(sink, cancel_event)
+    budget = MemoryBudget(max_memory) if max_memory else None
+    if budget is not None:
+        sink = CheckedSink(sink, budget.check)
+    
+    writer = MarkdownWriter(sized_images=sized_images, align_tables=align_tables)
+    if cache is None:
+        return _convert(input_file, output_path, engine, writer, sink, budget, render_jobs)
     
-    # Parse document
-    document = parser.parse_document(input_file)
+    # Reuse a previous conversion of the same input
+    key = cache.make_key(input_file, engine=engine, doc_name=doc_name, sized_images=sized_images,
+                         align_tables=align_tables)
+    cached_path = cache.get(key)
+    if cached_path is not None:
+        try:
+            return replay_archive(cached_path, sink)
+        except (FileNotFoundError, zipfile.BadZipFile):
+            # Evicted by another process since the lookup; nothing was written yet
+            cache.hits -= 1
+            cache.misses += 1
     
-    # Write markdown file
-    output_path = os.path.join(output_dir, os.path.splitext(os.path.basename(input_file))[0])
-    zip_path = writer.write_document(document, output_path)
+    # Record the output for the cache while writing it
+    cache_sink = cache.open_entry()
+    try:
+        result = _convert(input_file, output_path, engine, writer, CompositeSink(sink, cache_sink, primary=0),
+                          budget, render_jobs)
+    except Exception:
+        cache.discard(cache_sink)
+        raise
+    cache.commit(key, cache_sink)
+    
+    return result
+
+
+def _convert(input_file: str, output_path: str, engine: str, writer: MarkdownWriter,
+             sink: OutputSink, budget: Optional[MemoryBudget] = None, render_jobs: Optional[int] = None) -> Any:
+    """
+    Parse a DOCX file and write it into a sink
     
-    return zip_path
+    Args:
+        input_file: Path to the input DOCX file
+        output_path: Output path without extension (names the .md file and media folder)
+        engine: Parser engine to use
+        writer: Writer producing the Markdown
+        sink: Destination for the output
+        budget: Optional memory budget, checked before parsing
+        render_jobs: Number of worker processes that parse and render the document
+        
+    Returns:
+        The sink's result
+    """
+    with tracing.span('convert') as stage, budget or contextlib.nullcontext():
+        stage.set('file', input_file)
+        if budget is not None:
+            budget.check_input(input_file, engine)
+        
+        if render_jobs is not None and render_jobs > 1:
+            return write_document_parallel(input_file, output_path, sink, writer, render_jobs)
+        
+        # Create parser
+        parser = PARSER_ENGINES[engine]()
+        
+        # Parse document lazily: each block is parsed as the writer renders it
+        document = parser.parse_document(input_file, lazy=True)
+        
+        # Write markdown file
+        try:
+            return writer.write_document(document, output_path, sink)
+        finally:
+            document.paragraphs.close()
+
+
+def _create_sink(output_format: str, output_dir: str, output_path: str) -> OutputSink:
+    """
+    Create the output sink for an output format
+    
+    Args:
+        output_format: One of OUTPUT_FORMATS
+        output_dir: Directory to save output files
+        output_path: Output path without extension
+        
+    Returns:
+        OutputSink: The sink writing the requested output
+    """
+    if output_format == 'dir':
+        return DirectorySink(output_dir)
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format!r}")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    if output_format == 'both':
+        return CompositeSink(DirectorySink(output_dir), ZipSink(f"{output_path}.zip"), primary=1)
+    return create_stream_sink(f"{output_path}.{output_format}", output_format)
+
+
+def _output_files(output_format: str, output_dir: str, output_path: str) -> List[str]:
+    """
+    List the paths a conversion in an output format writes
+    
+    Args:
+        output_format: One of OUTPUT_FORMATS
+        output_dir: Directory to save output files
+        output_path: Output path without extension
+        
+    Returns:
+        List[str]: The output files and the media folder (which may not exist)
+    """
+    if output_format in ('both', 'dir'):
+        media_folder = os.path.join(output_dir, f"{os.path.basename(output_path)}_media")
+        files = [f"{output_path}.md", media_folder]
+        return files + [f"{output_path}.zip"] if output_format == 'both' else files
+    return [f"{output_path}.{output_format}"]
+
+
+def _add_conversion_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options shared by the conversion commands (engine, format, cache, ...)"""
+    parser.add_argument('--engine', choices=sorted(PARSER_ENGINES), default='docx',
+                        help='Parser engine: python-docx object model or streaming XML parser')
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='both',
+                        help="Output to produce: .md file, media folder and ZIP archive ('both'), "
+                             "or only a ZIP, a directory, a tar or the Markdown text")
+    parser.add_argument('--cache-dir', default=default_cache_dir(),
+                        help='Directory of the conversion cache (default: %(default)s)')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+                        help='Size limit of the conversion cache in MiB (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always convert, without reading or filling the cache')
+    parser.add_argument('--image-sizes', action='store_true',
+                        help='Add the picture size to image references ({width=..px height=..px})')
+    parser.add_argument('--align-tables', action='store_true',
+                        help='Pad table cells so the columns line up in the Markdown source')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='Append timing spans of each conversion stage to FILE as JSON lines')
+    parser.add_argument('--max-memory', type=int, metavar='MIB',
+                        help='Memory budget of each converting process in MiB; conversions that would '
+                             'exceed it fail with an error (best with --engine stream)')
 
 
 def main():
-    """CLI entry point for the converter"""
+    """CLI entry point for the converter ('serve' and 'watch' as first argument run those modes)"""
+    from .batch import convert_batch
+
+    if sys.argv[1:2] == ['serve']:
+        from .server import main as serve
+        serve(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ['watch']:
+        from .watch import main as watch
+        watch(sys.argv[2:])
+        return
+
     # Create argument parser
-    parser = argparse.ArgumentParser(description='Convert DOCX files to Markdown format')
-    parser.add_argument('input', help='Path to the input DOCX file')
-    parser.add_argument('-o', '--output', help='Directory to save output files')
+    parser = argparse.ArgumentParser(description='Convert DOCX files to Markdown format',
+                                     epilog="Run 'main.py serve --help' for the HTTP conversion service "
+                                            "and 'main.py watch --help' for the watch-folder mode")
+    parser.add_argument('input', nargs='+', help='Path to the input DOCX file(s) or directories')
+    parser.add_argument('-o', '--output', help="Directory to save output files ('-' streams to stdout)")
+    parser.add_argument('-r', '--recursive', action='store_true',
+                        help='Descend into subdirectories of input directories')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of worker processes for batch conversion (default: CPU count)')
+    parser.add_argument('--render-jobs', type=int, default=None, metavar='N',
+                        help='Parse and render a single input file in N worker processes '
+                             '(needs --engine stream; pays off for large documents)')
+    _add_conversion_arguments(parser)
     
     # Parse arguments
     args = parser.parse_args()
     
-    # Validate input file
-    if not os.path.isfile(args.input):
-        print(f"Error: Input file '{args.input}' does not exist", file=sys.stderr)
-        sys.exit(1)
+    if args.render_jobs is not None and args.render_jobs > 1 and args.engine != 'stream':
+        parser.error('--render-jobs needs --engine stream')
     
-    # Convert document
-    try:
-        output_path = convert_docx_to_markdown(args.input, args.output)
-        print(f"Conversion successful! Output saved to: {output_path}")
-    except Exception as e:
-        print(f"Error during conversion: {str(e)}", file=sys.stderr)
+    # Validate inputs
+    for input_path in args.input:
+        if not os.path.exists(input_path):
+            print(f"Error: Input file '{input_path}' does not exist", file=sys.stderr)
+            sys.exit(1)
+    
+    cache_dir = None if args.no_cache else args.cache_dir
+    cache_size = args.cache_size * 1024 * 1024
+    cache = ConversionCache(cache_dir, cache_size) if cache_dir else None
+    
+    if args.trace:
+        tracing.enable(tracing.JsonLinesExporter(args.trace))
+    
+    max_memory = args.max_memory * 1024 * 1024 if args.max_memory else None
+    if max_memory:
+        limit_process_memory(max_memory)
+    
+    # Stream a single document to stdout
+    if args.output == '-':
+        if len(args.input) != 1 or not os.path.isfile(args.input[0]):
+            print("Error: Only a single input file can be written to stdout", file=sys.stderr)
+            sys.exit(1)
+        output_format = 'zip' if args.format in ('both', 'dir') else args.format
+        try:
+            convert_docx_to_markdown(args.input[0], engine=args.engine,
+                                     sink=create_stdout_sink(output_format), cache=cache,
+                                     sized_images=args.image_sizes, align_tables=args.align_tables,
+                                     max_memory=max_memory, render_jobs=args.render_jobs)
+        except Exception as e:
+            print(f"Error during conversion: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
+    # Convert a single document
+    if len(args.input) == 1 and os.path.isfile(args.input[0]):
+        try:
+            output_path = convert_docx_to_markdown(args.input[0], args.output, engine=args.engine,
+                                                   output_format=args.format, cache=cache,
+                                                   sized_images=args.image_sizes,
+                                                   align_tables=args.align_tables, max_memory=max_memory,
+                                                   render_jobs=args.render_jobs)
+            cached = " (from cache)" if cache is not None and cache.hits else ""
+            print(f"Conversion successful{cached}! Output saved to: {output_path}")
+        except Exception as e:
+            print(f"Error during conversion: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
+    # Convert a batch of documents
+    results = convert_batch(args.input, args.output, recursive=args.recursive, jobs=args.jobs,
+                            cache_dir=cache_dir, cache_size=cache_size, trace_file=args.trace,
+                            engine=args.engine, output_format=args.format,
+                            sized_images=args.image_sizes, align_tables=args.align_tables,
+                            max_memory=max_memory)
+    failed = [result for result in results if not result.success]
+    for result in results:
+        if result.success:
+            print(f"{result.input_file} -> {result.output_path} ({result.elapsed:.2f}s)")
+        else:
+            print(f"{result.input_file}: {result.error}", file=sys.stderr)
+    
+    print(f"Converted {len(results) - len(failed)} of {len(results)} files")
+    if cache_dir:
+        hits = sum(1 for result in results if result.cache_hit)
+        print(f"Cache: {hits} hits, {len(results) - hits} misses")
+    if failed:
         sys.exit(1)
 
 
@@ -0,0 +1,196 @@
+"""
+Memory budget for conversions of very large documents.
+
+    python -m src.main scans.docx --engine stream --max-memory 512
+
+A budget is enforced in three ways:
+
+- before parsing, the memory the conversion needs is estimated from the
+  package directory (the python-docx engine loads every part and builds
+  large XML trees; the stream engine only parses styles and numbering) and
+  the conversion fails at once if it would not fit;
+- while writing, the resident size of the process is checked every few
+  blocks, so a conversion that grows anyway stops with an error instead of
+  being killed;
+- the CLI and batch workers also cap their data segment (RLIMIT_DATA), so
+  an allocation beyond the budget raises MemoryError instead of invoking
+  the OOM killer.
+
+Images are never held in memory: they stay handles into the source package
+and are copied into the output in chunks. The budget covers the whole
+process, so conversions running in threads of one process share it.
+"""
+import sys
+import zipfile
+from typing import BinaryIO, Optional, Union
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Parsed XML takes about this many times the size of its text (lxml trees,
+# python-docx proxies), measured on the benchmark corpus
+XML_TREE_FACTOR = 12
+
+# Memory the stream engine needs on top of the parts it parses whole
+# (iterparse buffers, the current block, lazily imported modules)
+STREAM_OVERHEAD = 8 * 1024 * 1024
+
+# Blocks written between two checks of the resident size
+CHECK_INTERVAL = 16
+
+_DOCUMENT_PART = 'word/document.xml'
+
+# Parts that both engines parse whole; the stream engine only reads these
+# and the relationships
+_SMALL_PARTS = ('[Content_Types].xml', 'word/styles.xml', 'word/numbering.xml')
+
+_MIB = 1024 * 1024
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """Raised when a conversion does not fit into its memory budget"""
+
+
+def current_memory() -> Optional[int]:
+    """
+    Get the resident size of this process
+
+    Returns:
+        Optional[int]: Bytes in use (the peak where the current size is unknown),
+        or None if the platform reports neither
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def estimate_memory(input_file: Union[str, BinaryIO], engine: str = 'docx') -> int:
+    """
+    Estimate the memory a conversion needs beyond the interpreter itself
+
+    Args:
+        input_file: Path to the DOCX file (or a seekable binary stream)
+        engine: Parser engine that will be used
+
+    Returns:
+        int: Estimated bytes
+    """
+    with zipfile.ZipFile(input_file) as package:
+        sizes = {info.filename: info.file_size for info in package.infolist()}
+    parsed = sum(size for name, size in sizes.items() if name in _SMALL_PARTS or name.endswith('.rels'))
+
+    if engine == 'stream':
+        # The document part is streamed and images stay in the package
+        return STREAM_OVERHEAD + XML_TREE_FACTOR * parsed
+
+    # python-docx reads every part into memory and keeps the document tree
+    return sum(sizes.values()) + XML_TREE_FACTOR * (parsed + sizes.get(_DOCUMENT_PART, 0))
+
+
+def limit_process_memory(limit: int) -> bool:
+    """
+    Cap the data segment of the current process
+
+    Allocations beyond the cap raise MemoryError instead of letting the
+    system kill the process. Meant for processes that only convert (the CLI,
+    batch workers); a lower existing cap is kept.
+
+    Args:
+        limit: Cap in bytes
+
+    Returns:
+        bool: True if the cap was set
+    """
+    if resource is None or not hasattr(resource, 'RLIMIT_DATA'):
+        return False
+    soft, hard = resource.getrlimit(resource.RLIMIT_DATA)
+    if soft != resource.RLIM_INFINITY and soft <= limit:
+        return False
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_DATA, (limit, hard))
+    except (ValueError, OSError):
+        return False
+    return True
+
+
+class MemoryBudget:
+    """
+    Memory limit of the process running a conversion.
+    Use as a context manager around the conversion, so running out of
+    memory is reported as MemoryBudgetExceeded.
+    """
+
+    def __init__(self, limit: int, check_interval: int = CHECK_INTERVAL):
+        """
+        Args:
+            limit: Largest resident size of the process in bytes
+            check_interval: Blocks written between two checks of the resident size
+        """
+        self.limit: int = limit
+        self.check_interval: int = max(1, check_interval)
+        self._calls: int = 0
+
+    def check_input(self, input_file: Union[str, BinaryIO], engine: str = 'docx') -> None:
+        """
+        Fail before parsing if a conversion would not fit into the budget
+
+        Args:
+            input_file: Path to the DOCX file (or a seekable binary stream)
+            engine: Parser engine that will be used
+
+        Raises:
+            MemoryBudgetExceeded: With the estimate and, for the docx engine,
+            whether the stream engine would fit
+        """
+        in_use = current_memory() or 0
+        needed = estimate_memory(input_file, engine)
+        if in_use + needed <= self.limit:
+            return
+
+        name = input_file if isinstance(input_file, str) else getattr(input_file, 'name', 'document')
+        message = (f"{name} needs about {needed // _MIB} MiB with the {engine} engine, "
+                   f"but only {max(0, self.limit - in_use) // _MIB} MiB of the "
+                   f"{self.limit // _MIB} MiB budget are free")
+        if engine != 'stream':
+            stream_needed = estimate_memory(input_file, 'stream')
+            if in_use + stream_needed <= self.limit:
+                message += f"; the stream engine needs about {stream_needed // _MIB} MiB (--engine stream)"
+        raise MemoryBudgetExceeded(message)
+
+    def check(self) -> None:
+        """
+        Fail if the process has grown beyond the budget
+
+        Cheap enough to call for every written block: the resident size is
+        only read every check_interval calls.
+
+        Raises:
+            MemoryBudgetExceeded: If the resident size exceeds the limit
+        """
+        self._calls += 1
+        if (self._calls - 1) % self.check_interval:
+            return
+        in_use = current_memory()
+        if in_use is not None and in_use > self.limit:
+            raise MemoryBudgetExceeded(f"Conversion stopped at {in_use // _MIB} MiB, "
+                                       f"over the budget of {self.limit // _MIB} MiB")
+
+    def __enter__(self) -> 'MemoryBudget':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # A failed allocation (e.g. at the RLIMIT_DATA cap) has no message of its own
+        if exc_type is not None and issubclass(exc_type, MemoryError) \
+                and not issubclass(exc_type, MemoryBudgetExceeded):
+            raise MemoryBudgetExceeded(f"Ran out of memory within the budget of {self.limit // _MIB} MiB") from exc
@@ -2,5 +2,6 @@ from .document import Document
 from .paragraph import Paragraph
 from .image import Image
 from .table import Table
+from .run import Run, RunList
 
-__all__ = ['Document', 'Paragraph', 'Image', 'Table'] 
\ No newline at end of file
+__all__ = ['Document', 'Paragraph', 'Image', 'Table', 'Run', 'RunList'] 
\ No newline at end of file
@@ -1,34 +1,105 @@
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from .paragraph import Paragraph
 
 class Document:
     """
     Represents a document containing paragraphs, images, and tables.
     Acts as a container for the document structure.
+
+    A lazy document (see Document.lazy) does not hold its paragraphs: they
+    are produced by the parser while the writer consumes them, so only one
+    block is in memory at a time. Its paragraphs can be iterated only once.
     """
-    
+
     def __init__(self):
-        self.paragraphs: List[Paragraph] = []
+        self.paragraphs: Iterable[Paragraph] = []
         self.title: str = ""
         self.filename: str = ""
         self.image_count: int = 0
-        
+
+    @classmethod
+    def lazy(cls, paragraphs: Iterator[Paragraph], filename: str = "") -> 'Document':
+        """
+        Create a document whose paragraphs are produced on demand
+
+        Args:
+            paragraphs: Iterator yielding the paragraphs in document order
+            filename: Name of the source file
+
+        Returns:
+            Document: A document whose paragraphs attribute is a one-shot iterator
+        """
+        document = cls()
+        document.filename = filename
+        document.paragraphs = LazyParagraphs(paragraphs)
+        return document
+
+    @property
+    def is_lazy(self) -> bool:
+        """Check if the paragraphs are produced on demand"""
+        return isinstance(self.paragraphs, LazyParagraphs)
+
     def add_paragraph(self, paragraph: Paragraph) -> None:
         """Add a paragraph to the document"""
+        if self.is_lazy:
+            raise TypeError("Cannot add paragraphs to a lazy document")
         self.paragraphs.append(paragraph)
-    
+
     def get_images(self) -> List:
-        """Get all images in the document"""
+        """Get all images in the document (for a lazy document: of the paragraphs consumed so far)"""
+        if self.is_lazy:
+            return list(self.paragraphs.images)
         images = []
         for paragraph in self.paragraphs:
-            if paragraph.image is not None:
-                images.append(paragraph.image)
+            if paragraph.has_image():
+                images.extend(paragraph.images)
         return images
-    
+
     def get_tables(self) -> List:
         """Get all tables in the document"""
+        if self.is_lazy:
+            raise TypeError("Tables of a lazy document are not kept; iterate its paragraphs instead")
         tables = []
         for paragraph in self.paragraphs:
             if paragraph.table is not None:
                 tables.append(paragraph.table)
-        return tables 
\ No newline at end of file
+        return tables
+
+
+class LazyParagraphs:
+    """
+    One-shot iterator over the paragraphs of a lazy document.
+    Remembers the images of the paragraphs it has produced (they are small
+    references that writers need after the text) and how many there were.
+    """
+
+    __slots__ = ('_source', 'images', 'count')
+
+    def __init__(self, source: Iterator[Paragraph]):
+        self._source: Optional[Iterator[Paragraph]] = iter(source)
+        self.images: List = []  # Images of the produced paragraphs, in document order
+        self.count: int = 0     # Number of produced paragraphs
+
+    def __iter__(self) -> 'LazyParagraphs':
+        return self
+
+    def __next__(self) -> Paragraph:
+        if self._source is None:
+            raise StopIteration
+        try:
+            paragraph = next(self._source)
+        except StopIteration:
+            self._source = None
+            raise
+        self.count += 1
+        if paragraph.has_image():
+            self.images.extend(paragraph.images)
+        return paragraph
+
+    def close(self) -> None:
+        """Stop producing paragraphs and release the parser's resources"""
+        if self._source is not None:
+            close = getattr(self._source, 'close', None)
+            if close is not None:
+                close()
+            self._source = None
\ No newline at end of file
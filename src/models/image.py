@@ -1,38 +1,70 @@
 from typing import Optional, Union, BinaryIO
 import os
+import shutil
+import zipfile
 
 class Image:
     """
     Container for image data and metadata.
     Represents an image extracted from the document.
+
+    The binary content is either held in memory or read on demand from the
+    source package (source_file/source_member), which lets writers copy the
+    compressed entry directly without ever inflating it.
     """
-    
+
+    __slots__ = ('file_path', '_content', 'source_file', 'source_member', 'new_file_name',
+                 'alt_text', 'width', 'height', 'image_format')
+
     def __init__(self):
         self.file_path: str = ""        # Original path in the docx
-        self.content: bytes = None      # Binary content of the image
+        self._content: Optional[bytes] = None  # Binary content of the image (if held in memory)
+        self.source_file: Union[str, BinaryIO, None] = None  # Path (or binary stream) of the package the image can be read from
+        self.source_member: str = ""    # Member name of the image inside source_file
         self.new_file_name: str = ""    # Generated filename for the output
         self.alt_text: str = ""         # Alternative text for the image
         self.width: int = 0             # Width of the image
         self.height: int = 0            # Height of the image
         self.image_format: str = ""     # Format of the image (png, jpg, etc.)
-        
+
+    @property
+    def content(self) -> Optional[bytes]:
+        """Binary content of the image, read from the source package if not in memory"""
+        if self._content is None and self.has_source():
+            with zipfile.ZipFile(self.source_file) as package:
+                return package.read(self.source_member)
+        return self._content
+
+    @content.setter
+    def content(self, content: Optional[bytes]) -> None:
+        self._content = content
+
+    def has_source(self) -> bool:
+        """Check if the image can be read from its source package"""
+        return bool(self.source_file and self.source_member)
+
     def save(self, output_dir: str) -> str:
         """
         Save the image to the specified directory
-        
+
         Args:
             output_dir: Directory to save the image in
-            
+
         Returns:
             str: Path to the saved image
         """
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
-            
+
         output_path = os.path.join(output_dir, self.new_file_name)
-        
+
         # Write the image content to the file
         with open(output_path, 'wb') as f:
-            f.write(self.content)
-            
-        return output_path 
\ No newline at end of file
+            if self._content is None and self.has_source():
+                # Stream from the package instead of loading the whole image
+                with zipfile.ZipFile(self.source_file) as package, package.open(self.source_member) as stream:
+                    shutil.copyfileobj(stream, f)
+            else:
+                f.write(self.content)
+
+        return output_path
\ No newline at end of file
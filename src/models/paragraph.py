@@ -1,23 +1,84 @@
 from typing import Dict, Optional, List, Any
 
+from .run import Run, RunList
+
 class Paragraph:
     """
     Represents a document paragraph with all its content and attributes.
     Can contain text, images, and tables.
+
+    Uses __slots__ and compact runs to keep large documents small in memory;
+    the images list and the formatting dict are only created when used.
     """
     
+    __slots__ = ('heading_level', 'list_level', 'list_number', 'text', '_heading', '_images', 'table', '_runs',
+                 '_formatting')
+    
     def __init__(self):
-        self.heading: str = ""          # Heading text (if paragraph is a heading)
         self.heading_level: int = 0     # 0 for regular paragraph, 1-6 for heading levels
+        self.list_level: int = 0        # 0 for regular paragraph, 1-9 for the nesting depth of a list item
+        self.list_number: int = 0       # Number of a numbered list item (0 for bullets)
         self.text: str = ""             # Text content
-        self.image = None               # Optional Image object
+        self._heading: Optional[str] = None  # Heading text assigned by older callers, overrides the derived one
+        self._images: Optional[List[Any]] = None  # Image objects, in document order
         self.table = None               # Optional Table object
-        self.formatting: Dict[str, Any] = {}  # Text formatting information
-        self.runs: List[Dict[str, Any]] = []  # List of text runs with formatting
-        
+        self._runs: RunList = RunList()  # Text runs with formatting
+        self._formatting: Optional[Dict[str, Any]] = None  # Text formatting information
+    
+    @property
+    def heading(self) -> str:
+        """Heading text (the paragraph text if the paragraph is a heading, unless a heading was assigned)"""
+        if self._heading is not None:
+            return self._heading
+        return self.text if self.heading_level > 0 else ""
+    
+    @heading.setter
+    def heading(self, heading: Optional[str]) -> None:
+        self._heading = heading
+    
+    @property
+    def images(self) -> List[Any]:
+        """Image objects, in document order"""
+        if self._images is None:
+            self._images = []
+        return self._images
+    
+    @images.setter
+    def images(self, images: List[Any]) -> None:
+        self._images = images
+    
+    @property
+    def image(self):
+        """First image of the paragraph, or None"""
+        return self._images[0] if self._images else None
+    
+    @image.setter
+    def image(self, image) -> None:
+        self._images = [image] if image is not None else None
+    
+    @property
+    def runs(self) -> RunList:
+        """Text runs with formatting, read like dicts (text, bold, ...); dicts added to the list become Run objects"""
+        return self._runs
+    
+    @runs.setter
+    def runs(self, runs: List[Any]) -> None:
+        self._runs = RunList(runs)
+    
+    @property
+    def formatting(self) -> Dict[str, Any]:
+        """Text formatting information"""
+        if self._formatting is None:
+            self._formatting = {}
+        return self._formatting
+    
+    @formatting.setter
+    def formatting(self, formatting: Dict[str, Any]) -> None:
+        self._formatting = formatting
+    
     def has_image(self) -> bool:
         """Check if the paragraph contains an image"""
-        return self.image is not None
+        return bool(self._images)
     
     def has_table(self) -> bool:
         """Check if the paragraph contains a table"""
@@ -27,10 +88,10 @@ class Paragraph:
         """Check if the paragraph is a heading"""
         return self.heading_level > 0
     
+    def is_list_item(self) -> bool:
+        """Check if the paragraph is an item of a bulleted or numbered list"""
+        return self.list_level > 0
+    
     def add_run(self, text: str, formatting: Dict[str, bool]) -> None:
         """Add a text run with formatting information"""
-        run = {
-            "text": text,
-            **formatting
-        }
-        self.runs.append(run) 
\ No newline at end of file
+        self._runs.append(Run(text, Run.from_dict(formatting).flags))
\ No newline at end of file
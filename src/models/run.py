@@ -0,0 +1,146 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+# Formatting flags of a run, combined into one small int
+BOLD = 1
+ITALIC = 2
+UNDERLINE = 4
+STRIKE = 8
+
+# Formatting keys in the order of the old run dictionaries
+FLAG_NAMES = (('bold', BOLD), ('italic', ITALIC), ('underline', UNDERLINE), ('strike', STRIKE))
+_FLAGS = dict(FLAG_NAMES)
+_KEYS = ('text',) + tuple(name for name, _ in FLAG_NAMES)
+
+
+class Run(Mapping):
+    """
+    A piece of paragraph text with uniform formatting.
+    Stores the text and the formatting as bit flags, which is far smaller
+    than a dictionary per run. For compatibility it still reads like the
+    old run dictionaries: run['bold'], run.get('text'), dict(run).
+    """
+
+    __slots__ = ('text', 'flags')
+
+    def __init__(self, text: str, flags: int = 0):
+        self.text: str = text    # Text content
+        self.flags: int = flags  # Combination of BOLD, ITALIC, UNDERLINE and STRIKE
+
+    @classmethod
+    def from_dict(cls, run: Dict[str, Any]) -> 'Run':
+        """
+        Build a run from an old-style run dictionary
+
+        Args:
+            run: Dictionary with 'text' and the formatting keys (missing keys are off)
+
+        Returns:
+            Run: The compact run
+        """
+        if isinstance(run, Run):
+            return run
+        flags = 0
+        for name, flag in FLAG_NAMES:
+            if run.get(name):
+                flags |= flag
+        return cls(run.get('text', ''), flags)
+
+    @property
+    def bold(self) -> bool:
+        return bool(self.flags & BOLD)
+
+    @property
+    def italic(self) -> bool:
+        return bool(self.flags & ITALIC)
+
+    @property
+    def underline(self) -> bool:
+        return bool(self.flags & UNDERLINE)
+
+    @property
+    def strike(self) -> bool:
+        return bool(self.flags & STRIKE)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'text':
+            return self.text
+        try:
+            return bool(self.flags & _FLAGS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def __repr__(self) -> str:
+        names = [name for name, flag in FLAG_NAMES if self.flags & flag]
+        return f"Run({self.text!r}{', ' if names else ''}{'|'.join(names)})"
+
+
+class RunList(list):
+    """
+    List of the runs of a paragraph.
+    Converts old-style run dictionaries added to it (append, insert,
+    extend, item assignment) into Run objects, so code written against the
+    list-of-dicts API keeps working and the writer only ever sees runs.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, runs: Iterable[Union[Run, Dict[str, Any]]] = ()):
+        super().__init__(Run.from_dict(run) for run in runs)
+
+    def append(self, run: Union[Run, Dict[str, Any]]) -> None:
+        super().append(Run.from_dict(run))
+
+    def insert(self, index: int, run: Union[Run, Dict[str, Any]]) -> None:
+        super().insert(index, Run.from_dict(run))
+
+    def extend(self, runs: Iterable[Union[Run, Dict[str, Any]]]) -> None:
+        super().extend(Run.from_dict(run) for run in runs)
+
+    def __iadd__(self, runs: Iterable[Union[Run, Dict[str, Any]]]) -> 'RunList':
+        self.extend(runs)
+        return self
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = [Run.from_dict(run) for run in value]
+        else:
+            value = Run.from_dict(value)
+        super().__setitem__(index, value)
+
+
+def coalesce_runs(runs: Iterable[Run]) -> List[Run]:
+    """
+    Merge adjacent runs with identical formatting and drop empty ones
+
+    Word splits text into many runs (spell checking, revision ids,
+    w:proofErr markers) that differ in nothing that Markdown can show.
+
+    Args:
+        runs: Runs in paragraph order
+
+    Returns:
+        List[Run]: The normalised runs; unmerged runs are reused as they are
+    """
+    merged: List[Run] = []
+    pending: List[Run] = []  # Adjacent runs with the same flags, not yet merged
+
+    for run in runs:
+        if not run.text:
+            continue
+        if pending and run.flags != pending[0].flags:
+            merged.append(pending[0] if len(pending) == 1
+                          else Run("".join(part.text for part in pending), pending[0].flags))
+            pending = []
+        pending.append(run)
+
+    if pending:
+        merged.append(pending[0] if len(pending) == 1
+                      else Run("".join(part.text for part in pending), pending[0].flags))
+    return merged
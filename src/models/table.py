@@ -1,4 +1,6 @@
-from typing import List, Dict, Any, Optional
+from functools import partial
+from itertools import islice
+from typing import List, Dict, Iterator, Optional, Tuple
 
 class Table:
     """
@@ -6,6 +8,8 @@ class Table:
     Contains rows, cells, and formatting information.
     """
     
+    __slots__ = ('rows', 'header', 'num_rows', 'num_cols', 'column_alignments', 'caption', 'cell_spans')
+    
     def __init__(self):
         self.rows: List[List[str]] = []  # List of rows, each containing cell values
         self.header: bool = False        # Whether the first row is a header
@@ -13,6 +17,7 @@ class Table:
         self.num_cols: int = 0           # Number of columns
         self.column_alignments: List[str] = []  # Alignment for each column ('left', 'center', 'right')
         self.caption: str = ""           # Optional table caption
+        self.cell_spans: Dict[Tuple[int, int], Tuple[int, int]] = {}  # (row, col) of a merged cell -> (row span, col span)
         
     def add_row(self, row: List[str]) -> None:
         """Add a row to the table"""
@@ -26,6 +31,17 @@ class Table:
             while len(self.column_alignments) < self.num_cols:
                 self.column_alignments.append('left')
     
+    def set_span(self, row: int, col: int, row_span: int, col_span: int) -> None:
+        """Record that the cell at (row, col) covers row_span rows and col_span columns"""
+        if row_span == 1 and col_span == 1:
+            self.cell_spans.pop((row, col), None)
+        else:
+            self.cell_spans[(row, col)] = (row_span, col_span)
+    
+    def get_span(self, row: int, col: int) -> Tuple[int, int]:
+        """Get the (row span, col span) of the cell starting at (row, col)"""
+        return self.cell_spans.get((row, col), (1, 1))
+    
     def set_column_alignment(self, col_index: int, alignment: str) -> None:
         """Set the alignment for a specific column"""
         if alignment not in ('left', 'center', 'right'):
@@ -44,34 +60,113 @@ class Table:
         Returns:
             str: Markdown representation of the table
         """
-        if not self.rows or self.num_cols == 0:
-            return ""
+        return '\n'.join(self.iter_markdown())
+    
+    def iter_markdown(self, aligned: bool = False) -> Iterator[str]:
+        """
+        Generate the lines of the Markdown table one at a time
+        
+        Cell content is escaped so that pipes and line breaks cannot break
+        the table. Nothing but the current line is held in memory; aligned
+        output escapes all cells up front to measure the columns.
+        
+        Args:
+            aligned: Pad the cells so that the columns line up
             
-        md_lines = []
+        Yields:
+            str: Header row, separator row and data rows, without line breaks
+        """
+        if not self.rows or self.num_cols == 0:
+            return
+        
+        if aligned:
+            rows, widths = self._escaped_rows()
+            format_row = partial(self._format_aligned_row, widths=widths)
+        else:
+            rows, widths, format_row = self.rows, None, self._format_row
         
         # Build header row
-        header_row = '|'
-        for cell in self.rows[0]:
-            header_row += f" {cell} |"
-        md_lines.append(header_row)
+        yield format_row(rows[0])
         
         # Build separator row with alignment indicators
-        separator_row = '|'
-        for i in range(self.num_cols):
-            alignment = self.column_alignments[i] if i < len(self.column_alignments) else 'left'
-            if alignment == 'left':
-                separator_row += " :- |"
-            elif alignment == 'center':
-                separator_row += " :-: |"
-            elif alignment == 'right':
-                separator_row += " -: |"
-        md_lines.append(separator_row)
+        yield self._format_separator(widths)
         
         # Build data rows
-        for row in self.rows[1:]:
-            data_row = '|'
-            for cell in row:
-                data_row += f" {cell} |"
-            md_lines.append(data_row)
+        for row in islice(rows, 1, None):
+            yield format_row(row)
+    
+    def _alignment(self, col_index: int) -> str:
+        """Get the alignment of a column"""
+        return self.column_alignments[col_index] if col_index < len(self.column_alignments) else 'left'
+    
+    def _escaped_rows(self) -> Tuple[List[List[str]], List[int]]:
+        """Escape every cell once and measure the widest escaped cell of every column"""
+        widths = [_MIN_COLUMN_WIDTH] * self.num_cols
+        rows = []
+        for row in self.rows:
+            escaped = [escape_cell(cell) for cell in row]
+            for i, text in enumerate(escaped):
+                if len(text) > widths[i]:
+                    widths[i] = len(text)
+            rows.append(escaped)
+        return rows, widths
+    
+    def _format_row(self, row: List[str]) -> str:
+        """Format one row"""
+        return '|' + ''.join(f" {escape_cell(cell)} |" for cell in row)
+    
+    def _format_aligned_row(self, row: List[str], widths: List[int]) -> str:
+        """Format one row of escaped cells, adding missing cells and padding all of them"""
+        cells = []
+        for i, width in enumerate(widths):
+            text = row[i] if i < len(row) else ""
+            alignment = self._alignment(i)
+            if alignment == 'right':
+                text = text.rjust(width)
+            elif alignment == 'center':
+                text = text.center(width)
+            else:
+                text = text.ljust(width)
+            cells.append(f" {text} |")
+        return '|' + ''.join(cells)
+    
+    def _format_separator(self, widths: Optional[List[int]]) -> str:
+        """Format the separator row with alignment indicators"""
+        separators = []
+        for i in range(self.num_cols):
+            alignment = self._alignment(i)
+            if widths is None:
+                separators.append(_SEPARATORS.get(alignment, ""))
+                continue
             
-        return '\n'.join(md_lines) 
\ No newline at end of file
+            width = widths[i]
+            if alignment == 'center':
+                separators.append(f" :{'-' * (width - 2)}: |")
+            elif alignment == 'right':
+                separators.append(f" {'-' * (width - 1)}: |")
+            else:
+                separators.append(f" :{'-' * (width - 1)} |")
+        return '|' + ''.join(separators)
+
+
+def escape_cell(text: str) -> str:
+    """
+    Escape the content of a table cell in a single pass
+    
+    Args:
+        text: Cell text
+        
+    Returns:
+        str: Text with pipes escaped and line breaks turned into <br>
+    """
+    return text.translate(_CELL_ESCAPES)
+
+
+# Characters that would break a Markdown table row
+_CELL_ESCAPES = str.maketrans({'|': '\\|', '\n': '<br>', '\r': ''})
+
+# Separator cells of unaligned tables
+_SEPARATORS = {'left': " :- |", 'center': " :-: |", 'right': " -: |"}
+
+# Narrowest padded column, so that every separator fits
+_MIN_COLUMN_WIDTH = 3
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Parallel conversion of a single large document.
+
+    python -m src.main book.docx --engine stream --render-jobs 4
+
+Batches scale across cores because files are independent. The blocks of one
+document are not quite: list numbers and image names depend on every block
+before them, and each block is indented for the heading it belongs to. The
+conversion therefore runs in two phases:
+
+1. The main process streams word/document.xml, numbers list items and
+   images, and serializes each top-level block
+   (StreamingDocxParser.iter_block_sources). This is the cheap part, about
+   a fifth of a serial conversion.
+2. Worker processes parse and render chunks of blocks independently
+   (MarkdownWriter.render_chunk). A chunk leaves the indentation of its
+   blocks open up to its first heading and reports its last heading.
+
+The main process writes the chunks in order, indenting each for the last
+heading of the chunks before it (MarkdownWriter.write_rendered), so the
+output is the same as that of a serial conversion. Only a few chunks per
+worker are in flight, so memory stays bounded as with the serial stream
+engine. Workers are started per conversion, which only pays off for large
+documents.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Iterator, List, Optional, Tuple
+
+from .models import Image
+from .parser.stream_parser import BlockSource, StreamingDocxParser
+from .parser.styles import StyleTable
+from .writer import MarkdownWriter, OutputSink
+
+# Blocks per chunk sent to a worker
+DEFAULT_CHUNK_SIZE = 256
+
+# Chunks per worker that are read ahead of the output
+CHUNKS_PER_WORKER = 2
+
+# Parser and writer of a worker process, set up by _init_worker
+_worker_parser: Optional[StreamingDocxParser] = None
+_worker_writer: Optional[MarkdownWriter] = None
+
+
+def _init_worker(style_table: StyleTable, md_file_path: str, sized_images: bool, align_tables: bool) -> None:
+    """Set up the parser and writer of a worker process for one document"""
+    global _worker_parser, _worker_writer
+    _worker_parser = StreamingDocxParser()
+    _worker_parser.style_table = style_table
+    _worker_writer = MarkdownWriter(sized_images=sized_images, align_tables=align_tables)
+    _worker_writer.md_file_path = md_file_path
+
+
+def _render_chunk(sources: List[BlockSource]) -> Tuple[str, Optional[int]]:
+    """Parse and render a chunk of blocks in a worker process (see MarkdownWriter.render_chunk)"""
+    paragraphs = [paragraph for paragraph in map(_worker_parser.parse_block_source, sources)
+                  if paragraph is not None]
+    return _worker_writer.render_chunk(paragraphs)
+
+
+def _iter_chunks(sources: Iterator[BlockSource], chunk_size: int, images: List[Image]) -> Iterator[List[BlockSource]]:
+    """Group blocks into chunks, collecting their images in document order"""
+    while True:
+        chunk = list(islice(sources, chunk_size))
+        if not chunk:
+            return
+        for _, _, block_images in chunk:
+            if block_images:
+                images.extend(block_images)
+        yield chunk
+
+
+def write_document_parallel(input_file: str, output_path: str, sink: OutputSink,
+                            writer: Optional[MarkdownWriter] = None, jobs: Optional[int] = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """
+    Convert a DOCX file with its blocks parsed and rendered in worker processes
+
+    Args:
+        input_file: Path to the DOCX file
+        output_path: Path where to write the output (without extension)
+        sink: Destination for the output
+        writer: Writer whose options (sized_images, align_tables) are used
+        jobs: Number of worker processes (default: number of CPUs)
+        chunk_size: Blocks per chunk sent to a worker
+
+    Returns:
+        The sink's result
+    """
+    writer = writer if writer is not None else MarkdownWriter()
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    parser = StreamingDocxParser()
+    sources = parser.iter_block_sources(input_file)
+    images: List[Image] = []
+
+    md_file_path = f"{output_path}.md"
+    pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                               initargs=(parser.style_table, md_file_path, writer.sized_images,
+                                         writer.align_tables))
+
+    pending: Deque[Future] = deque()
+
+    def rendered_chunks() -> Iterator[Tuple[str, Optional[int]]]:
+        for chunk in _iter_chunks(sources, max(1, chunk_size), images):
+            pending.append(pool.submit(_render_chunk, chunk))
+            if len(pending) >= jobs * CHUNKS_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    try:
+        return writer.write_rendered(rendered_chunks(), images, output_path, sink)
+    finally:
+        sources.close()
+        # Drop the chunks not started yet (shutdown(cancel_futures=True) needs Python 3.9)
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
@@ -1,3 +1,10 @@
 from .docx_parser import DocxParser
+from .stream_parser import StreamingDocxParser
 
-__all__ = ['DocxParser'] 
\ No newline at end of file
+# Available parser engines by name
+PARSER_ENGINES = {
+    'docx': DocxParser,
+    'stream': StreamingDocxParser,
+}
+
+__all__ = ['DocxParser', 'StreamingDocxParser', 'PARSER_ENGINES']
\ No newline at end of file
@@ -1,5 +1,7 @@
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 import os
+import zipfile
+import zlib
 from docx import Document as DocxDocument
 from docx.document import Document as DocxDocumentClass
 from docx.table import Table as DocxTable
@@ -7,7 +9,15 @@ from docx.text.paragraph import Paragraph as DocxParagraph
 # from docx.oxml.text.run import CT_R
 # from docx.oxml.xmlchemy import OxmlElement
 
+from .. import tracing
 from ..models import Document, Paragraph, Image, Table
+from ..models.run import Run, BOLD, ITALIC, UNDERLINE, STRIKE, coalesce_runs
+from .drawings import Drawing, build_drawing_index, read_drawing
+from .media import emu_to_pixels, image_format
+from .numbering import NumberingTable
+from .ooxml import W_R, W_RPR, RT_NUMBERING, run_text
+from .styles import StyleTable
+from .tables import extract_table
 
 class DocxParser:
     """
@@ -19,44 +29,130 @@ class DocxParser:
         self.image_counter: int = 1  # Counter for generating image filenames
         self.document: Optional[Document] = None
         self.docx: Optional[DocxDocumentClass] = None
-        
-    def parse_document(self, docx_path: str) -> Document:
+        self.drawing_index: Optional[Dict[Any, List[Drawing]]] = None  # Pictures by body element
+        self.source_file: Union[str, BinaryIO, None] = None  # Package that images are read from on demand
+        self.style_table: Optional[StyleTable] = None  # Paragraph styles resolved once per document
+        self.numbering: Optional[NumberingTable] = None  # Lists and their counters, per document
+        self.image_names: Dict[str, str] = {}  # Image part -> output file name, one file per part
+        self.image_contents: Dict[Tuple[int, int], str] = {}  # Content key -> image part first seen with it
+        self.image_entries: Optional[Dict[str, Tuple[int, int]]] = None  # Part -> CRC-32 and size in the package
+        
+    def parse_document(self, docx_path: Union[str, BinaryIO], lazy: bool = False) -> Document:
         """
         Parse a DOCX file and return a Document object.
         
         Args:
-            docx_path (str): Path to the DOCX file
+            docx_path (str): Path to the DOCX file, or a seekable binary stream with its bytes
+                (kept open while the document and its images are used)
+            lazy (bool): If True, return at once with a document whose paragraphs
+                are parsed while they are iterated (only once, in order)
             
         Returns:
             Document: Parsed document object
         """
+        self.source_file = docx_path
+        self.image_names = {}
+        self.image_contents = {}
+        self.image_entries = None
+        filename = os.path.basename(docx_path if isinstance(docx_path, str) else getattr(docx_path, 'name', ''))
+        
+        # Load the package now, so a broken file fails before any output is written
+        blocks = self._iter_document(docx_path, filename)
+        next(blocks)
+        
+        if lazy:
+            self.document = Document.lazy(blocks, filename)
+            return self.document
+        
         # Create a new document
         self.document = Document()
-        self.document.filename = os.path.basename(docx_path)
+        self.document.filename = filename
+        for paragraph in blocks:
+            self.document.add_paragraph(paragraph)
         
-        # Load the docx file
-        self.docx = DocxDocument(docx_path)
+        return self.document
+    
+    def _iter_document(self, docx_path: Union[str, BinaryIO], filename: str) -> Iterator[Optional[Paragraph]]:
+        """
+        Load a DOCX file and yield its paragraphs and tables in document order
         
-        # Process document body elements in order
-        self._process_document_elements()
+        Args:
+            docx_path: Path to the DOCX file
+            filename: Name of the file, recorded on the trace
+            
+        Yields:
+            None once the package has been loaded, then each parsed paragraph
+            (tables are wrapped in a paragraph)
+        """
+        # Ends before the first block, so it never includes the writer's time
+        with tracing.span('parse_document') as stage:
+            stage.set('file', filename)
+            stage.set('engine', 'docx')
+            
+            # Load the docx file
+            with tracing.span('load_package'):
+                self.docx = DocxDocument(docx_path)
+            
+            # Resolve paragraph styles and lists once for the whole document
+            self.style_table = StyleTable.from_element(self.docx.styles.element)
+            self.numbering = NumberingTable.from_element(self._numbering_element(), self.style_table)
+            
+            # Locate all pictures in a single pass over the body
+            with tracing.span('index_drawings') as index_stage:
+                self.drawing_index = build_drawing_index(self.docx._body._body)
+                index_stage.count('drawings', sum(len(drawings) for drawings in self.drawing_index.values()))
         
-        return self.document
+        # Process document body elements in order
+        blocks = self._iter_document_elements()
+        yield None
+        yield from blocks
         
     def _process_document_elements(self):
         """
         Process all document elements (paragraphs and tables) in the order they appear.
         """
+        for paragraph in self._iter_document_elements():
+            self.document.add_paragraph(paragraph)
+        
+    def _iter_document_elements(self) -> Iterator[Paragraph]:
+        """
+        Parse the document elements (paragraphs and tables) in the order they appear
+        
+        The body walk is traced as one span that leaves out the time the
+        consumer takes between elements (see tracing.iter_span).
+        
+        Returns:
+            Iterator over each non-empty paragraph, or a paragraph holding a table
+        """
+        return tracing.iter_span('process_elements', self._walk_body)
+        
+    def _walk_body(self, stage) -> Iterator[Paragraph]:
+        """
+        Parse the document body for _iter_document_elements
+        
+        Args:
+            stage: Span of the body walk, counting paragraphs and tables
+            
+        Yields:
+            Paragraph: Each non-empty paragraph, or a paragraph holding a table
+        """
         # Get all block elements in document body
         body = self.docx._body._body
         
+        stage.count('paragraphs', 0)
+        stage.count('tables', 0)
+        
         # Process elements in document order
         for element in body.iterchildren():
             if element.tag.endswith('p'):
                 # It's a paragraph
                 paragraph = DocxParagraph(element, self.docx)
                 if paragraph.text.strip() or self._has_image(paragraph):
-                    parsed_paragraph = self._parse_paragraph(paragraph)
-                    self.document.add_paragraph(parsed_paragraph)
+                    stage.count('paragraphs')
+                    yield self._parse_paragraph(paragraph)
+                else:
+                    # Empty list items still take their number
+                    self._detect_list_item(element)
             elif element.tag.endswith('tbl'):
                 # It's a table
                 table = DocxTable(element, self.docx)
@@ -66,7 +162,8 @@ class DocxParser:
                 table_paragraph = Paragraph()
                 table_paragraph.table = parsed_table
                 
-                self.document.add_paragraph(table_paragraph)
+                stage.count('tables')
+                yield table_paragraph
         
     def _parse_paragraph(self, paragraph: DocxParagraph) -> Paragraph:
         """
@@ -85,20 +182,25 @@ class DocxParser:
         
         # Detect if it's a heading
         model_paragraph.heading_level = self._detect_heading_level(paragraph)
-        if model_paragraph.heading_level > 0:
-            model_paragraph.heading = paragraph.text
+        
+        # Detect if it's a list item
+        list_item = self._detect_list_item(paragraph._p)
+        if list_item is not None:
+            model_paragraph.list_level, model_paragraph.list_number = list_item
         
         # Extract formatting
         model_paragraph.runs = self._extract_text_formatting(paragraph)
         
-        # Extract image if present
-        model_paragraph.image = self._extract_image(paragraph)
+        # Extract images if present
+        images = self._extract_images(paragraph)
+        if images:
+            model_paragraph.images = images
         
         return model_paragraph
         
     def _extract_image(self, paragraph: DocxParagraph) -> Optional[Image]:
         """
-        Extract image from a paragraph
+        Extract the first image from a paragraph
         
         Args:
             paragraph: A docx paragraph that might contain an image
@@ -106,46 +208,167 @@ class DocxParser:
         Returns:
             Optional[Image]: The extracted image or None
         """
-        # Check if paragraph contains an image using xpath to find inline shapes
-        image_elements = paragraph._element.xpath('.//a:blip')
-        if not image_elements:
+        images = self._extract_images(paragraph)
+        return images[0] if images else None
+    
+    def _extract_images(self, paragraph: DocxParagraph) -> List[Image]:
+        """
+        Extract all images from a paragraph
+        
+        Args:
+            paragraph: A docx paragraph that might contain images
+            
+        Returns:
+            List[Image]: The extracted images in document order
+        """
+        images = []
+        
+        for drawing in self._get_drawings(paragraph):
+            try:
+                # Get the image part
+                image_part = paragraph.part.related_parts[drawing.rel_id]
+            except KeyError:
+                # If we can't resolve the image, continue to the next one
+                continue
+            
+            images.append(self._create_image(drawing, image_part.partname, image_part.blob,
+                                             image_part.content_type))
+        
+        return images
+    
+    def _create_image(self, drawing: Drawing, file_path: str, content: Optional[bytes] = None,
+                      content_type: Optional[str] = None) -> Image:
+        """
+        Create an Image object for a picture reference
+        
+        When the source package is known, the image only references its
+        member there, so writers can copy the compressed bytes directly.
+        Format and size are taken from the package and the drawing, without
+        decoding the image.
+        
+        Args:
+            drawing: The drawing the picture belongs to
+            file_path: Path of the image part inside the docx
+            content: Binary content of the image, used when there is no source package
+            content_type: Content type of the image part, if known
+            
+        Returns:
+            Image: The image with a newly generated file name
+        """
+        image = Image()
+        image.file_path = file_path
+        if self.source_file:
+            image.source_file = self.source_file
+            image.source_member = file_path.lstrip('/')
+        else:
+            image.content = content
+        image.alt_text = drawing.alt_text
+        image.image_format = self._detect_image_format(file_path, content, content_type)
+        image.width = emu_to_pixels(drawing.cx)
+        image.height = emu_to_pixels(drawing.cy)
+        
+        # Repeated pictures (logos, icons) share one output file
+        image.new_file_name = self._image_file_name(file_path, content, image.image_format)
+        
+        return image
+    
+    def _detect_image_format(self, file_path: str, content: Optional[bytes],
+                             content_type: Optional[str]) -> str:
+        """
+        Determine the format of an image part
+        
+        Args:
+            file_path: Path of the image part inside the docx
+            content: Binary content of the image, if already loaded
+            content_type: Content type of the image part, if known
+            
+        Returns:
+            str: The format, usable as file extension (e.g. 'png', 'jpg', 'emf')
+        """
+        return image_format(content_type, content, file_path)
+    
+    def _image_file_name(self, file_path: str, content: Optional[bytes], image_format: str = 'png') -> str:
+        """
+        Get the output file name of an image part
+        
+        Every part gets a single file, and parts with identical content
+        share the file of the first one.
+        
+        Args:
+            file_path: Path of the image part inside the docx
+            content: Binary content of the image, if already loaded
+            image_format: Format of the image, used as file extension
+            
+        Returns:
+            str: The output file name
+        """
+        name = self.image_names.get(file_path)
+        if name is not None:
+            return name
+        
+        key = self._image_content_key(file_path, content)
+        first_path = self.image_contents.get(key) if key is not None else None
+        if first_path is not None and self._same_image_content(first_path, file_path):
+            name = self.image_names[first_path]
+        else:
+            # Generate a new filename
+            name = f"document.{self.image_counter:03d}.{image_format}"
+            self.image_counter += 1
+            if key is not None:
+                self.image_contents.setdefault(key, file_path)
+        
+        self.image_names[file_path] = name
+        return name
+    
+    def _image_content_key(self, file_path: str, content: Optional[bytes]) -> Optional[Tuple[int, int]]:
+        """
+        Compute a key identifying the content of an image part
+        
+        Uses the CRC-32 and size stored in the package, read once from its
+        central directory, so the image bytes are not hashed.
+        
+        Args:
+            file_path: Path of the image part inside the docx
+            content: Binary content of the image, used when there is no source package
+            
+        Returns:
+            Optional[Tuple[int, int]]: The CRC-32 and uncompressed size, or None if the content is unknown
+        """
+        if self.source_file:
+            if self.image_entries is None:
+                with zipfile.ZipFile(self.source_file) as package:
+                    self.image_entries = {f"/{info.filename}": (info.CRC, info.file_size)
+                                          for info in package.infolist()}
+            return self.image_entries.get(file_path)
+        if content is None:
             return None
+        return zlib.crc32(content), len(content)
+    
+    def _same_image_content(self, file_path: str, other_path: str) -> bool:
+        """Compare two image parts whose CRC-32 and size match byte for byte"""
+        # python-docx has loaded every part already
+        blobs = {part.partname: part.blob for part in self.docx.part.package.iter_parts()
+                 if part.partname in (file_path, other_path)}
+        return blobs[file_path] == blobs[other_path]
+    
+    def _get_drawings(self, paragraph: DocxParagraph) -> List[Drawing]:
+        """
+        Get the picture references of a paragraph
         
-        # For simplicity, we'll just take the first image
-        for element in paragraph._element.xpath('.//a:blip'):
-            # Get the relationship ID
-            rId = element.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')
-            if rId:
-                try:
-                    # Get the image part
-                    image_part = paragraph.part.related_parts[rId]
-                    
-                    # Create an Image object
-                    image = Image()
-                    image.file_path = image_part.partname
-                    image.content = image_part.blob
-                    
-                    # Set alt text if available
-                    try:
-                        drawing_element = element.getparent().getparent().getparent()
-                        doc_pr = drawing_element.xpath('.//wp:docPr', namespaces=drawing_element.nsmap)
-                        if doc_pr:
-                            image.alt_text = doc_pr[0].get('descr', '')
-                        else:
-                            image.alt_text = ""
-                    except:
-                        image.alt_text = ""
-                    
-                    # Generate a new filename
-                    image.new_file_name = f"document.{self.image_counter:03d}.png"
-                    self.image_counter += 1
-                    
-                    return image
-                except:
-                    # If we can't extract the image, continue to the next one
-                    continue
+        Uses the per-document drawing index when available and falls back
+        to searching the paragraph element otherwise.
         
-        return None
+        Args:
+            paragraph: A docx paragraph
+            
+        Returns:
+            List[Drawing]: Drawings in document order
+        """
+        if self.drawing_index is not None:
+            return self.drawing_index.get(paragraph._element, [])
+        
+        return [read_drawing(blip) for blip in paragraph._element.xpath('.//a:blip')
+                if blip.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')]
         
     def _parse_table(self, table: DocxTable) -> Table:
         """
@@ -154,6 +377,28 @@ class DocxParser:
         Args:
             table: A docx table object
             
+        Returns:
+            Table: The parsed Table object
+        """
+        with tracing.span('parse_table') as stage:
+            if isinstance(table, DocxTable):
+                # Walk the XML once instead of rebuilding the cell grid per row
+                model_table = extract_table(table._tbl)
+            else:
+                model_table = self._parse_table_cells(table)
+            
+            stage.count('rows', len(model_table.rows))
+            stage.count('cells', sum(len(row) for row in model_table.rows))
+        
+        return model_table
+    
+    def _parse_table_cells(self, table) -> Table:
+        """
+        Parse a table through its rows and cells (for table-like objects without XML)
+        
+        Args:
+            table: An object with rows, each with cells that have text
+            
         Returns:
             Table: The parsed Table object
         """
@@ -225,89 +470,160 @@ class DocxParser:
         Returns:
             int: The heading level (0 for normal paragraphs)
         """
-        # Check if it's a heading by style name - this is the most reliable method
-        if hasattr(paragraph, 'style') and paragraph.style and paragraph.style.name.startswith('Heading'):
+        # Check if it's a heading by style or outline level - this is the most reliable method
+        if self.style_table is not None:
+            level = self.style_table.paragraph_heading_level(paragraph._p)
+            if level > 0:
+                return level
+        elif hasattr(paragraph, 'style') and paragraph.style:
+            level = self._heading_level_from_style_name(paragraph.style.name)
+            if level > 0:
+                return level
+        
+        # If no heading style is found, try to determine level from formatting
+        if paragraph.runs and paragraph.text.strip():
+            # Get the font size of the first run if available
+            font_size = self._get_font_size(paragraph.runs[0])
+            runs = [(run.text, run.bold) for run in paragraph.runs]
+            return self._heading_level_from_runs(runs, paragraph.text, font_size)
+        
+        return 0  # Not a heading
+    
+    def _numbering_element(self):
+        """
+        Get the root element of the numbering part
+        
+        Returns:
+            The w:numbering element, or None if the document has no lists
+        """
+        for rel in self.docx.part.rels.values():
+            if rel.reltype == RT_NUMBERING and not rel.is_external:
+                return rel.target_part.element
+        return None
+    
+    def _detect_list_item(self, element) -> Optional[Tuple[int, int]]:
+        """
+        Number a w:p element if it is a list item
+        
+        Must be called for every body paragraph in document order, as it
+        advances the list counters.
+        
+        Args:
+            element: A w:p element
+            
+        Returns:
+            Optional[Tuple[int, int]]: The nesting depth and the item number (0 for bullets),
+            or None if the paragraph is no list item
+        """
+        if self.numbering is None:
+            return None
+        return self.numbering.paragraph_list_item(element, self.style_table)
+    
+    def _heading_level_from_style_name(self, style_name: Optional[str]) -> int:
+        """
+        Detect the heading level from a paragraph style name
+        
+        Args:
+            style_name: UI name of the paragraph style (e.g. 'Heading 1')
+            
+        Returns:
+            int: The heading level (0 if the style is not a heading style)
+        """
+        if not style_name:
+            return 0
+        
+        if style_name.startswith('Heading'):
             try:
                 # Extract heading level from style name (e.g., 'Heading 1' -> 1)
-                return int(paragraph.style.name.split()[-1])
+                return int(style_name.split()[-1])
             except:
                 # Default to level 1 if we can't extract the level
                 return 1
                 
         # Check for other heading styles that might not start with "Heading"
         # Some documents use Title, Subtitle, etc.
-        if hasattr(paragraph, 'style') and paragraph.style:
-            style_name = paragraph.style.name.lower()
-            if 'title' in style_name:
-                return 1
-            if 'subtitle' in style_name:
-                return 2
+        style_name = style_name.lower()
+        if 'title' in style_name:
+            return 1
+        if 'subtitle' in style_name:
+            return 2
         
-        # If no heading style is found, try to determine level from formatting
-        if paragraph.runs and paragraph.text.strip():
-            # Get the font size of the first run if available
-            font_size = None
-            if len(paragraph.runs) > 0:
-                font_size = self._get_font_size(paragraph.runs[0])
-            
-            # Check if the entire paragraph is bold
-            all_text = "".join(run.text for run in paragraph.runs)
-            all_bold = True
-            
-            for run in paragraph.runs:
-                if run.text.strip() and not run.bold:
-                    all_bold = False
-                    break
-            
-            # If it's all bold, determine level by additional clues
-            if all_bold and all_text.strip():
-                # Check if there's a font size we can use to determine level
-                if font_size:
-                    # Font sizes often decrease as heading levels increase
-                    # These thresholds are estimates and may need adjustment
-                    if font_size >= 20:  # Very large text
-                        return 1
-                    elif font_size >= 16:
-                        return 2
-                    elif font_size >= 14:
-                        return 3
-                    else:
-                        return 4
-                
-                # Check for other formatting that might indicate level
-                all_caps = all(c.isupper() for c in all_text if c.isalpha())
-                if all_caps:
-                    return 1  # ALL CAPS text is often a top-level heading
-                
-                # Look at length as a heuristic - shorter headings tend to be higher level
-                if len(all_text.strip()) <= 20:
+        return 0
+    
+    def _heading_level_from_runs(self, runs: List[Tuple[str, Optional[bool]]], text: str,
+                                 font_size: Optional[int]) -> int:
+        """
+        Guess the heading level of a paragraph without a heading style from its formatting
+        
+        Args:
+            runs: (text, bold) pairs for each run of the paragraph
+            text: Full paragraph text
+            font_size: Font size of the first run in points, if known
+            
+        Returns:
+            int: The heading level (0 for normal paragraphs)
+        """
+        if not runs or not text.strip():
+            return 0
+        
+        # Check if the entire paragraph is bold
+        all_text = "".join(run_text for run_text, _ in runs)
+        all_bold = True
+        
+        for run_text, run_bold in runs:
+            if run_text.strip() and not run_bold:
+                all_bold = False
+                break
+        
+        # If it's all bold, determine level by additional clues
+        if all_bold and all_text.strip():
+            # Check if there's a font size we can use to determine level
+            if font_size:
+                # Font sizes often decrease as heading levels increase
+                # These thresholds are estimates and may need adjustment
+                if font_size >= 20:  # Very large text
+                    return 1
+                elif font_size >= 16:
                     return 2
-                else:
+                elif font_size >= 14:
                     return 3
+                else:
+                    return 4
             
-            # If the first run is bold and contains the entire text
-            first_run = paragraph.runs[0]
-            if first_run.bold and first_run.text.strip() and first_run.text.strip() == paragraph.text.strip():
-                # Apply the same font size logic for single-run bold paragraphs
-                if font_size:
-                    if font_size >= 20:
-                        return 1
-                    elif font_size >= 16:
-                        return 2
-                    elif font_size >= 14:
-                        return 3
-                    else:
-                        return 4
-                
-                # If no font size info, use text length as a basic heuristic
-                if len(first_run.text.strip()) <= 20:
+            # Check for other formatting that might indicate level
+            all_caps = all(c.isupper() for c in all_text if c.isalpha())
+            if all_caps:
+                return 1  # ALL CAPS text is often a top-level heading
+            
+            # Look at length as a heuristic - shorter headings tend to be higher level
+            if len(all_text.strip()) <= 20:
+                return 2
+            else:
+                return 3
+        
+        # If the first run is bold and contains the entire text
+        first_text, first_bold = runs[0]
+        if first_bold and first_text.strip() and first_text.strip() == text.strip():
+            # Apply the same font size logic for single-run bold paragraphs
+            if font_size:
+                if font_size >= 20:
+                    return 1
+                elif font_size >= 16:
                     return 2
-                else:
+                elif font_size >= 14:
                     return 3
+                else:
+                    return 4
+            
+            # If no font size info, use text length as a basic heuristic
+            if len(first_text.strip()) <= 20:
+                return 2
+            else:
+                return 3
         
         return 0  # Not a heading
     
-    def _extract_text_formatting(self, paragraph: DocxParagraph) -> List[Dict[str, Any]]:
+    def _extract_text_formatting(self, paragraph: DocxParagraph) -> List[Run]:
         """
         Extract text runs with their formatting
         
@@ -315,27 +631,64 @@ class DocxParser:
             paragraph: A docx paragraph
             
         Returns:
-            List[Dict]: List of runs with text and formatting info
+            List[Run]: List of runs with text and formatting flags
         """
+        if self.style_table is not None:
+            # Resolve the XML directly, including formatting inherited from styles
+            element = paragraph._p
+            return self._extract_element_formatting(element, [child for child in element if child.tag == W_R])
+        
         formatted_runs = []
         
         for run in paragraph.runs:
-            if not run.text:
+            text = run.text
+            if not text:
                 continue
                 
             # Extract formatting attributes
-            formatting = {
-                "text": run.text,
-                "bold": bool(run.bold),
-                "italic": bool(run.italic),
-                "underline": bool(run.underline),
-                "strike": bool(run.font.strike)
-            }
+            flags = 0
+            if run.bold:
+                flags |= BOLD
+            if run.italic:
+                flags |= ITALIC
+            if run.underline:
+                flags |= UNDERLINE
+            if run.font.strike:
+                flags |= STRIKE
             
-            formatted_runs.append(formatting)
+            formatted_runs.append(Run(text, flags))
             
         return formatted_runs
     
+    def _extract_element_formatting(self, element, runs: List) -> List[Run]:
+        """
+        Extract text runs with their effective formatting
+        
+        Each w:rPr is read once and merged with the formatting the paragraph
+        and character styles pass on, which the style table resolves once
+        per document. Adjacent runs that end up with the same formatting
+        are merged.
+        
+        Args:
+            element: The w:p element
+            runs: Its w:r children
+            
+        Returns:
+            List[Run]: List of runs with text and formatting flags
+        """
+        formatted_runs = []
+        paragraph_flags = self.style_table.paragraph_run_flags(element)
+        run_flags = self.style_table.run_flags
+        
+        for run in runs:
+            text = run_text(run)
+            if not text:
+                continue
+            
+            formatted_runs.append(Run(text, run_flags(paragraph_flags, run.find(W_RPR))))
+        
+        return coalesce_runs(formatted_runs)
+    
     def _has_image(self, paragraph: DocxParagraph) -> bool:
         """
         Check if a paragraph contains an image
@@ -346,4 +699,6 @@ class DocxParser:
         Returns:
             bool: True if the paragraph contains an image
         """
-        return len(paragraph._element.xpath('.//a:blip')) > 0 
\ No newline at end of file
+        if self.drawing_index is not None:
+            return paragraph._element in self.drawing_index
+        return len(paragraph._element.xpath('.//a:blip')) > 0
\ No newline at end of file
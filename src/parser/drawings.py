@@ -0,0 +1,96 @@
+from typing import Any, Dict, List
+
+from lxml import etree
+
+from .ooxml import NAMESPACES, R_EMBED, WP_INLINE, WP_ANCHOR, WP_DOCPR, qn
+
+WP_EXTENT = qn('wp:extent')
+
+# Precompiled once: embedded pictures anywhere below an element
+_EMBEDDED_BLIPS = etree.XPath('.//a:blip[@r:embed]', namespaces=NAMESPACES)
+
+
+class Drawing:
+    """
+    Reference to an embedded picture found in the document body.
+    Holds what the parser needs to build an Image without touching the XML again.
+    """
+
+    def __init__(self, rel_id: str, alt_text: str = "", cx: int = 0, cy: int = 0):
+        self.rel_id: str = rel_id        # Relationship ID of the image part (r:embed)
+        self.alt_text: str = alt_text    # Description from wp:docPr
+        self.cx: int = cx                # Width of the drawing in EMU
+        self.cy: int = cy                # Height of the drawing in EMU
+
+    def __repr__(self) -> str:
+        return f"Drawing({self.rel_id!r}, alt_text={self.alt_text!r}, cx={self.cx}, cy={self.cy})"
+
+
+def read_drawing(blip) -> Drawing:
+    """
+    Build a Drawing from an a:blip element
+
+    The alt text and extent come from the enclosing wp:inline or wp:anchor.
+
+    Args:
+        blip: An a:blip element
+
+    Returns:
+        Drawing: The drawing reference
+    """
+    drawing = Drawing(blip.get(R_EMBED))
+
+    for container in blip.iterancestors(WP_INLINE, WP_ANCHOR):
+        doc_pr = container.find(WP_DOCPR)
+        if doc_pr is not None:
+            drawing.alt_text = doc_pr.get('descr', '')
+
+        extent = container.find(WP_EXTENT)
+        if extent is not None:
+            try:
+                drawing.cx = int(extent.get('cx', 0))
+                drawing.cy = int(extent.get('cy', 0))
+            except ValueError:
+                pass
+        break
+
+    return drawing
+
+
+def find_drawings(element) -> List[Drawing]:
+    """
+    Find all embedded pictures below a single element (e.g. a w:p)
+
+    Args:
+        element: Any WordprocessingML element
+
+    Returns:
+        List[Drawing]: Drawings in document order
+    """
+    return [read_drawing(blip) for blip in _EMBEDDED_BLIPS(element)]
+
+
+def build_drawing_index(body) -> Dict[Any, List[Drawing]]:
+    """
+    Index every embedded picture of a document body by its top-level block
+
+    The body is scanned once, so looking up the pictures of a paragraph
+    afterwards is a dictionary access instead of an XPath search.
+
+    Args:
+        body: The w:body element
+
+    Returns:
+        Dict[element, List[Drawing]]: Drawings keyed by the w:p / w:tbl child of the body
+    """
+    index: Dict[Any, List[Drawing]] = {}
+
+    for blip in _EMBEDDED_BLIPS(body):
+        block = blip
+        for ancestor in blip.iterancestors():
+            if ancestor is body:
+                break
+            block = ancestor
+        index.setdefault(block, []).append(read_drawing(blip))
+
+    return index
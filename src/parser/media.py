@@ -0,0 +1,111 @@
+"""
+Image format and size detection without decoding any pixels.
+
+The format comes from the part's content type, falling back to the file's
+signature and finally to the part name. Sizes come from the drawing extent
+in the document XML (EMU), converted to CSS pixels at 96 DPI.
+"""
+import posixpath
+from typing import Optional
+
+# English Metric Units per pixel at 96 DPI
+EMU_PER_PIXEL = 9525
+
+# Bytes needed from the start of a file to recognise its signature
+SIGNATURE_SIZE = 64
+
+# Content types of image parts and the format (file extension) they map to
+CONTENT_TYPE_FORMATS = {
+    'image/png': 'png',
+    'image/jpeg': 'jpg',
+    'image/jpg': 'jpg',
+    'image/pjpeg': 'jpg',
+    'image/gif': 'gif',
+    'image/bmp': 'bmp',
+    'image/x-ms-bmp': 'bmp',
+    'image/tiff': 'tiff',
+    'image/x-emf': 'emf',
+    'image/emf': 'emf',
+    'image/x-wmf': 'wmf',
+    'image/wmf': 'wmf',
+    'image/svg+xml': 'svg',
+    'image/webp': 'webp',
+    'image/x-icon': 'ico',
+    'image/vnd.microsoft.icon': 'ico',
+}
+
+# Part name extensions that differ from the format name
+_EXTENSION_FORMATS = {'jpeg': 'jpg', 'jpe': 'jpg', 'tif': 'tiff', 'dib': 'bmp'}
+
+IMAGE_FORMATS = frozenset(CONTENT_TYPE_FORMATS.values())
+
+DEFAULT_FORMAT = 'png'
+
+
+def format_from_signature(head: bytes) -> Optional[str]:
+    """
+    Recognise an image format from the first bytes of the file
+
+    Args:
+        head: At least the first SIGNATURE_SIZE bytes of the file (fewer if it is shorter)
+
+    Returns:
+        Optional[str]: The format, or None if the signature is unknown
+    """
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'jpg'
+    if head.startswith((b'GIF87a', b'GIF89a')):
+        return 'gif'
+    if head.startswith(b'BM'):
+        return 'bmp'
+    if head.startswith((b'II*\x00', b'MM\x00*')):
+        return 'tiff'
+    if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+        return 'webp'
+    if head.startswith(b'\x01\x00\x00\x00') and head[40:44] == b' EMF':
+        return 'emf'
+    if head.startswith((b'\xd7\xcd\xc6\x9a', b'\x01\x00\x09\x00', b'\x02\x00\x09\x00')):
+        return 'wmf'
+    if head.startswith(b'\x00\x00\x01\x00'):
+        return 'ico'
+    if b'<svg' in head.lstrip()[:SIGNATURE_SIZE]:
+        return 'svg'
+    return None
+
+
+def image_format(content_type: Optional[str] = None, head: Optional[bytes] = None,
+                 part_name: Optional[str] = None) -> str:
+    """
+    Determine the format of an image part
+
+    Args:
+        content_type: Content type of the part, if known
+        head: First bytes of the image, if available
+        part_name: Name of the part inside the package
+
+    Returns:
+        str: The format, usable as file extension (DEFAULT_FORMAT if nothing matches)
+    """
+    fmt = CONTENT_TYPE_FORMATS.get(content_type) if isinstance(content_type, str) else None
+    if fmt is None and head:
+        fmt = format_from_signature(head[:SIGNATURE_SIZE])
+    if fmt is None and isinstance(part_name, str):
+        extension = posixpath.splitext(part_name)[1][1:].lower()
+        extension = _EXTENSION_FORMATS.get(extension, extension)
+        fmt = extension if extension in IMAGE_FORMATS else None
+    return fmt or DEFAULT_FORMAT
+
+
+def emu_to_pixels(emu: int) -> int:
+    """
+    Convert a length in EMU to pixels at 96 DPI
+
+    Args:
+        emu: Length in English Metric Units
+
+    Returns:
+        int: Length in pixels (0 if unknown)
+    """
+    return int(round(emu / EMU_PER_PIXEL)) if emu > 0 else 0
@@ -0,0 +1,198 @@
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .ooxml import W_PPR, W_PSTYLE, W_NUMPR, W_NUM_ID, W_ILVL, W_VAL, qn, int_value, read_num_pr
+from .styles import NO_LIST, StyleTable
+
+W_ABSTRACT_NUM = qn('w:abstractNum')
+W_ABSTRACT_NUM_ID = qn('w:abstractNumId')
+W_NUM = qn('w:num')
+W_NUM_STYLE_LINK = qn('w:numStyleLink')
+W_LVL = qn('w:lvl')
+W_LVL_OVERRIDE = qn('w:lvlOverride')
+W_START_OVERRIDE = qn('w:startOverride')
+W_START = qn('w:start')
+W_NUM_FMT = qn('w:numFmt')
+
+# Levels a list can have in WordprocessingML
+LIST_LEVELS = 9
+
+# A list level: (w:numFmt, start number)
+ListLevel = Tuple[str, int]
+_DEFAULT_LEVEL: ListLevel = ('decimal', 1)
+
+
+def _int_value_attribute(element, attribute: str) -> int:
+    """Read an integer attribute (-1 if it is missing or invalid)"""
+    try:
+        return int(element.get(attribute))
+    except (TypeError, ValueError):
+        return -1
+
+
+def _string_value(element) -> Optional[str]:
+    """Read the w:val of an element, None if the element is absent"""
+    return element.get(W_VAL) if element is not None else None
+
+
+def _read_level(lvl, base: ListLevel = _DEFAULT_LEVEL) -> ListLevel:
+    """
+    Read the number format and start of a w:lvl element
+
+    Args:
+        lvl: A w:lvl element
+        base: Level the element overrides (its values are kept where lvl sets none)
+
+    Returns:
+        ListLevel: The level
+    """
+    num_fmt = lvl.find(W_NUM_FMT)
+    return (num_fmt.get(W_VAL, base[0]) if num_fmt is not None else base[0],
+            int_value(lvl.find(W_START), base[1]))
+
+
+class NumberingTable:
+    """
+    Lists of a document (numbering.xml) resolved once into a compact lookup.
+    Maps each numId to its counter and the number format and start of each
+    of its levels (abstractNum levels with the num's overrides applied), so
+    a paragraph's list item is found with dict lookups. The counters are
+    advanced as paragraphs are read, in document order.
+    """
+
+    def __init__(self):
+        self.lists: Dict[str, Tuple[Hashable, Tuple[ListLevel, ...]]] = {}  # numId -> (counter key, levels)
+        self.counters: Dict[Hashable, List[Optional[int]]] = {}  # Counter key -> current number per level
+
+    @classmethod
+    def from_element(cls, numbering_root, style_table: Optional[StyleTable] = None) -> 'NumberingTable':
+        """
+        Build the table from the root element of the numbering part
+
+        Args:
+            numbering_root: The w:numbering element (or None if the document has no lists)
+            style_table: Styles of the document, for lists defined through a numbering style
+
+        Returns:
+            NumberingTable: The resolved numbering table
+        """
+        table = cls()
+        if numbering_root is None:
+            return table
+
+        abstract_levels: Dict[str, Tuple[ListLevel, ...]] = {}
+        style_links: Dict[str, str] = {}
+        for abstract in numbering_root.iterchildren(W_ABSTRACT_NUM):
+            abstract_id = abstract.get(W_ABSTRACT_NUM_ID)
+            levels = [_DEFAULT_LEVEL] * LIST_LEVELS
+            for lvl in abstract.iterchildren(W_LVL):
+                level = _int_value_attribute(lvl, W_ILVL)
+                if 0 <= level < LIST_LEVELS:
+                    levels[level] = _read_level(lvl)
+            abstract_levels[abstract_id] = tuple(levels)
+
+            link = abstract.find(W_NUM_STYLE_LINK)
+            if link is not None:
+                style_links[abstract_id] = link.get(W_VAL)
+
+        abstract_of: Dict[str, str] = {}
+        overrides: Dict[str, list] = {}
+        for num in numbering_root.iterchildren(W_NUM):
+            num_id = num.get(W_NUM_ID)
+            abstract_of[num_id] = _string_value(num.find(W_ABSTRACT_NUM_ID))
+            overrides[num_id] = list(num.iterchildren(W_LVL_OVERRIDE))
+
+        # A numStyleLink borrows the levels of the list its numbering style references
+        if style_table is not None:
+            for abstract_id, style_id in style_links.items():
+                linked_num_id = style_table.list_references.get(style_id, NO_LIST)[0]
+                linked_abstract_id = abstract_of.get(linked_num_id)
+                if linked_abstract_id in abstract_levels:
+                    abstract_levels[abstract_id] = abstract_levels[linked_abstract_id]
+
+        for num_id, abstract_id in abstract_of.items():
+            levels = abstract_levels.get(abstract_id)
+            if levels is None:
+                continue
+            if not overrides[num_id]:
+                # Lists of the same abstractNum continue each other's numbering
+                table.lists[num_id] = (abstract_id, levels)
+                continue
+
+            # Overrides restart the numbering, so the list gets its own counter
+            levels = list(levels)
+            for override in overrides[num_id]:
+                level = _int_value_attribute(override, W_ILVL)
+                if not 0 <= level < LIST_LEVELS:
+                    continue
+                lvl = override.find(W_LVL)
+                if lvl is not None:
+                    levels[level] = _read_level(lvl, levels[level])
+                start = override.find(W_START_OVERRIDE)
+                if start is not None:
+                    levels[level] = (levels[level][0], int_value(start, levels[level][1]))
+            table.lists[num_id] = (('num', num_id), tuple(levels))
+
+        return table
+
+    def list_item(self, num_id: Optional[str], level: Optional[int]) -> Optional[Tuple[int, int]]:
+        """
+        Number the next item of a list
+
+        Call once per paragraph, in document order: the item advances the
+        counter of its level and restarts the deeper levels.
+
+        Args:
+            num_id: The numId of the paragraph (None or '0' for no list)
+            level: The level (ilvl) of the paragraph, 0 if None
+
+        Returns:
+            Optional[Tuple[int, int]]: The nesting depth (1 for the top level) and the
+            item number (0 for bullets), or None if the paragraph is no list item
+        """
+        entry = self.lists.get(num_id)
+        if entry is None:
+            return None
+        key, levels = entry
+        level = min(max(level or 0, 0), LIST_LEVELS - 1)
+        num_format, start = levels[level]
+
+        counters = self.counters.get(key)
+        if counters is None:
+            counters = self.counters[key] = [None] * LIST_LEVELS
+        number = start if counters[level] is None else counters[level] + 1
+        counters[level] = number
+        for deeper in range(level + 1, LIST_LEVELS):
+            counters[deeper] = None
+
+        if num_format == 'none':
+            # Numbered without a visible marker
+            return None
+        return level + 1, 0 if num_format == 'bullet' else number
+
+    def paragraph_list_item(self, paragraph, style_table: StyleTable) -> Optional[Tuple[int, int]]:
+        """
+        Number a w:p element if it is a list item
+
+        Args:
+            paragraph: A w:p element
+            style_table: Styles of the document (list styles such as 'List Bullet')
+
+        Returns:
+            Optional[Tuple[int, int]]: See list_item
+        """
+        p_pr = paragraph.find(W_PPR)
+        num_id = level = style_id = None
+        if p_pr is not None:
+            num_id, level = read_num_pr(p_pr.find(W_NUMPR))
+            p_style = p_pr.find(W_PSTYLE)
+            style_id = p_style.get(W_VAL) if p_style is not None else None
+
+        if num_id is None or level is None:
+            style_num_id, style_level = style_table.list_reference(style_id)
+            num_id = num_id if num_id is not None else style_num_id
+            level = level if level is not None else style_level
+
+        if num_id is None:
+            return None
+        return self.list_item(num_id, level)
+
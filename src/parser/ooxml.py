@@ -0,0 +1,242 @@
+"""
+Helpers for working with raw WordprocessingML elements.
+
+These mirror the text semantics of python-docx (``Paragraph.text``, ``Run.text``)
+so that parsers working on bare lxml elements produce the same content.
+"""
+import posixpath
+from typing import Dict, Optional, Tuple
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+WP_NS = 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+PKG_CT_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+
+NAMESPACES = {'w': W_NS, 'r': R_NS, 'a': A_NS, 'wp': WP_NS}
+
+RT_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+RT_STYLES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+RT_NUMBERING = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering'
+
+
+def qn(tag: str) -> str:
+    """
+    Convert a prefixed tag name (e.g. 'w:p') to Clark notation
+
+    Args:
+        tag: Tag name with a namespace prefix
+
+    Returns:
+        str: Tag name in '{namespace}local' form
+    """
+    prefix, local = tag.split(':')
+    return f'{{{NAMESPACES[prefix]}}}{local}'
+
+
+W_BODY = qn('w:body')
+W_P = qn('w:p')
+W_R = qn('w:r')
+W_TBL = qn('w:tbl')
+W_TR = qn('w:tr')
+W_TC = qn('w:tc')
+W_T = qn('w:t')
+W_TAB = qn('w:tab')
+W_PTAB = qn('w:ptab')
+W_BR = qn('w:br')
+W_CR = qn('w:cr')
+W_NO_BREAK_HYPHEN = qn('w:noBreakHyphen')
+W_HYPERLINK = qn('w:hyperlink')
+W_PPR = qn('w:pPr')
+W_RPR = qn('w:rPr')
+W_PSTYLE = qn('w:pStyle')
+W_RSTYLE = qn('w:rStyle')
+W_B = qn('w:b')
+W_I = qn('w:i')
+W_U = qn('w:u')
+W_STRIKE = qn('w:strike')
+W_NUMPR = qn('w:numPr')
+W_NUM_ID = qn('w:numId')
+W_ILVL = qn('w:ilvl')
+W_TCPR = qn('w:tcPr')
+W_GRID_SPAN = qn('w:gridSpan')
+W_VMERGE = qn('w:vMerge')
+W_VAL = qn('w:val')
+W_TYPE = qn('w:type')
+A_BLIP = qn('a:blip')
+R_EMBED = qn('r:embed')
+WP_INLINE = qn('wp:inline')
+WP_ANCHOR = qn('wp:anchor')
+WP_DOCPR = qn('wp:docPr')
+
+
+def on_off(element) -> Optional[bool]:
+    """
+    Read a boolean (ST_OnOff) property element such as w:b or w:i
+
+    Args:
+        element: The property element or None
+
+    Returns:
+        Optional[bool]: None if the element is absent, otherwise its value
+    """
+    if element is None:
+        return None
+    return element.get(W_VAL) not in ('0', 'false', 'off')
+
+
+def int_value(element, default: Optional[int]) -> Optional[int]:
+    """
+    Read the w:val attribute of a property element such as w:gridSpan as an integer
+
+    Args:
+        element: The property element or None
+        default: Value if the element is absent or its w:val is not an integer
+
+    Returns:
+        Optional[int]: The value
+    """
+    if element is None:
+        return default
+    try:
+        return int(element.get(W_VAL))
+    except (TypeError, ValueError):
+        return default
+
+
+def read_num_pr(num_pr) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Read the list reference of a w:numPr element
+
+    Args:
+        num_pr: A w:numPr element or None
+
+    Returns:
+        Tuple[Optional[str], Optional[int]]: The numId and the level (ilvl),
+        each None if not set
+    """
+    if num_pr is None:
+        return None, None
+    num_id = num_pr.find(W_NUM_ID)
+    return num_id.get(W_VAL) if num_id is not None else None, int_value(num_pr.find(W_ILVL), None)
+
+
+def run_text(run) -> str:
+    """
+    Get the text of a w:r element, translating tabs and breaks like python-docx
+
+    Args:
+        run: A w:r element
+
+    Returns:
+        str: Text content of the run
+    """
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or '')
+        elif tag == W_TAB or tag == W_PTAB:
+            parts.append('\t')
+        elif tag == W_BR:
+            if child.get(W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag == W_CR:
+            parts.append('\n')
+        elif tag == W_NO_BREAK_HYPHEN:
+            parts.append('-')
+    return ''.join(parts)
+
+
+def paragraph_text(paragraph) -> str:
+    """
+    Get the text of a w:p element including hyperlink runs
+
+    Args:
+        paragraph: A w:p element
+
+    Returns:
+        str: Text content of the paragraph
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == W_R:
+            parts.append(run_text(child))
+        elif child.tag == W_HYPERLINK:
+            parts.extend(run_text(run) for run in child if run.tag == W_R)
+    return ''.join(parts)
+
+
+def resolve_target(source_dir: str, target: str) -> str:
+    """
+    Resolve a relationship target to a package member name
+
+    Args:
+        source_dir: Directory of the part that owns the relationship (e.g. 'word')
+        target: Target reference from the relationship
+
+    Returns:
+        str: Member name inside the zip package (no leading slash)
+    """
+    if target.startswith('/'):
+        return posixpath.normpath(target.lstrip('/'))
+    return posixpath.normpath(posixpath.join(source_dir, target))
+
+
+def read_relationships(rels_root, source_dir: str) -> Dict[str, Dict[str, str]]:
+    """
+    Collect internal relationships from a parsed .rels part
+
+    Args:
+        rels_root: Root element of the .rels part
+        source_dir: Directory of the part that owns the relationships
+
+    Returns:
+        Dict[str, Dict[str, str]]: Map of rId to {'type': ..., 'target': member name}
+    """
+    relationships = {}
+    for rel in rels_root.iter(f'{{{PKG_REL_NS}}}Relationship'):
+        if rel.get('TargetMode') == 'External':
+            continue
+        relationships[rel.get('Id')] = {
+            'type': rel.get('Type'),
+            'target': resolve_target(source_dir, rel.get('Target')),
+        }
+    return relationships
+
+
+def read_content_types(types_root) -> Dict[str, str]:
+    """
+    Collect the content types declared in [Content_Types].xml
+
+    Args:
+        types_root: Root element of the [Content_Types].xml part
+
+    Returns:
+        Dict[str, str]: Map of member name (overrides) or lower-case extension
+        such as 'png' (defaults) to the content type
+    """
+    content_types = {}
+    for default in types_root.iter(f'{{{PKG_CT_NS}}}Default'):
+        content_types[default.get('Extension', '').lower()] = default.get('ContentType')
+    for override in types_root.iter(f'{{{PKG_CT_NS}}}Override'):
+        content_types[override.get('PartName', '').lstrip('/')] = override.get('ContentType')
+    return content_types
+
+
+def content_type_of(content_types: Dict[str, str], member: str) -> Optional[str]:
+    """
+    Look up the content type of a package member
+
+    Args:
+        content_types: Result of read_content_types()
+        member: Member name inside the zip package
+
+    Returns:
+        Optional[str]: The content type, or None if the package does not declare one
+    """
+    content_type = content_types.get(member)
+    if content_type is None:
+        content_type = content_types.get(posixpath.splitext(member)[1][1:].lower())
+    return content_type
@@ -0,0 +1,481 @@
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+import os
+import zipfile
+from functools import partial
+
+from lxml import etree
+
+from .. import tracing
+from ..models import Paragraph, Image, Table
+from .docx_parser import DocxParser
+from .drawings import Drawing, find_drawings
+from .media import CONTENT_TYPE_FORMATS, SIGNATURE_SIZE, image_format
+from .numbering import NumberingTable
+from .styles import StyleTable
+from .tables import extract_table
+from .ooxml import (
+    W_BODY, W_P, W_R, W_TBL, W_RPR, W_B, W_VAL,
+    RT_OFFICE_DOCUMENT, RT_STYLES, RT_NUMBERING, qn, on_off, run_text, paragraph_text,
+    read_relationships, read_content_types, content_type_of,
+)
+
+W_SZ = qn('w:sz')
+
+# Bytes read at a time when comparing two image parts
+IMAGE_COMPARE_CHUNK = 64 * 1024
+
+# A top-level block prepared for parsing in another process: the serialized
+# w:p or w:tbl element, and for paragraphs the list item and the images
+# (None if the paragraph has no pictures), which depend on the blocks before it
+BlockSource = Tuple[bytes, Optional[Tuple[int, int]], Optional[List[Image]]]
+
+
+class StreamingDocxParser(DocxParser):
+    """
+    Parser for DOCX files that streams word/document.xml with iterparse.
+    Produces the same document model as DocxParser without building the
+    python-docx object graph: each top-level paragraph or table is processed
+    as soon as it has been read and then discarded, and package parts
+    (styles, relationships, media) are opened only when needed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.package: Optional[zipfile.ZipFile] = None
+        self.relationships: Dict[str, Dict[str, str]] = {}
+        self.content_types: Dict[str, str] = {}  # Member name or extension -> content type
+
+    def iter_block_sources(self, docx_path: Union[str, BinaryIO]) -> Iterator[BlockSource]:
+        """
+        Read the blocks of a DOCX file for parsing in other processes
+
+        Only the work that depends on earlier blocks is done here (list
+        numbering, image names); parse_block_source does the rest. The package
+        is loaded before this returns, so a broken file fails at once.
+
+        Args:
+            docx_path: Path to the DOCX file
+
+        Returns:
+            Iterator[BlockSource]: The top-level blocks in document order
+        """
+        self.source_file = docx_path
+        self.image_names = {}
+        self.image_contents = {}
+        filename = os.path.basename(docx_path if isinstance(docx_path, str) else getattr(docx_path, 'name', ''))
+        blocks = self._iter_document(docx_path, filename, sources=True)
+        next(blocks)
+        return blocks
+
+    def parse_block_source(self, source: BlockSource) -> Optional[Paragraph]:
+        """
+        Parse a block read by iter_block_sources
+
+        Needs only the style table of the document.
+
+        Args:
+            source: The block
+
+        Returns:
+            Optional[Paragraph]: See _iter_document_stream (None for an empty paragraph)
+        """
+        xml, list_item, images = source
+        element = etree.fromstring(xml)
+        if element.tag == W_TBL:
+            model_paragraph = Paragraph()
+            model_paragraph.table = self._parse_table_element(element)
+            return model_paragraph
+        return self._build_paragraph(element, list_item, images)
+
+    def _iter_document(self, docx_path: Union[str, BinaryIO], filename: str,
+                       sources: bool = False) -> Iterator[Union[Paragraph, BlockSource, None]]:
+        """
+        Open a DOCX package and yield its paragraphs and tables in document order
+
+        The package stays open until the last block has been produced (or the
+        iteration is closed), so images can be inspected on demand.
+
+        Args:
+            docx_path: Path to the DOCX file
+            filename: Name of the file, recorded on the trace
+            sources: Yield the blocks as BlockSource instead of parsing them
+
+        Yields:
+            None once the package has been loaded, then each parsed paragraph
+            (tables are wrapped in a paragraph) or block source
+        """
+        with zipfile.ZipFile(docx_path) as package:
+            self.package = package
+            try:
+                # Ends before the first block, so it never includes the writer's time
+                with tracing.span('parse_document') as stage:
+                    stage.set('file', filename)
+                    stage.set('engine', 'stream')
+                    with tracing.span('load_package'):
+                        self._load_content_types()
+                        document_part = self._find_document_part()
+                        self._load_relationships(document_part)
+                        self._load_styles()
+                        self._load_numbering()
+
+                with package.open(document_part) as stream:
+                    blocks = self._iter_block_sources(stream) if sources else self._iter_document_stream(stream)
+                    yield None
+                    yield from blocks
+            finally:
+                self.package = None
+
+    def _read_xml(self, member: str):
+        """
+        Parse a small package part into an element tree
+
+        Args:
+            member: Member name inside the package
+
+        Returns:
+            The root element, or None if the part does not exist
+        """
+        try:
+            data = self.package.read(member)
+        except KeyError:
+            return None
+        return etree.fromstring(data)
+
+    def _load_content_types(self) -> None:
+        """
+        Load the content types declared by the package
+        """
+        types_root = self._read_xml('[Content_Types].xml')
+        self.content_types = read_content_types(types_root) if types_root is not None else {}
+
+    def _find_document_part(self) -> str:
+        """
+        Find the main document part through the package relationships
+
+        Returns:
+            str: Member name of the main document part
+        """
+        rels_root = self._read_xml('_rels/.rels')
+        if rels_root is not None:
+            for rel in read_relationships(rels_root, '').values():
+                if rel['type'] == RT_OFFICE_DOCUMENT:
+                    return rel['target']
+        return 'word/document.xml'
+
+    def _load_relationships(self, document_part: str) -> None:
+        """
+        Load the relationships of the main document part
+
+        Args:
+            document_part: Member name of the main document part
+        """
+        part_dir, part_name = os.path.split(document_part)
+        rels_root = self._read_xml(f"{part_dir}/_rels/{part_name}.rels")
+        self.relationships = read_relationships(rels_root, part_dir) if rels_root is not None else {}
+
+    def _load_styles(self) -> None:
+        """
+        Resolve paragraph styles from the styles part
+        """
+        styles_part = next((rel['target'] for rel in self.relationships.values()
+                            if rel['type'] == RT_STYLES), None)
+        self.style_table = StyleTable.from_element(self._read_xml(styles_part) if styles_part else None)
+
+    def _load_numbering(self) -> None:
+        """
+        Resolve the lists from the numbering part
+        """
+        numbering_part = next((rel['target'] for rel in self.relationships.values()
+                               if rel['type'] == RT_NUMBERING), None)
+        numbering_root = self._read_xml(numbering_part) if numbering_part else None
+        self.numbering = NumberingTable.from_element(numbering_root, self.style_table)
+
+    def _process_document_stream(self, stream) -> None:
+        """
+        Stream the document part and process top-level paragraphs and tables in order
+
+        Args:
+            stream: File-like object with the document XML
+        """
+        for paragraph in self._iter_document_stream(stream):
+            self.document.add_paragraph(paragraph)
+
+    def _iter_document_stream(self, stream) -> Iterator[Paragraph]:
+        """
+        Stream the document part and parse top-level paragraphs and tables in order
+
+        The body walk is traced as one span that leaves out the time the
+        consumer takes between elements (see tracing.iter_span).
+
+        Args:
+            stream: File-like object with the document XML
+
+        Returns:
+            Iterator over each non-empty paragraph, or a paragraph holding a table
+        """
+        return tracing.iter_span('process_elements', partial(self._parse_stream, stream))
+
+    def _parse_stream(self, stream, stage) -> Iterator[Paragraph]:
+        """Parse the document part for _iter_document_stream, counting on the given span"""
+        stage.count('paragraphs', 0)
+        stage.count('tables', 0)
+        for element in self._iter_body_elements(stream):
+            if element.tag == W_P:
+                parsed = self._parse_paragraph_element(element)
+                if parsed is not None:
+                    stage.count('paragraphs')
+            else:
+                parsed = Paragraph()
+                parsed.table = self._parse_table_element(element)
+                stage.count('tables')
+
+            if parsed is not None:
+                yield parsed
+
+    def _iter_block_sources(self, stream) -> Iterator[BlockSource]:
+        """
+        Stream the document part and serialize top-level paragraphs and tables in order
+
+        Args:
+            stream: File-like object with the document XML
+
+        Returns:
+            Iterator over each paragraph (empty ones included) and table
+        """
+        return tracing.iter_span('read_blocks', partial(self._read_stream_blocks, stream))
+
+    def _read_stream_blocks(self, stream, stage) -> Iterator[BlockSource]:
+        """Serialize the blocks of the document part for _iter_block_sources, counting on the given span"""
+        stage.count('blocks', 0)
+        for element in self._iter_body_elements(stream):
+            list_item = images = None
+            if element.tag == W_P:
+                # Empty list items still take their number
+                list_item = self._detect_list_item(element)
+                drawings = find_drawings(element)
+                if drawings:
+                    images = self._extract_element_images(drawings)
+            stage.count('blocks')
+            yield etree.tostring(element), list_item, images
+
+    def _iter_body_elements(self, stream) -> Iterator:
+        """
+        Stream the document part and yield its top-level w:p and w:tbl elements
+
+        Each element is freed, with everything read before it, once the
+        consumer asks for the next one.
+
+        Args:
+            stream: File-like object with the document XML
+
+        Yields:
+            Each top-level paragraph or table element
+        """
+        context = etree.iterparse(stream, events=('end',), tag=(W_P, W_TBL),
+                                  huge_tree=True, remove_blank_text=False)
+        for _, element in context:
+            parent = element.getparent()
+            if parent is None or parent.tag != W_BODY:
+                # Paragraphs nested in tables are handled with their table
+                continue
+
+            yield element
+
+            # Free the processed element and everything read before it
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+
+    def _parse_paragraph_element(self, element) -> Optional[Paragraph]:
+        """
+        Parse a w:p element
+
+        Args:
+            element: A w:p element
+
+        Returns:
+            Optional[Paragraph]: The parsed paragraph, or None if it is empty
+        """
+        drawings = find_drawings(element)
+        # Empty list items still take their number
+        list_item = self._detect_list_item(element)
+        images = self._extract_element_images(drawings) if drawings else None
+        return self._build_paragraph(element, list_item, images)
+
+    def _build_paragraph(self, element, list_item: Optional[Tuple[int, int]],
+                         images: Optional[List[Image]]) -> Optional[Paragraph]:
+        """
+        Build the paragraph of a w:p element from its numbered list item and images
+
+        Args:
+            element: A w:p element
+            list_item: The nesting depth and item number, or None if it is no list item
+            images: The images of the paragraph, or None if it has no pictures
+
+        Returns:
+            Optional[Paragraph]: The parsed paragraph, or None if it is empty
+        """
+        text = paragraph_text(element)
+        if not text.strip() and images is None:
+            return None
+
+        model_paragraph = Paragraph()
+        model_paragraph.text = text
+        if list_item is not None:
+            model_paragraph.list_level, model_paragraph.list_number = list_item
+
+        runs = [child for child in element if child.tag == W_R]
+
+        # Detect if it's a heading
+        model_paragraph.heading_level = self._detect_element_heading_level(element, runs, text)
+
+        # Extract formatting
+        model_paragraph.runs = self._extract_element_formatting(element, runs)
+
+        if images is not None:
+            model_paragraph.images = images
+
+        return model_paragraph
+
+    def _detect_element_heading_level(self, element, runs: List, text: str) -> int:
+        """
+        Detect the heading level of a w:p element
+
+        Args:
+            element: A w:p element
+            runs: The w:r children of the paragraph
+            text: Paragraph text
+
+        Returns:
+            int: The heading level (0 for normal paragraphs)
+        """
+        level = self.style_table.paragraph_heading_level(element)
+        if level > 0:
+            return level
+
+        if not runs or not text.strip():
+            return 0
+
+        run_info = []
+        for run in runs:
+            r_pr = run.find(W_RPR)
+            run_info.append((run_text(run), on_off(r_pr.find(W_B)) if r_pr is not None else None))
+
+        return self._heading_level_from_runs(run_info, text, self._get_element_font_size(runs[0]))
+
+    def _get_element_font_size(self, run) -> Optional[int]:
+        """
+        Get the directly applied font size of a w:r element
+
+        Args:
+            run: A w:r element
+
+        Returns:
+            Optional[int]: The font size in points or None if not set
+        """
+        r_pr = run.find(W_RPR)
+        size = r_pr.find(W_SZ) if r_pr is not None else None
+        if size is None:
+            return None
+        try:
+            return int(size.get(W_VAL)) // 2  # Convert half-points to points
+        except (TypeError, ValueError):
+            return None
+
+    def _extract_element_images(self, drawings: List[Drawing]) -> List[Image]:
+        """
+        Extract the images referenced from a paragraph
+
+        Args:
+            drawings: The picture references found in the paragraph
+
+        Returns:
+            List[Image]: The extracted images in document order
+        """
+        images = []
+
+        for drawing in drawings:
+            rel = self.relationships.get(drawing.rel_id)
+            if rel is None:
+                continue
+
+            try:
+                self.package.getinfo(rel['target'])
+            except KeyError:
+                # Dangling relationship, try the next image
+                continue
+
+            # The bytes stay in the package until a writer copies them
+            images.append(self._create_image(drawing, f"/{rel['target']}"))
+
+        return images
+
+    def _detect_image_format(self, file_path: str, content: Optional[bytes],
+                             content_type: Optional[str]) -> str:
+        """
+        Determine the format of an image part
+
+        Uses the declared content type and reads the first bytes of the
+        image only when the package does not declare a known image type.
+
+        Args:
+            file_path: Path of the image part inside the docx
+            content: Unused; the bytes stay in the package
+            content_type: Content type of the image part, if known
+
+        Returns:
+            str: The format, usable as file extension (e.g. 'png', 'jpg', 'emf')
+        """
+        member = file_path.lstrip('/')
+        content_type = content_type or content_type_of(self.content_types, member)
+        if content_type in CONTENT_TYPE_FORMATS:
+            return CONTENT_TYPE_FORMATS[content_type]
+
+        with self.package.open(member) as stream:
+            head = stream.read(SIGNATURE_SIZE)
+        return image_format(None, head, member)
+
+    def _image_content_key(self, file_path: str, content: Optional[bytes]) -> Optional[Tuple[int, int]]:
+        """
+        Compute a key identifying the content of an image part
+
+        Uses the CRC-32 and size stored in the package, so the image is not read.
+
+        Args:
+            file_path: Path of the image part inside the docx
+            content: Unused; the bytes stay in the package
+
+        Returns:
+            Optional[Tuple[int, int]]: The CRC-32 and uncompressed size
+        """
+        info = self.package.getinfo(file_path.lstrip('/'))
+        return info.CRC, info.file_size
+
+    def _same_image_content(self, file_path: str, other_path: str) -> bool:
+        """Compare two image parts whose CRC-32 and size match byte for byte"""
+        # In chunks, so large images are never held in memory whole
+        with self.package.open(file_path.lstrip('/')) as first, \
+                self.package.open(other_path.lstrip('/')) as second:
+            while True:
+                chunk = first.read(IMAGE_COMPARE_CHUNK)
+                if chunk != second.read(IMAGE_COMPARE_CHUNK):
+                    return False
+                if not chunk:
+                    return True
+
+    def _parse_table_element(self, element) -> Table:
+        """
+        Parse a w:tbl element
+
+        Args:
+            element: A w:tbl element
+
+        Returns:
+            Table: The parsed Table object
+        """
+        with tracing.span('parse_table') as stage:
+            model_table = extract_table(element)
+            stage.count('rows', model_table.num_rows)
+            stage.count('cells', sum(len(row) for row in model_table.rows))
+
+        return model_table
@@ -0,0 +1,355 @@
+import re
+from typing import Dict, Optional, Tuple
+
+from ..models.run import BOLD, ITALIC, UNDERLINE, STRIKE
+from .ooxml import W_PPR, W_PSTYLE, W_RPR, W_RSTYLE, W_B, W_I, W_U, W_STRIKE, W_VAL, W_NUMPR, qn, read_num_pr
+
+W_STYLE = qn('w:style')
+W_TYPE = qn('w:type')
+W_STYLE_ID = qn('w:styleId')
+W_DEFAULT = qn('w:default')
+W_NAME = qn('w:name')
+W_BASED_ON = qn('w:basedOn')
+W_OUTLINE_LVL = qn('w:outlineLvl')
+W_DOC_DEFAULTS = qn('w:docDefaults')
+W_RPR_DEFAULT = qn('w:rPrDefault')
+
+# Run properties that map to a formatting flag
+_RUN_FLAG_TAGS = {W_B: BOLD, W_I: ITALIC, W_U: UNDERLINE, W_STRIKE: STRIKE}
+
+# A run format: (flags the properties set, values of those flags)
+RunFormat = Tuple[int, int]
+NO_FORMAT: RunFormat = (0, 0)
+
+# A list reference from w:numPr: (numId, level), each None if not set
+ListReference = Tuple[Optional[str], Optional[int]]
+NO_LIST: ListReference = (None, None)
+
+# Outline level 9 means "body text" in WordprocessingML
+_BODY_TEXT_OUTLINE_LEVEL = 9
+
+# Heading style names as written by localized versions of Word
+_HEADING_NAME = re.compile(
+    r'^(heading|заголовок|überschrift|titre|título|titulo|titolo|kop|nagłówek|nadpis|'
+    r'rubrik|otsikko|overskrift|başlık|címsor|标题|見出し|제목)\s*(\d*)$',
+    re.IGNORECASE,
+)
+_SUBTITLE_NAME = re.compile(r'subtitle|подзаголовок', re.IGNORECASE)
+_TITLE_NAME = re.compile(r'title|название', re.IGNORECASE)
+
+
+def _heading_level_from_name(name: Optional[str]) -> Optional[int]:
+    """
+    Derive a heading level from a style name
+
+    Args:
+        name: Style name from w:name (e.g. 'heading 1', 'Заголовок 2', 'Title')
+
+    Returns:
+        Optional[int]: The heading level, or None if the name says nothing about it
+    """
+    if not name:
+        return None
+
+    match = _HEADING_NAME.match(name.strip())
+    if match:
+        return int(match.group(2)) if match.group(2) else 1
+
+    if _SUBTITLE_NAME.search(name):
+        return 2
+    if _TITLE_NAME.search(name):
+        return 1
+
+    return None
+
+
+def _outline_level(element) -> Optional[int]:
+    """
+    Read w:outlineLvl from a pPr element as a heading level
+
+    Args:
+        element: A w:pPr element or None
+
+    Returns:
+        Optional[int]: 1-9 for outline levels 0-8, 0 for body text, None if not set
+    """
+    if element is None:
+        return None
+    outline = element.find(W_OUTLINE_LVL)
+    if outline is None:
+        return None
+    try:
+        level = int(outline.get(W_VAL))
+    except (TypeError, ValueError):
+        return None
+    return 0 if level >= _BODY_TEXT_OUTLINE_LEVEL else level + 1
+
+
+def read_run_format(r_pr) -> Tuple[int, int, Optional[str]]:
+    """
+    Read the formatting of a w:rPr element in one pass over its children
+
+    Args:
+        r_pr: A w:rPr element or None
+
+    Returns:
+        Tuple[int, int, Optional[str]]: Flags the element sets, their values,
+        and the character style (w:rStyle) if any
+    """
+    mask = value = 0
+    style_id = None
+    if r_pr is None:
+        return mask, value, style_id
+
+    for child in r_pr:
+        tag = child.tag
+        flag = _RUN_FLAG_TAGS.get(tag)
+        if flag is not None:
+            mask |= flag
+            if tag == W_U:
+                on = child.get(W_VAL) != 'none'
+            else:
+                on = child.get(W_VAL) not in ('0', 'false', 'off')
+            if on:
+                value |= flag
+        elif tag == W_RSTYLE:
+            style_id = child.get(W_VAL)
+
+    return mask, value, style_id
+
+
+def apply_run_format(flags: int, run_format: RunFormat) -> int:
+    """Apply a run format on top of inherited formatting flags"""
+    mask, value = run_format
+    return (flags & ~mask) | value
+
+
+def _merge_run_formats(base: RunFormat, override: RunFormat) -> RunFormat:
+    """Combine a run format with one that overrides it"""
+    return base[0] | override[0], apply_run_format(base[1], override)
+
+
+class StyleTable:
+    """
+    Paragraph styles of a document resolved once into a compact lookup.
+    Maps each styleId to its effective heading level, following the
+    basedOn chain and honouring w:outlineLvl, to the run formatting
+    (bold, italic, ...) it passes on to text, merged with the document
+    defaults for paragraph styles, and to the list it numbers paragraphs
+    with (e.g. 'List Bullet').
+    """
+
+    def __init__(self):
+        self.heading_levels: Dict[str, int] = {}     # styleId -> heading level (0 for body text)
+        self.names: Dict[str, Optional[str]] = {}    # styleId -> style name
+        self.default_style_id: Optional[str] = None  # Default paragraph style
+        self.paragraph_flags: Dict[str, int] = {}    # Paragraph styleId -> formatting flags of its text
+        self.character_formats: Dict[str, RunFormat] = {}  # Character styleId -> run format
+        self.default_flags: int = 0                  # Formatting flags of the document defaults
+        self.list_references: Dict[str, ListReference] = {}  # Paragraph or numbering styleId -> list
+
+    @classmethod
+    def from_element(cls, styles_root) -> 'StyleTable':
+        """
+        Build the table from the root element of the styles part
+
+        Args:
+            styles_root: The w:styles element (or None if the document has no styles)
+
+        Returns:
+            StyleTable: The resolved style table
+        """
+        table = cls()
+        if styles_root is None:
+            return table
+
+        own_levels: Dict[str, Optional[int]] = {}
+        based_on: Dict[str, Optional[str]] = {}
+        own_formats: Dict[str, RunFormat] = {}
+        character_styles = []
+
+        own_lists: Dict[str, ListReference] = {}
+
+        for style in styles_root.iter(W_STYLE):
+            style_type = style.get(W_TYPE)
+            if style_type == 'numbering':
+                p_pr = style.find(W_PPR)
+                if p_pr is not None:
+                    table.list_references[style.get(W_STYLE_ID)] = read_num_pr(p_pr.find(W_NUMPR))
+                continue
+            if style_type not in ('paragraph', 'character'):
+                continue
+
+            style_id = style.get(W_STYLE_ID)
+            parent = style.find(W_BASED_ON)
+            based_on[style_id] = parent.get(W_VAL) if parent is not None else None
+            own_formats[style_id] = read_run_format(style.find(W_RPR))[:2]
+
+            if style_type == 'character':
+                character_styles.append(style_id)
+                continue
+
+            name_element = style.find(W_NAME)
+            name = name_element.get(W_VAL) if name_element is not None else None
+            table.names[style_id] = name
+
+            if style.get(W_DEFAULT) in ('1', 'true', 'on'):
+                table.default_style_id = style_id
+
+            # An explicit outline level wins over what the name suggests
+            p_pr = style.find(W_PPR)
+            level = _outline_level(p_pr)
+            own_levels[style_id] = level if level is not None else _heading_level_from_name(name)
+            if p_pr is not None:
+                num_pr = p_pr.find(W_NUMPR)
+                if num_pr is not None:
+                    own_lists[style_id] = read_num_pr(num_pr)
+
+        for style_id in own_levels:
+            table.heading_levels[style_id] = cls._resolve_level(style_id, own_levels, based_on)
+            list_reference = cls._resolve_list(style_id, own_lists, based_on)
+            if list_reference is not NO_LIST:
+                table.list_references[style_id] = list_reference
+
+        # Formatting is resolved once per style, not once per run
+        defaults = styles_root.find(W_DOC_DEFAULTS)
+        r_pr_default = defaults.find(W_RPR_DEFAULT) if defaults is not None else None
+        default_format = read_run_format(r_pr_default.find(W_RPR) if r_pr_default is not None else None)
+        table.default_flags = apply_run_format(0, default_format[:2])
+
+        for style_id in own_levels:
+            run_format = cls._resolve_run_format(style_id, own_formats, based_on)
+            table.paragraph_flags[style_id] = apply_run_format(table.default_flags, run_format)
+        for style_id in character_styles:
+            table.character_formats[style_id] = cls._resolve_run_format(style_id, own_formats, based_on)
+
+        return table
+
+    @staticmethod
+    def _resolve_level(style_id: str, own_levels: Dict[str, Optional[int]],
+                       based_on: Dict[str, Optional[str]]) -> int:
+        """Follow the basedOn chain until a style defines a heading level"""
+        seen = set()
+        while style_id is not None and style_id not in seen:
+            seen.add(style_id)
+            level = own_levels.get(style_id)
+            if level is not None:
+                return level
+            style_id = based_on.get(style_id)
+        return 0
+
+    @staticmethod
+    def _resolve_list(style_id: str, own_lists: Dict[str, ListReference],
+                      based_on: Dict[str, Optional[str]]) -> ListReference:
+        """Follow the basedOn chain until a style references a list"""
+        seen = set()
+        while style_id is not None and style_id not in seen:
+            seen.add(style_id)
+            list_reference = own_lists.get(style_id)
+            if list_reference is not None:
+                return list_reference
+            style_id = based_on.get(style_id)
+        return NO_LIST
+
+    @staticmethod
+    def _resolve_run_format(style_id: str, own_formats: Dict[str, RunFormat],
+                            based_on: Dict[str, Optional[str]]) -> RunFormat:
+        """Merge the run formats along the basedOn chain, the style itself winning"""
+        chain = []
+        while style_id is not None and style_id not in chain:
+            chain.append(style_id)
+            style_id = based_on.get(style_id)
+
+        run_format = NO_FORMAT
+        for ancestor in reversed(chain):
+            run_format = _merge_run_formats(run_format, own_formats.get(ancestor, NO_FORMAT))
+        return run_format
+
+    def heading_level(self, style_id: Optional[str]) -> int:
+        """
+        Get the heading level of a paragraph style
+
+        Args:
+            style_id: The styleId, or None for the default paragraph style
+
+        Returns:
+            int: The heading level (0 for body text)
+        """
+        level = self.heading_levels.get(style_id)
+        if level is None:
+            # Unknown or missing styles fall back to the default paragraph style
+            level = self.heading_levels.get(self.default_style_id, 0)
+        return level
+
+    def paragraph_heading_level(self, paragraph) -> int:
+        """
+        Get the heading level of a w:p element from its style and outline level
+
+        Args:
+            paragraph: A w:p element
+
+        Returns:
+            int: The heading level (0 for body text)
+        """
+        p_pr = paragraph.find(W_PPR)
+        if p_pr is None:
+            return self.heading_level(None)
+
+        level = _outline_level(p_pr)
+        if level is not None:
+            return level
+
+        p_style = p_pr.find(W_PSTYLE)
+        return self.heading_level(p_style.get(W_VAL) if p_style is not None else None)
+
+    def list_reference(self, style_id: Optional[str]) -> ListReference:
+        """
+        Get the list a paragraph style numbers its paragraphs with
+
+        Args:
+            style_id: The styleId, or None for the default paragraph style
+
+        Returns:
+            ListReference: (numId, level), NO_LIST if the style is no list style
+        """
+        list_reference = self.list_references.get(style_id)
+        if list_reference is None and style_id not in self.heading_levels:
+            # Unknown or missing styles fall back to the default paragraph style
+            list_reference = self.list_references.get(self.default_style_id)
+        return list_reference or NO_LIST
+
+    def paragraph_run_flags(self, paragraph) -> int:
+        """
+        Get the formatting flags that the style of a w:p element gives its text
+
+        Args:
+            paragraph: A w:p element
+
+        Returns:
+            int: Combination of BOLD, ITALIC, UNDERLINE and STRIKE
+        """
+        p_pr = paragraph.find(W_PPR)
+        p_style = p_pr.find(W_PSTYLE) if p_pr is not None else None
+        flags = self.paragraph_flags.get(p_style.get(W_VAL)) if p_style is not None else None
+        if flags is None:
+            # Unknown or missing styles fall back to the default paragraph style
+            flags = self.paragraph_flags.get(self.default_style_id, self.default_flags)
+        return flags
+
+    def run_flags(self, paragraph_flags: int, r_pr) -> int:
+        """
+        Get the effective formatting flags of a run
+
+        Args:
+            paragraph_flags: Flags inherited from the paragraph (see paragraph_run_flags)
+            r_pr: The w:rPr element of the run, or None
+
+        Returns:
+            int: The flags after the character style and direct formatting
+        """
+        if r_pr is None:
+            return paragraph_flags
+        mask, value, style_id = read_run_format(r_pr)
+        if style_id is not None:
+            paragraph_flags = apply_run_format(paragraph_flags, self.character_formats.get(style_id, NO_FORMAT))
+        return (paragraph_flags & ~mask) | value
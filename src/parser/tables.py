@@ -0,0 +1,119 @@
+"""
+Table extraction straight from w:tbl elements.
+
+Walks w:tr/w:tc once, in linear time, instead of going through python-docx's
+row.cells (which rebuilds the cell grid for every row). The produced rows
+match python-docx: a horizontally merged cell repeats its text for every
+grid column it spans, and a vertically merged cell repeats the text of the
+cell where the merge starts. Spans are additionally recorded on the Table,
+at the grid column where the merged cell starts. That column differs from the
+index in the row when the row begins with w:gridBefore, whose empty columns
+the rows leave out.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from ..models import Table
+from .ooxml import W_P, W_TR, W_TC, W_TCPR, W_GRID_SPAN, W_VMERGE, W_VAL, qn, int_value, paragraph_text
+
+W_TRPR = qn('w:trPr')
+W_GRID_BEFORE = qn('w:gridBefore')
+
+
+def cell_merge_info(tc) -> Tuple[int, Optional[str]]:
+    """
+    Read the horizontal span and vertical merge state of a w:tc element
+
+    Args:
+        tc: A w:tc element
+
+    Returns:
+        Tuple[int, Optional[str]]: Grid span and vMerge value ('restart', 'continue' or None)
+    """
+    tc_pr = tc.find(W_TCPR)
+    if tc_pr is None:
+        return 1, None
+
+    span = max(1, int_value(tc_pr.find(W_GRID_SPAN), 1))
+
+    v_merge = tc_pr.find(W_VMERGE)
+    merge_state = None
+    if v_merge is not None:
+        merge_state = v_merge.get(W_VAL, 'continue')
+
+    return span, merge_state
+
+
+def _grid_before(tr) -> int:
+    """Number of empty grid columns before the first cell of a w:tr element"""
+    tr_pr = tr.find(W_TRPR)
+    if tr_pr is None:
+        return 0
+    return max(0, int_value(tr_pr.find(W_GRID_BEFORE), 0))
+
+
+def cell_text(tc) -> str:
+    """
+    Get the text of a w:tc element like python-docx's cell.text
+
+    Args:
+        tc: A w:tc element
+
+    Returns:
+        str: Text of the cell's own paragraphs (nested tables excluded), one per line
+    """
+    return "\n".join(paragraph_text(p) for p in tc if p.tag == W_P)
+
+
+def extract_table(tbl) -> Table:
+    """
+    Build a Table from a w:tbl element
+
+    Args:
+        tbl: A w:tbl element
+
+    Returns:
+        Table: The table with one text per grid column and the spans of merged cells
+        (keyed by row and grid column)
+    """
+    table = Table()
+    # Grid column -> (text, origin) of the cell covering it in the previous row;
+    # origins are (row, grid column), so rows with w:gridBefore line up
+    above: Dict[int, Tuple[str, Tuple[int, int]]] = {}
+
+    for tr in tbl.iterchildren(W_TR):
+        row_index = table.num_rows
+        row: List[str] = []
+        grid_column = _grid_before(tr)
+        current: Dict[int, Tuple[str, Tuple[int, int]]] = {}
+
+        for tc in tr.iterchildren(W_TC):
+            span, v_merge = cell_merge_info(tc)
+
+            if v_merge == 'continue' and grid_column in above:
+                # Part of a vertical merge: reuse the text of the cell where it starts
+                text, origin = above[grid_column]
+                row_span, col_span = table.get_span(*origin)
+                table.set_span(origin[0], origin[1], row_span + 1, col_span)
+            else:
+                # The text is computed once, however many grid columns the cell covers
+                text = "" if v_merge == 'continue' else cell_text(tc)
+                origin = (row_index, grid_column)
+                if span > 1:
+                    table.set_span(origin[0], origin[1], 1, span)
+
+            for offset in range(span):
+                current[grid_column + offset] = (text, origin)
+                row.append(text)
+            grid_column += span
+
+        above = current
+        table.add_row(row)
+
+    # The first row is typically a header in markdown
+    table.header = True
+
+    # Set default alignments (left for all columns)
+    for i in range(table.num_cols):
+        table.set_column_alignment(i, 'left')
+
+    return table
@@ -0,0 +1,411 @@
+"""
+Local HTTP conversion service.
+
+    python -m src.main serve --port 8000 --workers 4
+
+POST a .docx body to /convert and get the converted output back:
+
+    curl --data-binary @report.docx 'http://127.0.0.1:8000/convert?name=report&format=zip' -o report.zip
+
+Query parameters: name (base name of the output, default 'document'),
+format ('zip', 'tar' or 'md'), engine, image_sizes and align_tables.
+GET /health reports the pool state.
+
+Conversions run in a process pool that is forked when the server starts.
+The upload never touches the disk: workers parse it from memory and return
+the output bytes. The output is therefore buffered and sent with a
+Content-Length; it is about as large as the upload, which max_size bounds.
+The server accepts at most workers + queue_size requests at a time and
+answers 503 to the rest instead of queueing unlimited work. A conversion that
+times out cannot be stopped in its worker, so it keeps its slot until the
+worker is done with it. Bodies above the size limit get 413. With --max-memory, each worker has a
+memory budget (see src/memory.py): a conversion that would exceed it fails
+with 422 and the worker keeps serving. If a worker dies anyway, its request
+gets 500 and the pool is replaced for the requests after it.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .memory import MemoryBudget, limit_process_memory
+from .parser import PARSER_ENGINES
+from .writer import MarkdownWriter, BytesSink, CheckedSink
+from .writer.sinks import STREAM_FORMATS
+
+# Default size limit of a request body
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# Default number of seconds a conversion may take before the request fails
+DEFAULT_TIMEOUT = 300
+
+# Response content types of the output formats
+CONTENT_TYPES = {
+    'zip': 'application/zip',
+    'tar': 'application/x-tar',
+    'md': 'text/markdown; charset=utf-8',
+}
+
+_RESPONSE_CHUNK_SIZE = 256 * 1024
+
+_TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+
+def _ready() -> int:
+    """Trivial task that makes the pool start a worker"""
+    return os.getpid()
+
+
+def convert_bytes(data: bytes, name: str = 'document', output_format: str = 'zip', engine: str = 'docx',
+                  sized_images: bool = False, align_tables: bool = False,
+                  max_memory: Optional[int] = None) -> bytes:
+    """
+    Convert DOCX bytes to Markdown output bytes, entirely in memory
+
+    Runs inside the worker processes, so it must stay a module-level function.
+
+    Args:
+        data: Content of the DOCX file
+        name: Base name of the output (names the .md file and media folder)
+        output_format: 'zip', 'tar' or 'md'
+        engine: Parser engine to use
+        sized_images: Whether to add the picture size to image references
+        align_tables: Whether to pad table cells so the columns line up
+        max_memory: Optional memory budget of the worker in bytes
+
+    Returns:
+        bytes: The archive, or the Markdown text for 'md'
+    """
+    budget = MemoryBudget(max_memory) if max_memory else None
+    with budget or contextlib.nullcontext():
+        if budget is not None:
+            budget.check_input(io.BytesIO(data), engine)
+        document = PARSER_ENGINES[engine]().parse_document(io.BytesIO(data), lazy=True)
+        writer = MarkdownWriter(sized_images=sized_images, align_tables=align_tables)
+        sink = BytesSink(output_format)
+        if budget is not None:
+            sink = CheckedSink(sink, budget.check)
+        try:
+            return writer.write_document(document, name, sink)
+        finally:
+            document.paragraphs.close()
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """
+    HTTP server that hands conversions to a pre-forked process pool.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], workers: Optional[int] = None, queue_size: Optional[int] = None,
+                 max_size: int = DEFAULT_MAX_SIZE, timeout: float = DEFAULT_TIMEOUT, engine: str = 'docx',
+                 quiet: bool = False, max_memory: Optional[int] = None):
+        """
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port
+            workers: Number of worker processes (default: CPU count)
+            queue_size: Requests that may wait for a worker (default: twice the workers)
+            max_size: Largest accepted request body in bytes
+            timeout: Seconds a conversion may take before the request fails with 504
+            engine: Default parser engine
+            quiet: Whether to suppress the request log
+            max_memory: Optional memory budget of each worker in bytes
+        """
+        self.workers: int = max(1, workers or os.cpu_count() or 1)
+        self.queue_size: int = max(0, queue_size if queue_size is not None else 2 * self.workers)
+        self.max_size: int = max_size
+        self.conversion_timeout: float = timeout
+        self.engine: str = engine
+        self.quiet: bool = quiet
+        self.max_memory: Optional[int] = max_memory
+        # One slot per request being converted or waiting for a worker
+        self.slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self.in_flight: int = 0
+        self._lock = threading.Lock()
+
+        # Fork the workers before any request thread exists
+        self.pool: ProcessPoolExecutor = self._create_pool()
+        for future in [self.pool.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+
+        try:
+            super().__init__(address, ConversionRequestHandler)
+        except BaseException:
+            # The socket could not be bound (port in use, permissions)
+            self.pool.shutdown(wait=True)
+            raise
+
+    def convert(self, data: bytes, **options) -> bytes:
+        """
+        Run a conversion in the pool and wait for its output
+
+        Takes over the slot reserved for the request and releases it once the
+        conversion is over. After a timeout that is when the worker finishes
+        it, so a stuck conversion keeps counting against the limit.
+        """
+        with self._lock:
+            self.in_flight += 1
+        running = False
+        try:
+            pool = self.pool
+            try:
+                future = pool.submit(convert_bytes, data, max_memory=self.max_memory, **options)
+            except BrokenProcessPool:
+                # A worker died since the last conversion; nothing ran yet, so retry on a new pool
+                pool = self._replace_pool(pool)
+                future = pool.submit(convert_bytes, data, max_memory=self.max_memory, **options)
+            try:
+                return future.result(timeout=self.conversion_timeout)
+            except BrokenProcessPool:
+                self._replace_pool(pool)
+                raise
+            except FutureTimeoutError:
+                # cancel() only drops conversions that have not started yet
+                running = not future.cancel()
+                if running:
+                    future.add_done_callback(lambda _: self._end_conversion())
+                raise
+        finally:
+            if not running:
+                self._end_conversion()
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        """Create the worker pool, with the memory limit of each worker"""
+        initializer, initargs = (limit_process_memory, (self.max_memory,)) if self.max_memory else (None, ())
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=initializer, initargs=initargs)
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """
+        Replace a pool whose worker died (e.g. killed over its memory limit)
+
+        Args:
+            broken: The pool that failed; if another request replaced it already, that pool is kept
+
+        Returns:
+            ProcessPoolExecutor: The current pool
+        """
+        with self._lock:
+            if self.pool is broken:
+                self.pool = self._create_pool()
+                broken.shutdown(wait=False)
+            return self.pool
+
+    def _end_conversion(self) -> None:
+        """Free the slot of a finished conversion"""
+        with self._lock:
+            self.in_flight -= 1
+        self.slots.release()
+
+    def server_close(self) -> None:
+        super().server_close()
+        if sys.version_info >= (3, 9):
+            self.pool.shutdown(wait=True, cancel_futures=True)
+        else:
+            self.pool.shutdown(wait=True)
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles /convert and /health requests of a ConversionServer.
+    """
+
+    server: ConversionServer
+    protocol_version = 'HTTP/1.1'
+
+    # State of the current POST request, set by _admit()
+    _admitted: bool = False
+    _options: dict = {}
+    _length: int = 0
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path != '/health':
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+        server = self.server
+        self._send_json(HTTPStatus.OK, {
+            "status": "ok",
+            "workers": server.workers,
+            "queue_size": server.queue_size,
+            "in_flight": server.in_flight,
+        })
+
+    def handle_expect_100(self) -> bool:
+        """Answer 'Expect: 100-continue' with the final error when the upload would be refused"""
+        if self.command != 'POST' or self._admit():
+            return super().handle_expect_100()
+        return False
+
+    def do_POST(self) -> None:
+        if not self._admitted and not self._admit():
+            return
+        self._admitted = False
+        try:
+            data = self.rfile.read(self._length)
+        except BaseException:
+            self.server.slots.release()
+            raise
+        if len(data) != self._length:
+            self.server.slots.release()
+            self._send_error(HTTPStatus.BAD_REQUEST, "Incomplete body", close=True)
+            return
+
+        # The conversion releases the slot
+        try:
+            output = self.server.convert(data, **self._options)
+        except FutureTimeoutError:
+            self._send_error(HTTPStatus.GATEWAY_TIMEOUT, "Conversion timed out")
+            return
+        except BrokenProcessPool:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, "Worker pool failed")
+            return
+        except Exception as e:
+            self._send_error(HTTPStatus.UNPROCESSABLE_ENTITY, f"Conversion failed: {type(e).__name__}: {e}")
+            return
+
+        extension = self._options['output_format']
+        self._send_bytes(HTTPStatus.OK, output, CONTENT_TYPES[extension], {
+            'Content-Disposition': f'attachment; filename="{self._options["name"]}.{extension}"',
+        })
+
+    def _admit(self) -> bool:
+        """
+        Check a conversion request before its body is read and reserve a slot for it
+
+        Sends the error response itself when the request is refused.
+
+        Returns:
+            bool: True if the request was admitted
+        """
+        self._admitted = False
+        url = urlsplit(self.path)
+        if self.command != 'POST' or url.path != '/convert':
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found", close=True)
+            return False
+
+        self._options, error = self._conversion_options(parse_qs(url.query))
+        if error:
+            self._send_error(HTTPStatus.BAD_REQUEST, error, close=True)
+            return False
+
+        # Check the size before reading anything
+        length = self.headers.get('Content-Length')
+        if length is None or not length.isdigit():
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "Content-Length is required", close=True)
+            return False
+        self._length = int(length)
+        if self._length > self.server.max_size:
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                             f"Body exceeds the limit of {self.server.max_size} bytes", close=True)
+            return False
+
+        # Refuse work instead of queueing it without bound
+        if not self.server.slots.acquire(blocking=False):
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, "Server busy, retry later", close=True,
+                             headers={'Retry-After': '1'})
+            return False
+
+        self._admitted = True
+        return True
+
+    def _conversion_options(self, query: Dict[str, list]) -> Tuple[dict, str]:
+        """
+        Read the conversion options from the query string
+
+        Returns:
+            Tuple[dict, str]: The options, and an error message ("" if they are valid)
+        """
+        def value(key: str, default: str) -> str:
+            return query.get(key, [default])[-1]
+
+        # Only a plain ASCII base name, so it cannot leave the archive or break the headers
+        name = re.sub(r'[^A-Za-z0-9_.-]', '_', os.path.basename(value('name', 'document')))
+        name = re.sub(r'\.docx$', '', name, flags=re.IGNORECASE).lstrip('.') or 'document'
+
+        options = {
+            'name': name,
+            'output_format': value('format', 'zip'),
+            'engine': value('engine', self.server.engine),
+            'sized_images': value('image_sizes', '').lower() in _TRUE_VALUES,
+            'align_tables': value('align_tables', '').lower() in _TRUE_VALUES,
+        }
+        if options['output_format'] not in STREAM_FORMATS:
+            return options, f"Unknown format (expected one of {', '.join(STREAM_FORMATS)})"
+        if options['engine'] not in PARSER_ENGINES:
+            return options, f"Unknown engine (expected one of {', '.join(sorted(PARSER_ENGINES))})"
+        return options, ""
+
+    def _send_bytes(self, status: HTTPStatus, body: bytes, content_type: str,
+                    headers: Optional[Dict[str, str]] = None, close: bool = False) -> None:
+        """Send a complete response, writing the body in chunks"""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, header_value in (headers or {}).items():
+            self.send_header(key, header_value)
+        if close:
+            # The unread body would otherwise be taken for the next request
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+
+        view = memoryview(body)
+        for offset in range(0, len(view), _RESPONSE_CHUNK_SIZE):
+            self.wfile.write(view[offset:offset + _RESPONSE_CHUNK_SIZE])
+
+    def _send_json(self, status: HTTPStatus, payload: dict, **kwargs) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self._send_bytes(status, body, 'application/json', **kwargs)
+
+    def _send_error(self, status: HTTPStatus, message: str, **kwargs) -> None:
+        self._send_json(status, {"error": message}, **kwargs)
+
+    def log_message(self, format: str, *args) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def main(argv=None) -> None:
+    """CLI entry point of the 'serve' subcommand"""
+    parser = argparse.ArgumentParser(prog='main.py serve', description='Run a local HTTP conversion service')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on (default: %(default)s)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--queue-size', type=int, default=None,
+                        help='Requests that may wait for a worker before new ones get 503 '
+                             '(default: twice the workers)')
+    parser.add_argument('--max-size', type=int, default=DEFAULT_MAX_SIZE // (1024 * 1024),
+                        help='Largest accepted upload in MiB (default: %(default)s)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='Seconds a conversion may take (default: %(default)s)')
+    parser.add_argument('--engine', choices=sorted(PARSER_ENGINES), default='docx',
+                        help='Default parser engine')
+    parser.add_argument('--max-memory', type=int, metavar='MIB',
+                        help='Memory budget of each worker in MiB; conversions that would exceed it fail '
+                             'with 422 (best with --engine stream)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Do not log requests')
+    args = parser.parse_args(argv)
+
+    server = ConversionServer((args.host, args.port), workers=args.workers, queue_size=args.queue_size,
+                              max_size=args.max_size * 1024 * 1024, timeout=args.timeout,
+                              engine=args.engine, quiet=args.quiet,
+                              max_memory=args.max_memory * 1024 * 1024 if args.max_memory else None)
+    host, port = server.server_address[:2]
+    print(f"Serving on http://{host}:{port} with {server.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
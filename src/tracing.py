@@ -0,0 +1,251 @@
+"""
+Lightweight tracing of conversion stages.
+
+Code is instrumented with named spans:
+
+    with tracing.span('parse_table') as span:
+        ...
+        span.count('rows', len(rows))
+
+Work done by a generator between its items (e.g. parsing blocks of a lazily
+parsed document) is timed with iter_span(), which leaves out the time the
+consumer spends on each item.
+
+Tracing is off by default; span() then returns a shared no-op object, so
+instrumented code costs one function call per span. Enabling tracing with an
+exporter (a callback or a JsonLinesExporter) delivers every finished span.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO, TypeVar, Union
+
+T = TypeVar('T')
+
+
+class Span:
+    """
+    A timed stage of a conversion with item counts.
+    """
+
+    __slots__ = ('name', 'parent', 'start', 'duration', 'counts', 'attributes', '_tracer')
+
+    def __init__(self, name: str, parent: Optional['Span'], tracer: 'Tracer'):
+        self.name: str = name                      # Stage name (e.g. 'parse_document')
+        self.parent: Optional[Span] = parent       # Enclosing span, None for a root span
+        self.start: float = 0.0                    # Start time (time.perf_counter)
+        self.duration: float = 0.0                 # Duration in seconds, set when the span ends
+        self.counts: Dict[str, int] = {}           # Items processed (paragraphs, rows, ...)
+        self.attributes: Dict[str, Any] = {}       # Other details (file name, engine, ...)
+        self._tracer = tracer
+
+    def count(self, key: str, amount: int = 1) -> None:
+        """Add to an item count of the span"""
+        self.counts[key] = self.counts.get(key, 0) + amount
+
+    def set(self, key: str, value: Any) -> None:
+        """Set an attribute of the span"""
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        """Return the span as a plain dictionary (e.g. for JSON export)"""
+        return {
+            "name": self.name,
+            "parent": self.parent.name if self.parent is not None else None,
+            "start": self.start,
+            "duration": self.duration,
+            "counts": self.counts,
+            "attributes": self.attributes,
+            "pid": os.getpid(),
+        }
+
+    def __enter__(self) -> 'Span':
+        self._tracer._push(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self._tracer._pop(self)
+
+    def _next(self, items: Iterator[T]) -> T:
+        """Produce the next item of an iter_span() generator inside the span"""
+        self._tracer._push(self)
+        started = time.perf_counter()
+        if not self.start:
+            self.start = started
+        try:
+            return next(items)
+        except StopIteration:
+            raise
+        except Exception as error:
+            self.attributes["error"] = type(error).__name__
+            raise
+        finally:
+            self.duration += time.perf_counter() - started
+            self._tracer._pop(self, export=False)
+
+
+class _NullSpan:
+    """Span used while tracing is disabled; does nothing"""
+
+    __slots__ = ()
+
+    def count(self, key: str, amount: int = 1) -> None:
+        pass
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Creates spans, tracks their nesting per thread and exports finished spans.
+    """
+
+    def __init__(self, exporter: Callable[[Span], None]):
+        self.exporter: Callable[[Span], None] = exporter  # Receives each finished span
+        self._local = threading.local()
+
+    def span(self, name: str) -> Span:
+        """Create a span nested in the currently open span"""
+        stack = self._stack()
+        return Span(name, stack[-1] if stack else None, self)
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, span: Span) -> None:
+        self._stack().append(span)
+
+    def _pop(self, span: Span, export: bool = True) -> None:
+        # Spans opened in generators (lazy parsing) can end out of order
+        stack = self._stack()
+        for index in range(len(stack) - 1, -1, -1):
+            if stack[index] is span:
+                del stack[index]
+                break
+        if export:
+            self.exporter(span)
+
+
+class JsonLinesExporter:
+    """
+    Writes each finished span as one JSON object per line.
+    The target can be a path (opened for appending, so several processes can
+    share it) or a writable text stream.
+    """
+
+    def __init__(self, target: Union[str, TextIO]):
+        self._owned = isinstance(target, str)
+        self.stream: TextIO = open(target, 'a', encoding='utf-8') if self._owned else target
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False) + "\n"
+        with self._lock:
+            self.stream.write(line)
+            self.stream.flush()
+
+    def close(self) -> None:
+        """Close the file if the exporter opened it"""
+        if self._owned:
+            self.stream.close()
+
+
+# The active tracer, None while tracing is disabled
+_tracer: Optional[Tracer] = None
+
+
+def span(name: str) -> Union[Span, _NullSpan]:
+    """
+    Open a span for a stage of the conversion
+
+    Args:
+        name: Stage name
+
+    Returns:
+        A context manager with count() and set(); a no-op while tracing is disabled
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _tracer.span(name)
+
+
+def iter_span(name: str, produce: Callable[[Any], Iterator[T]]) -> Iterator[T]:
+    """
+    Time a generator as one span that leaves out the time its consumer takes
+
+    The span is created now, nested in the currently open span. It is open
+    only while the generator works on its next item, so spans the generator
+    opens nest in it, and it is exported once the generator is exhausted or
+    closed. Its duration is the sum of that work.
+
+    Args:
+        name: Stage name
+        produce: Called with the span (for counts) to create the generator
+
+    Returns:
+        Iterator over the items of the generator
+    """
+    if _tracer is None:
+        return produce(_NULL_SPAN)
+    stage = _tracer.span(name)
+    return _iter_in_span(stage, produce(stage))
+
+
+def _iter_in_span(stage: Span, items: Iterator[T]) -> Iterator[T]:
+    """Yield the items of a generator, producing each inside a span (see iter_span)"""
+    try:
+        while True:
+            try:
+                item = stage._next(items)
+            except StopIteration:
+                return
+            yield item
+    finally:
+        close = getattr(items, 'close', None)
+        if close is not None:
+            close()
+        stage._tracer.exporter(stage)
+
+
+def enable(exporter: Callable[[Span], None]) -> Tracer:
+    """
+    Enable tracing for the current process
+
+    Args:
+        exporter: Callable receiving each finished span (e.g. JsonLinesExporter)
+
+    Returns:
+        Tracer: The active tracer
+    """
+    global _tracer
+    _tracer = Tracer(exporter)
+    return _tracer
+
+
+def disable() -> None:
+    """Disable tracing for the current process"""
+    global _tracer
+    _tracer = None
+
+
+def is_enabled() -> bool:
+    """Check if tracing is enabled"""
+    return _tracer is not None
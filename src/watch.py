@@ -0,0 +1,372 @@
+"""
+Watch-folder mode: keep the conversions of a directory up to date.
+
+    python -m src.main watch shared/ -o converted/ --interval 5
+
+A manifest next to the output records the size, modification time, content
+hash and outputs of every converted input. Each cycle scans the folder,
+converts only new or changed files and removes the outputs of deleted ones.
+A file whose size and modification time are unchanged is not read at all,
+and one whose content is unchanged (a re-save) is not converted again, so
+the cost of a cycle beyond the directory scan scales with what changed.
+
+Files still being written are left alone until two scans see the same size
+and modification time.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .batch import ConversionResult, _is_docx, convert_tasks
+from .cache import CONVERTER_VERSION, DEFAULT_CACHE_SIZE
+from .main import _output_files
+
+# Name of the manifest file in the output directory
+MANIFEST_NAME = '.docx_to_md_manifest.json'
+
+# Default number of seconds between scans
+DEFAULT_INTERVAL = 2.0
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# (size, mtime_ns) of a file
+FileStat = Tuple[int, int]
+
+
+def file_hash(path: str) -> str:
+    """Compute the SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ManifestEntry:
+    """
+    What the manifest knows about one input file.
+    """
+
+    __slots__ = ('size', 'mtime_ns', 'sha256', 'outputs', 'error')
+
+    def __init__(self, size: int = 0, mtime_ns: int = 0, sha256: str = "",
+                 outputs: Optional[List[str]] = None, error: str = ""):
+        self.size: int = size                  # Size of the input when it was last seen
+        self.mtime_ns: int = mtime_ns          # Modification time of the input (ns)
+        self.sha256: str = sha256              # Content hash of the converted input
+        self.outputs: List[str] = outputs or []  # Paths written for it, relative to the output root
+        self.error: str = error                # Error of the last conversion ("" on success)
+
+    @property
+    def stat(self) -> FileStat:
+        return self.size, self.mtime_ns
+
+    def to_dict(self) -> dict:
+        return {"size": self.size, "mtime_ns": self.mtime_ns, "sha256": self.sha256,
+                "outputs": self.outputs, "error": self.error}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ManifestEntry':
+        return cls(data.get("size", 0), data.get("mtime_ns", 0), data.get("sha256", ""),
+                   list(data.get("outputs", [])), data.get("error", ""))
+
+
+class Manifest:
+    """
+    Persistent state of a watched folder: one entry per input, keyed by its
+    path relative to the watched directory.
+    """
+
+    def __init__(self, path: str, fingerprint: str = ""):
+        self.path: str = path                      # Manifest file
+        self.fingerprint: str = fingerprint        # Converter version and options the entries were made with
+        self.entries: Dict[str, ManifestEntry] = {}
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> 'Manifest':
+        """
+        Load a manifest, or start an empty one
+
+        Entries written with another fingerprint keep their outputs (so they
+        can be cleaned up) but count as changed.
+
+        Args:
+            path: Manifest file
+            fingerprint: Fingerprint of the current converter and options
+
+        Returns:
+            Manifest: The loaded manifest
+        """
+        manifest = cls(path, fingerprint)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+
+        for rel_path, entry_data in data.get("entries", {}).items():
+            entry = ManifestEntry.from_dict(entry_data)
+            if data.get("fingerprint") != fingerprint:
+                entry.size, entry.mtime_ns, entry.sha256 = -1, 0, ""
+            manifest.entries[rel_path] = entry
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        data = {
+            "fingerprint": self.fingerprint,
+            "entries": {rel_path: entry.to_dict() for rel_path, entry in sorted(self.entries.items())},
+        }
+        fd, temp_path = tempfile.mkstemp(prefix='.manifest-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+
+class CycleResult:
+    """
+    What one scan of the watched folder did.
+    """
+
+    def __init__(self):
+        self.converted: List[ConversionResult] = []  # Conversions run in this cycle
+        self.removed: List[str] = []     # Inputs whose outputs were removed
+        self.unchanged: int = 0          # Inputs that needed no work
+        self.pending: int = 0            # Changed inputs waiting for their writes to settle
+
+    @property
+    def changed(self) -> bool:
+        """Check if the cycle converted or removed anything"""
+        return bool(self.converted or self.removed)
+
+
+class FolderWatcher:
+    """
+    Keeps the conversions of a directory in sync with its DOCX files.
+    """
+
+    def __init__(self, input_dir: str, output_dir: Optional[str] = None, recursive: bool = True,
+                 jobs: Optional[int] = None, settle: bool = True, cache_dir: Optional[str] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE, trace_file: Optional[str] = None, **options):
+        """
+        Args:
+            input_dir: Directory to watch
+            output_dir: Root directory for the output (default: next to each input)
+            recursive: Whether to watch subdirectories
+            jobs: Number of worker processes per cycle (default: CPU count)
+            settle: Wait until a changed file looks the same in two scans before converting it
+            cache_dir: Optional directory of a conversion cache
+            cache_size: Size limit of the cache directory in bytes
+            trace_file: Optional file that the conversions append their tracing spans to
+            **options: Conversion options (engine, output_format, sized_images, align_tables)
+        """
+        self.input_dir: str = os.path.abspath(input_dir)
+        self.output_dir: str = os.path.abspath(output_dir) if output_dir else self.input_dir
+        self.recursive: bool = recursive
+        self.jobs: Optional[int] = jobs
+        self.settle: bool = settle
+        self.cache_dir: Optional[str] = cache_dir
+        self.cache_size: int = cache_size
+        self.trace_file: Optional[str] = trace_file
+        self.options: dict = options
+        self.output_format: str = options.get('output_format', 'both')
+
+        # The memory budget does not change the output
+        output_options = {name: value for name, value in options.items() if name != 'max_memory'}
+        fingerprint = json.dumps({"version": CONVERTER_VERSION, "options": output_options}, sort_keys=True)
+        self.manifest: Manifest = Manifest.load(os.path.join(self.output_dir, MANIFEST_NAME), fingerprint)
+        self._unsettled: Dict[str, FileStat] = {}  # Changed inputs -> stat seen in the previous scan
+
+    def scan(self) -> Dict[str, FileStat]:
+        """
+        List the DOCX files of the watched directory
+
+        Returns:
+            Dict[str, FileStat]: Path relative to the watched directory -> (size, mtime_ns)
+        """
+        files: Dict[str, FileStat] = {}
+        directories = [self.input_dir]
+        while directories:
+            directory = directories.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.recursive and not entry.name.startswith('.'):
+                            directories.append(entry.path)
+                    elif _is_docx(entry.name) and entry.is_file():
+                        stat = entry.stat()
+                        files[os.path.relpath(entry.path, self.input_dir)] = (stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    # Deleted while scanning
+                    continue
+        return files
+
+    def run_once(self) -> CycleResult:
+        """
+        Scan the directory once, convert new or changed files and clean up deleted ones
+
+        Returns:
+            CycleResult: What the cycle did
+        """
+        result = CycleResult()
+        files = self.scan()
+        entries = self.manifest.entries
+        modified = False
+
+        # Inputs that disappeared
+        for rel_path in [rel_path for rel_path in entries if rel_path not in files]:
+            self._remove_outputs(entries.pop(rel_path))
+            self._unsettled.pop(rel_path, None)
+            result.removed.append(rel_path)
+            modified = True
+
+        # Inputs that are new or changed since the manifest saw them
+        tasks: List[Tuple[str, Optional[str]]] = []
+        changed: Dict[str, Tuple[FileStat, str]] = {}
+        for rel_path, stat in sorted(files.items()):
+            entry = entries.get(rel_path)
+            if entry is not None and entry.stat == stat:
+                result.unchanged += 1
+                continue
+
+            if self.settle and self._unsettled.get(rel_path) != stat:
+                # Possibly still being written; look again in the next cycle
+                self._unsettled[rel_path] = stat
+                result.pending += 1
+                continue
+            self._unsettled.pop(rel_path, None)
+
+            input_file = os.path.join(self.input_dir, rel_path)
+            try:
+                digest = file_hash(input_file)
+            except OSError:
+                continue
+            if entry is not None and entry.sha256 == digest:
+                # Touched or re-saved without changes
+                entry.size, entry.mtime_ns = stat
+                result.unchanged += 1
+                modified = True
+                continue
+
+            if entry is not None:
+                # Old outputs may include media that the new version no longer has
+                self._remove_outputs(entry)
+            changed[rel_path] = (stat, digest)
+            tasks.append((input_file, os.path.join(self.output_dir, os.path.dirname(rel_path))))
+
+        results = convert_tasks(tasks, self.jobs, cache_dir=self.cache_dir, cache_size=self.cache_size,
+                                trace_file=self.trace_file, **self.options)
+        for (rel_path, (stat, digest)), conversion in zip(changed.items(), results):
+            # Outputs are recorded on failure too, so partial files are cleaned up later
+            entries[rel_path] = ManifestEntry(stat[0], stat[1], digest if conversion.success else "",
+                                              self._outputs_of(rel_path), conversion.error)
+            result.converted.append(conversion)
+            modified = True
+
+        if modified:
+            self.manifest.save()
+        return result
+
+    def watch(self, interval: float = DEFAULT_INTERVAL,
+              on_cycle: Optional[Callable[[CycleResult], None]] = None) -> None:
+        """
+        Run cycles until interrupted
+
+        Args:
+            interval: Seconds between the start of two scans
+            on_cycle: Optional callback receiving each cycle's result
+        """
+        while True:
+            started = time.monotonic()
+            cycle = self.run_once()
+            if on_cycle is not None:
+                on_cycle(cycle)
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def _outputs_of(self, rel_path: str) -> List[str]:
+        """Get the output paths of an input, relative to the output root"""
+        rel_dir, file_name = os.path.split(rel_path)
+        output_dir = os.path.join(self.output_dir, rel_dir)
+        output_path = os.path.join(output_dir, os.path.splitext(file_name)[0])
+        return [os.path.relpath(path, self.output_dir)
+                for path in _output_files(self.output_format, output_dir, output_path)]
+
+    def _remove_outputs(self, entry: ManifestEntry) -> None:
+        """Delete the files and media folder recorded for an input"""
+        for rel_output in entry.outputs:
+            path = os.path.join(self.output_dir, rel_output)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def main(argv=None) -> None:
+    """CLI entry point of the 'watch' subcommand"""
+    from .main import _add_conversion_arguments
+
+    parser = argparse.ArgumentParser(prog='main.py watch',
+                                     description='Keep the Markdown conversions of a folder up to date')
+    parser.add_argument('input', help='Directory to watch')
+    parser.add_argument('-o', '--output', help='Directory to save output files (default: next to each input)')
+    parser.add_argument('--no-recursive', action='store_true', help='Do not watch subdirectories')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of worker processes per cycle (default: CPU count)')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help='Seconds between scans (default: %(default)s)')
+    parser.add_argument('--once', action='store_true',
+                        help='Run a single cycle (without waiting for writes to settle) and exit')
+    _add_conversion_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.input):
+        print(f"Error: '{args.input}' is not a directory", file=sys.stderr)
+        sys.exit(1)
+
+    watcher = FolderWatcher(args.input, args.output, recursive=not args.no_recursive, jobs=args.jobs,
+                            settle=not args.once, cache_dir=None if args.no_cache else args.cache_dir,
+                            cache_size=args.cache_size * 1024 * 1024, trace_file=args.trace,
+                            engine=args.engine, output_format=args.format,
+                            sized_images=args.image_sizes, align_tables=args.align_tables,
+                            max_memory=args.max_memory * 1024 * 1024 if args.max_memory else None)
+
+    def report(cycle: CycleResult) -> None:
+        for conversion in cycle.converted:
+            if conversion.success:
+                print(f"{conversion.input_file} -> {conversion.output_path} ({conversion.elapsed:.2f}s)")
+            else:
+                print(f"{conversion.input_file}: {conversion.error}", file=sys.stderr)
+        for rel_path in cycle.removed:
+            print(f"{rel_path} deleted, outputs removed")
+
+    if args.once:
+        cycle = watcher.run_once()
+        report(cycle)
+        if any(not conversion.success for conversion in cycle.converted):
+            sys.exit(1)
+        return
+
+    print(f"Watching {watcher.input_dir} every {args.interval:g}s (Ctrl+C to stop)")
+    try:
+        watcher.watch(args.interval, report)
+    except KeyboardInterrupt:
+        pass
@@ -1,3 +1,11 @@
 from .markdown_writer import MarkdownWriter
+from .sinks import (
+    OutputSink, DirectorySink, ZipSink, TarSink, MarkdownSink, BytesSink, CompositeSink,
+    CheckedSink, CancellableSink, ConversionCancelled, create_stream_sink, create_stdout_sink,
+)
 
-__all__ = ['MarkdownWriter'] 
\ No newline at end of file
+__all__ = [
+    'MarkdownWriter',
+    'OutputSink', 'DirectorySink', 'ZipSink', 'TarSink', 'MarkdownSink', 'BytesSink', 'CompositeSink',
+    'CheckedSink', 'CancellableSink', 'ConversionCancelled', 'create_stream_sink', 'create_stdout_sink',
+]
\ No newline at end of file
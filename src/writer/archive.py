@@ -0,0 +1,178 @@
+import shutil
+import struct
+import zipfile
+from typing import BinaryIO, Dict
+
+# Local file header layout (APPNOTE.TXT 4.3.7)
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+_LOCAL_HEADER_SIGNATURE = b'PK\003\004'
+_NAME_LENGTH = 10
+_EXTRA_LENGTH = 11
+
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# ZipFile internals that raw copies read and update, as ZipFile.open() and
+# ZipFile.writestr() do (CPython 3.6 to 3.13). Other implementations recompress.
+_RAW_COPY_ATTRIBUTES = ('fp', '_lock', '_writing', '_seekable', 'start_dir', '_writecheck', '_didModify',
+                        'filelist', 'NameToInfo')
+
+
+class MediaSources:
+    """
+    Opens source packages on demand and keeps them open while media is copied.
+    Use as a context manager so every opened package is closed again.
+    """
+
+    def __init__(self):
+        self._packages: Dict[str, zipfile.ZipFile] = {}
+
+    def get(self, source_file: str) -> zipfile.ZipFile:
+        """
+        Get the opened package for a source file
+
+        Args:
+            source_file: Path to a zip package (e.g. the input docx)
+
+        Returns:
+            zipfile.ZipFile: The package opened for reading
+        """
+        package = self._packages.get(source_file)
+        if package is None:
+            package = zipfile.ZipFile(source_file)
+            self._packages[source_file] = package
+        return package
+
+    def add(self, source_file: str, package: zipfile.ZipFile) -> None:
+        """
+        Register a package that is already open, so get() does not reopen it
+
+        Args:
+            source_file: Path the package was opened from
+            package: The package opened for reading; close() closes it
+        """
+        self._packages[source_file] = package
+
+    def close(self) -> None:
+        """Close all opened packages"""
+        for package in self._packages.values():
+            package.close()
+        self._packages.clear()
+
+    def __enter__(self) -> 'MediaSources':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def extract_entry(source: zipfile.ZipFile, member: str, target: BinaryIO) -> None:
+    """
+    Decompress a package member into a binary stream without loading it into memory
+
+    Args:
+        source: Package to read from
+        member: Member name inside the package
+        target: Writable binary stream
+    """
+    with source.open(member) as stream:
+        shutil.copyfileobj(stream, target, _COPY_CHUNK_SIZE)
+
+
+def copy_raw_entry(source: zipfile.ZipFile, member: str, target: zipfile.ZipFile, arcname: str) -> None:
+    """
+    Copy a member from one zip archive to another without recompressing it
+
+    The compressed bytes are copied as they are, so PNG/JPEG data is never
+    inflated and deflated again. Entries that cannot be copied verbatim
+    (encrypted or unsupported compression), or archives whose ZipFile lacks
+    the internals a raw copy needs, are recompressed instead.
+
+    Args:
+        source: Archive to read from (opened for reading)
+        member: Member name inside the source archive
+        target: Archive to write to (opened for writing)
+        arcname: Name of the entry in the target archive
+    """
+    info = source.getinfo(member)
+    if info.flag_bits & _FLAG_ENCRYPTED or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+        with source.open(info) as stream, target.open(arcname, 'w') as entry:
+            shutil.copyfileobj(stream, entry, _COPY_CHUNK_SIZE)
+        return
+    if not (_supports_raw_copy(source) and _supports_raw_copy(target)):
+        _recompress_entry(source, info, target, arcname)
+        return
+
+    new_info = zipfile.ZipInfo(arcname, date_time=info.date_time)
+    new_info.compress_type = info.compress_type
+    new_info.CRC = info.CRC
+    new_info.compress_size = info.compress_size
+    new_info.file_size = info.file_size
+    new_info.external_attr = info.external_attr
+    new_info.create_system = info.create_system
+    # Sizes are known up front, so the entry never needs a data descriptor
+    new_info.flag_bits = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR & ~_FLAG_ENCRYPTED
+
+    # Read straight from the archive file, as ZipFile.open() does internally
+    with source._lock:
+        source.fp.seek(info.header_offset)
+        header = _LOCAL_HEADER.unpack(source.fp.read(_LOCAL_HEADER.size))
+        if header[0] != _LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(f"Bad local header for {member!r}")
+        source.fp.seek(header[_NAME_LENGTH] + header[_EXTRA_LENGTH], 1)
+
+        _append_raw(target, new_info, source.fp, info.compress_size)
+
+
+def _supports_raw_copy(archive: zipfile.ZipFile) -> bool:
+    """Check that an archive has the ZipFile internals used by raw copies"""
+    return all(hasattr(archive, name) for name in _RAW_COPY_ATTRIBUTES)
+
+
+def _recompress_entry(source: zipfile.ZipFile, info: zipfile.ZipInfo, target: zipfile.ZipFile, arcname: str) -> None:
+    """Copy a member through the public ZipFile API, keeping its compression method"""
+    new_info = zipfile.ZipInfo(arcname, date_time=info.date_time)
+    new_info.compress_type = info.compress_type
+    new_info.external_attr = info.external_attr
+    new_info.file_size = info.file_size  # Lets ZipFile decide on ZIP64 up front
+    with source.open(info) as stream, target.open(new_info, 'w') as entry:
+        shutil.copyfileobj(stream, entry, _COPY_CHUNK_SIZE)
+
+
+def _append_raw(target: zipfile.ZipFile, zinfo: zipfile.ZipInfo, stream: BinaryIO, size: int) -> None:
+    """
+    Append an already compressed entry to an archive opened for writing
+
+    Mirrors what ZipFile.writestr() does after compression: local header,
+    data, and bookkeeping for the central directory written on close().
+
+    Args:
+        target: Archive opened for writing
+        zinfo: Fully populated entry info (CRC and sizes set)
+        stream: Stream positioned at the start of the compressed data
+        size: Number of compressed bytes to copy
+    """
+    if target._writing:
+        raise ValueError("Can't write to the archive while another entry is open for writing")
+
+    with target._lock:
+        if target._seekable:
+            target.fp.seek(target.start_dir)
+        zinfo.header_offset = target.fp.tell()
+        target._writecheck(zinfo)
+        target._didModify = True
+
+        target.fp.write(zinfo.FileHeader())
+        remaining = size
+        while remaining > 0:
+            chunk = stream.read(min(_COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {zinfo.filename!r}")
+            target.fp.write(chunk)
+            remaining -= len(chunk)
+
+        target.filelist.append(zinfo)
+        target.NameToInfo[zinfo.filename] = zinfo
+        target.start_dir = target.fp.tell()
@@ -0,0 +1,63 @@
+"""
+Markdown escaping.
+
+The characters \\ * _ # ` [ ] ( ) - | < > get a backslash wherever they
+appear, with three rules for the start of a line:
+
+- '-' stays unescaped there, where it is a list marker (docs/task.md:
+  "Escape hyphens (-) not at the start of a line");
+- '+' is escaped only there, where it would start a list;
+- the dot of a number followed by a blank ("1. ") is escaped there, where
+  it would start an ordered list ("1)" is covered by the escaped ')').
+
+Text can begin in the middle of a line (a run after other runs), so the
+caller says whether its first character is at a line start.
+
+The escapes are a table built once at import. Each entry costs one C-level
+memchr scan and a str.replace only if the character occurs; on CPython this
+beats a single re.sub or str.translate pass, which handle every match or
+character in Python-level code (see benchmarks/escaping.py). The ordered
+list rule needs a regex, which only runs on text that starts with a digit or
+spans several lines.
+"""
+import re
+
+# Characters escaped wherever they appear (except '-' at a line start);
+# the backslash comes first so the added backslashes are not escaped again
+MARKDOWN_SPECIAL_CHARS = '\\*_#`[]()|<>-'
+
+_ESCAPES = tuple((char, '\\' + char) for char in MARKDOWN_SPECIAL_CHARS)
+
+# Ordered list markers ("12. ", or a number ending the text) at the start of
+# the text and after line breaks
+_LEADING_LIST_NUMBER = re.compile(r'\A(\d{1,9})\.(?=[ \t]|$)', re.MULTILINE)
+_LINE_LIST_NUMBER = re.compile(r'\n(\d{1,9})\.(?=[ \t]|$)', re.MULTILINE)
+
+
+def escape_markdown(text: str, at_line_start: bool = True) -> str:
+    """
+    Escape the Markdown special characters in text
+
+    Args:
+        text: Raw text (may span several lines)
+        at_line_start: Whether the text begins at the start of a line
+
+    Returns:
+        str: Text with a backslash before each special character
+    """
+    for char, escaped in _ESCAPES:
+        if char in text:
+            text = text.replace(char, escaped)
+
+    # Line-start rules; an escaped backslash is '\\\\', so '\\-' is always an escaped hyphen
+    if '\n' in text:
+        text = text.replace('\n\\-', '\n-').replace('\n+', '\n\\+')
+        text = _LINE_LIST_NUMBER.sub('\n\\1\\\\.', text)
+    if at_line_start:
+        if text.startswith('\\-'):
+            text = text[1:]
+        elif text.startswith('+'):
+            text = '\\' + text
+        elif text[:1].isdigit():
+            text = _LEADING_LIST_NUMBER.sub('\\1\\\\.', text)
+    return text
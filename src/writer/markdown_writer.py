@@ -1,9 +1,33 @@
 import os
-import zipfile
-from typing import Dict, List, Any, Optional, TextIO
-import re
+from typing import Iterable, Any, Iterator, Optional, TextIO, Tuple
 
+from .. import tracing
 from ..models import Document, Paragraph, Image, Table
+from ..models.run import coalesce_runs
+from .archive import MediaSources
+from .escaping import escape_markdown
+from .sinks import OutputSink, DirectorySink, ZipSink, CompositeSink
+
+# Stands in for the indentation of the heading that blocks belong to while it
+# is unknown (see render_chunk); XML text can never contain it
+CONTEXT_INDENT = '\x00'
+
+
+def resolve_heading_context(markdown: str, heading_level: int) -> str:
+    """
+    Indent the Markdown of a chunk for the heading it follows
+    
+    Args:
+        markdown: Markdown from MarkdownWriter.render_chunk
+        heading_level: Level of the last heading before the chunk (0 for none)
+        
+    Returns:
+        str: The Markdown a serial rendering produces
+    """
+    if CONTEXT_INDENT not in markdown:
+        return markdown
+    return markdown.replace(CONTEXT_INDENT, "\t" * heading_level)
+
 
 class MarkdownWriter:
     """
@@ -11,56 +35,117 @@ class MarkdownWriter:
     Converts the document model to Markdown format and creates the output files.
     """
     
-    def __init__(self):
+    def __init__(self, write_files: bool = True, sized_images: bool = False, align_tables: bool = False):
+        self.write_files: bool = write_files  # Keep the .md file and media folder next to the zip
+        self.sized_images: bool = sized_images  # Add {width=.. height=..} to image references
+        self.align_tables: bool = align_tables  # Pad table cells so the columns line up
         self.output_dir: str = ""
         self.document: Optional[Document] = None
         self.media_folder: str = ""
         self.md_file_path: str = ""
-        self.current_heading_level: int = 0  # Track the current heading level for indentation
+        self.current_heading_level: Optional[int] = 0  # Track the current heading level for indentation (None: unknown)
+        self.paragraphs_written: int = 0  # Blocks rendered by the last iter_markdown
         
-    def write_document(self, document: Document, output_path: str) -> str:
+    def write_document(self, document: Document, output_path: str, sink: Optional[OutputSink] = None) -> Any:
         """
         Convert a Document object to Markdown and write to the specified path.
         
+        Without a sink, the Markdown file and media folder are written next to
+        output_path (unless write_files is off) together with a ZIP archive.
+        
         Args:
             document (Document): Document object to convert
-            output_path (str): Path where to write the output
+            output_path (str): Path where to write the output (without extension);
+                               its base name names the .md file and media folder
+            sink (OutputSink): Optional destination for the output (directory,
+                               zip, in-memory bytes, stdout, ...)
             
         Returns:
-            str: Path to the generated Markdown file
+            Path to the generated ZIP archive, or the sink's result when a sink is given
         """
         self.document = document
-        self.output_dir = os.path.dirname(output_path)
         self.current_heading_level = 0
+        self._set_output_path(output_path)
+        
+        if sink is not None:
+            self._write_to_sink(document, sink)
+            return self._close_sink(sink)
         
         # Create output directory if it doesn't exist
-        if not os.path.exists(self.output_dir):
+        if self.output_dir and not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
         
-        # Set up paths
+        default_sink = ZipSink(f"{output_path}.zip")
+        if self.write_files:
+            default_sink = CompositeSink(DirectorySink(self.output_dir), default_sink, primary=1)
+        
+        self._write_to_sink(document, default_sink)
+        return self._close_sink(default_sink)
+    
+    def _set_output_path(self, output_path: str) -> None:
+        """
+        Set up the paths of the .md file and media folder
+        
+        Args:
+            output_path: Path where to write the output (without extension)
+        """
+        self.output_dir = os.path.dirname(output_path)
         doc_name = os.path.splitext(os.path.basename(output_path))[0]
         self.md_file_path = f"{output_path}.md"
         self.media_folder = os.path.join(self.output_dir, f"{doc_name}_media")
+    
+    def _write_to_sink(self, document: Document, sink: OutputSink) -> None:
+        """
+        Render the Markdown and the images of a document into a sink
         
-        # Create media folder if it doesn't exist
-        if not os.path.exists(self.media_folder):
-            os.makedirs(self.media_folder)
-        
-        # Process images and save them
-        self._save_images()
+        Args:
+            document: Document object to convert
+            sink: Destination for the output
+        """
+        md_name = os.path.basename(self.md_file_path)
         
-        # Generate markdown content
-        md_content = self._generate_markdown()
+        # Render markdown straight into the sink, paragraph by paragraph
+        with tracing.span('write_markdown') as stage:
+            with sink.open_markdown(md_name) as stream:
+                self.write_markdown(document, stream)
+            stage.count('paragraphs', self.paragraphs_written)
         
-        # Write markdown file
-        with open(self.md_file_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        # For a lazy document these are the images seen while rendering
+        self._write_images(document.get_images(), sink)
+    
+    def _write_images(self, images: Iterable[Image], sink: OutputSink) -> None:
+        """
+        Add images to a sink, copying them from the source package when possible
         
-        # Create ZIP archive
-        zip_path = self._create_zip_archive(self.md_file_path, self.media_folder)
+        Repeated images share a file name, which is written only once.
         
-        return zip_path
+        Args:
+            images: Images in document order
+            sink: Destination for the output
+        """
+        media_folder_name = os.path.basename(self.media_folder)
+        with tracing.span('save_images') as stage, MediaSources() as sources:
+            written = set()
+            for image in images:
+                if image.new_file_name in written:
+                    continue
+                written.add(image.new_file_name)
+                sink.add_image(image, f"{media_folder_name}/{image.new_file_name}", sources)
+                stage.count('images')
+    
+    def _close_sink(self, sink: OutputSink) -> Any:
+        """
+        Finish the output (e.g. write the ZIP central directory)
         
+        Args:
+            sink: Destination for the output
+            
+        Returns:
+            The sink's result
+        """
+        with tracing.span('finish_output'):
+            return sink.close()
+    
     def _format_paragraph(self, paragraph: Paragraph) -> str:
         """
         Convert a Paragraph object to Markdown syntax
@@ -76,11 +161,13 @@ class MarkdownWriter:
             self.current_heading_level = paragraph.heading_level
         
         # Determine indentation based on current level
-        content_indent = "\t" * self.current_heading_level
+        content_indent = self._indent(self.current_heading_level)
         
-        # If paragraph has an image, format it
+        # If paragraph has images, format each of them
         if paragraph.has_image():
-            return content_indent + self._format_image(paragraph.image, os.path.basename(self.output_dir))
+            document_name = os.path.basename(self.output_dir)
+            return "".join(content_indent + self._format_image(image, document_name)
+                           for image in paragraph.images)
         
         # If paragraph has a table, format it
         if paragraph.has_table():
@@ -91,35 +178,42 @@ class MarkdownWriter:
             # Level 1 heading gets no tabs, level 2 gets 1 tab, etc.
             heading_indent = "\t" * (paragraph.heading_level - 1) if paragraph.heading_level > 0 else ""
             # Make heading text bold
-            return f"{heading_indent}- **{paragraph.text}**\n\n"
+            return f"{heading_indent}- **{escape_markdown(paragraph.text, at_line_start=False)}**\n\n"
         
-        # Check if the paragraph text starts with a bullet point or numbered list
         text = paragraph.text.strip()
-        if text.startswith("- ") or re.match(r"^\d+\.\s", text):
-            # For bullet points and numbered lists that are part of the content, 
-            # add one extra tab for proper list formatting
-            # Also handle newlines in the text by adding proper indentation after each newline
-            indented_text = self._add_indent_after_newlines(text, content_indent)
-            return f"{content_indent}{indented_text}\n\n"
+        
+        # List items (Word lists from numbering.xml) nest one tab per list level
+        if paragraph.is_list_item():
+            list_indent = content_indent + "\t" * (paragraph.list_level - 1)
+            marker = f"{paragraph.list_number}." if paragraph.list_number else "-"
+            # Text after a list marker starts a new block, so it gets the line-start
+            # escapes; a hyphen there would be a nested list marker, so it is escaped too
+            if paragraph.runs:
+                text = self._format_text_with_runs(paragraph)
+            else:
+                text = escape_markdown(text)
+            if text.startswith('-'):
+                text = '\\' + text
+            indented_text = self._add_indent_after_newlines(text, list_indent + "\t")
+            return f"{list_indent}{marker} {indented_text}\n\n"
         
         # If paragraph has formatted runs, use them with content indentation
         if paragraph.runs:
             formatted_text = self._format_text_with_runs(paragraph)
-            # Check for lists in formatted text
-            if formatted_text.strip().startswith("- ") or re.match(r"^\d+\.\s", formatted_text.strip()):
-                indented_text = self._add_indent_after_newlines(formatted_text, content_indent)
-                return f"{content_indent}{indented_text}\n\n"
-            else:
-                indented_text = self._add_indent_after_newlines(formatted_text, content_indent)
-                return f"{content_indent}{indented_text}\n\n"
+            indented_text = self._add_indent_after_newlines(formatted_text, content_indent)
+            return f"{content_indent}{indented_text}\n\n"
         
         # Otherwise, just return the text with a double newline and indentation
         if text:
-            indented_text = self._add_indent_after_newlines(text, content_indent)
+            indented_text = self._add_indent_after_newlines(escape_markdown(text), content_indent)
             return f"{content_indent}{indented_text}\n\n"
         
         # Empty paragraph
         return "\n"
+    
+    def _indent(self, heading_level: Optional[int]) -> str:
+        """Get the indentation of content below a heading (CONTEXT_INDENT if the level is unknown)"""
+        return CONTEXT_INDENT if heading_level is None else "\t" * heading_level
         
     def _add_indent_after_newlines(self, text: str, indent: str) -> str:
         """
@@ -154,9 +248,13 @@ class MarkdownWriter:
         alt_text = image.alt_text if image.alt_text else "image"
         media_folder_name = f"{os.path.splitext(os.path.basename(self.md_file_path))[0]}_media"
         image_path = f"{media_folder_name}/{image.new_file_name}"
-        return f"![{alt_text}]({image_path})\n\n"
+        size = ""
+        if self.sized_images and image.width and image.height:
+            # Attribute syntax understood by Pandoc and kramdown
+            size = f"{{width={image.width}px height={image.height}px}}"
+        return f"![{alt_text}]({image_path}){size}\n\n"
         
-    def _format_table(self, table: Table, indent_level: int) -> str:
+    def _format_table(self, table: Table, indent_level: Optional[int]) -> str:
         """
         Convert a Table object to Markdown table syntax with proper indentation
         
@@ -167,78 +265,60 @@ class MarkdownWriter:
         Returns:
             str: Markdown table representation
         """
-        indent = "\t" * indent_level
-        
-        # Get the basic markdown table
-        table_md = table.get_markdown()
-        
-        # Apply indentation to each line while preserving table format
-        indented_lines = []
-        for line in table_md.split('\n'):
-            indented_lines.append(f"{indent}{line}")
-        
-        return '\n'.join(indented_lines) + "\n\n"
-        
-    def _create_zip_archive(self, md_file_path: str, media_folder_path: str) -> str:
+        return "".join(self._iter_table(table, indent_level))
+    
+    def _iter_table(self, table: Table, indent_level: Optional[int]) -> Iterator[str]:
         """
-        Create a ZIP archive with the Markdown file and media folder
+        Generate the indented lines of a Markdown table one at a time
         
         Args:
-            md_file_path: Path to the Markdown file
-            media_folder_path: Path to the media folder
-            
-        Returns:
-            str: Path to the created ZIP archive
-        """
-        # Generate zip file path
-        zip_path = os.path.splitext(md_file_path)[0] + ".zip"
-        
-        # Create zip file
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add markdown file
-            zipf.write(
-                md_file_path, 
-                os.path.basename(md_file_path)
-            )
+            table: A Table object
+            indent_level: Current indentation level
             
-            # Add all files from media folder
-            for root, _, files in os.walk(media_folder_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    # Calculate relative path for the file in the zip
-                    rel_path = os.path.join(
-                        os.path.basename(media_folder_path),
-                        os.path.relpath(file_path, media_folder_path)
-                    )
-                    zipf.write(file_path, rel_path)
-        
-        return zip_path
-    
-    def _format_text_with_runs(self, paragraph: Paragraph) -> str:
+        Yields:
+            str: Each table row followed by a line break, then the blank line after the table
+        """
+        indent = self._indent(indent_level)
+        
+        if not table.rows or table.num_cols == 0:
+            yield f"{indent}\n\n"
+            return
+        
+        for line in table.iter_markdown(self.align_tables):
+            yield f"{indent}{line}\n"
+        yield "\n"
+        
+    def _format_text_with_runs(self, paragraph: Paragraph, at_line_start: bool = True) -> str:
         """
         Apply formatting to text runs
         
+        Adjacent runs with the same formatting are merged first, so text that
+        Word split into many runs gets one pair of markers (e.g. **foo bar**
+        instead of **foo****bar**). Bold italic text becomes ***text***.
+        
         Args:
             paragraph: A paragraph with formatted text runs
+            at_line_start: Whether the text begins a line
             
         Returns:
             str: Formatted text in Markdown
         """
-        md_text = ""
+        # Collect the pieces and join once, so long paragraphs render in linear time
+        parts = []
+        # at_line_start tracks whether the next run begins a line (hyphens are
+        # only escaped after the line start)
         
-        for run in paragraph.runs:
-            text = run.get('text', '')
-            if not text:
-                continue
+        for run in coalesce_runs(paragraph.runs):
+            text = run.text
             
             # Get formatting flags
-            is_bold = run.get('bold', False)
-            is_italic = run.get('italic', False)
-            is_underline = run.get('underline', False)
-            is_strike = run.get('strike', False)
+            is_bold = run.bold
+            is_italic = run.italic
+            is_underline = run.underline
+            is_strike = run.strike
             
             # Check if we need to handle newlines in this run
-            if '\n' in text and any([is_bold, is_italic, is_underline, is_strike]):
+            if '\n' in text and run.flags:
                 # Split the text by newlines
                 lines = text.split('\n')
                 formatted_lines = []
@@ -249,112 +329,160 @@ class MarkdownWriter:
                         formatted_lines.append('')
                         continue
                     
-                    line_text = line
-                    
-                    # Only escape characters if no formatting is applied
-                    # or text contains characters that need escaping
-                    if any(c in line_text for c in '*_#`[]()'):
-                        line_text = self._escape_markdown_chars(line_text)
-                    
-                    # Apply formatting to each line separately
-                    if is_strike and line_text:
-                        line_text = f"~~{line_text}~~"
-                        
-                    if is_underline and line_text:
-                        line_text = f"<u>{line_text}</u>"
-                        
-                    if is_italic and line_text:
-                        line_text = f"*{line_text}*"
-                        
-                    if is_bold and line_text:
-                        line_text = f"**{line_text}**"
-                    
-                    formatted_lines.append(line_text)
+                    formatted_lines.append(self._wrap_formatted(line, is_bold, is_italic, is_underline,
+                                                                is_strike, at_line_start=at_line_start or i > 0))
                 
                 # Join the lines back with newlines
-                md_text += '\n'.join(formatted_lines)
+                parts.append('\n'.join(formatted_lines))
             else:
-                # Process single-line text as before
-                # Only escape characters if no formatting is applied
-                # or text contains characters that need escaping
-                if not any([is_bold, is_italic, is_underline, is_strike]) and any(c in text for c in '*_#`[]()'):
-                    text = self._escape_markdown_chars(text)
-                
-                # Apply formatting (wrapping in reverse order of application)
-                if is_strike:
-                    text = f"~~{text}~~"
-                    
-                if is_underline:
-                    text = f"<u>{text}</u>"
-                    
-                if is_italic:
-                    text = f"*{text}*"
-                    
-                if is_bold:
-                    text = f"**{text}**"
-                    
-                md_text += text
+                # Single-line or unformatted text
+                parts.append(self._wrap_formatted(text, is_bold, is_italic, is_underline,
+                                                  is_strike, at_line_start=at_line_start))
+            
+            if text:
+                at_line_start = text.endswith('\n')
         
-        return md_text
+        return "".join(parts)
     
-    def _escape_markdown_chars(self, text: str) -> str:
+    def _wrap_formatted(self, text: str, is_bold: bool, is_italic: bool, is_underline: bool,
+                        is_strike: bool, at_line_start: bool = True) -> str:
         """
-        Escape special Markdown characters in text
+        Escape text and wrap it in the Markdown markers of its formatting
         
         Args:
-            text: Raw text
+            text: Text of a run (or of one line of it)
+            is_bold, is_italic, is_underline, is_strike: Formatting flags
+            at_line_start: Whether the text begins at the start of a line
             
         Returns:
-            str: Text with escaped Markdown characters
-        """
-        # This is a simplified approach that only escapes the most common
-        # Markdown syntax characters that would affect formatting
-        
-        # First escape backslashes to prevent double-escaping
-        text = text.replace('\\', '\\\\')
-        
-        # Escape characters that commonly have special meaning in Markdown
-        replacements = [
-            ('*', '\\*'),
-            ('_', '\\_'),
-            ('#', '\\#'),
-            ('`', '\\`'),
-            ('[', '\\['),
-            (']', '\\]'),
-            ('(', '\\('),
-            (')', '\\)'),
-        ]
-        
-        for old, new in replacements:
-            text = text.replace(old, new)
-                
+            str: The formatted text (empty text stays empty)
+        """
+        if not text:
+            return text
+        
+        # Escaped before the markers are added, so they stay intact
+        text = escape_markdown(text, at_line_start)
+        
+        # Apply formatting (wrapping in reverse order of application)
+        if is_strike:
+            text = f"~~{text}~~"
+        if is_underline:
+            text = f"<u>{text}</u>"
+        if is_bold and is_italic:
+            return f"***{text}***"
+        if is_italic:
+            return f"*{text}*"
+        if is_bold:
+            return f"**{text}**"
         return text
     
-    def _generate_markdown(self) -> str:
+    def iter_markdown(self, document: Document, doc_name: Optional[str] = None) -> Iterator[str]:
         """
-        Generate Markdown content from the document model
+        Generate Markdown content from the document model block by block
         
-        Returns:
-            str: Complete Markdown content
+        Args:
+            document: Document object to convert
+            doc_name: Name of the output document, used for the media folder name
+                      (default: the current output file, or the source file name)
+            
+        Yields:
+            str: Markdown for each paragraph or table row, in document order
         """
-        md_content = ""
+        self.document = document
+        if doc_name is not None:
+            self.md_file_path = f"{doc_name}.md"
+        elif not self.md_file_path:
+            self.md_file_path = f"{os.path.splitext(document.filename)[0] or 'document'}.md"
         
         # Reset current heading level
         self.current_heading_level = 0
+        self.paragraphs_written = 0
+        
+        # A lazy document parses each block here, and it can be freed once rendered
+        for paragraph in document.paragraphs:
+            self.paragraphs_written += 1
+            if paragraph.has_table() and not paragraph.has_image():
+                # Tables are streamed row by row
+                yield from self._iter_table(paragraph.table, self.current_heading_level)
+            else:
+                yield self._format_paragraph(paragraph)
+    
+    def render_chunk(self, paragraphs: Iterable[Paragraph]) -> Tuple[str, Optional[int]]:
+        """
+        Render consecutive blocks without knowing the heading they follow
         
-        # Process all paragraphs
-        for paragraph in self.document.paragraphs:
-            md_content += self._format_paragraph(paragraph)
+        Blocks are indented one tab per level of the heading they belong to,
+        which is the only state carried from block to block. Rendered on its
+        own, a chunk leaves that indentation open (CONTEXT_INDENT) up to its
+        first heading, so chunks can be rendered independently, e.g. in
+        parallel, and resolved in order with resolve_heading_context.
         
-        return md_content
+        Args:
+            paragraphs: Consecutive blocks of a document
+            
+        Returns:
+            Tuple[str, Optional[int]]: The Markdown and the level of the last heading
+            among the blocks (None if there is none)
+        """
+        self.current_heading_level = None
+        markdown = "".join(self._format_paragraph(paragraph) for paragraph in paragraphs)
+        return markdown, self.current_heading_level
     
-    def _save_images(self) -> None:
+    def write_rendered(self, chunks: Iterable[Tuple[str, Optional[int]]], images: Iterable[Image],
+                       output_path: str, sink: OutputSink) -> Any:
         """
-        Save all images from the document to the media folder
+        Write chunks rendered with render_chunk (e.g. in other processes) into a sink
+        
+        The heading each chunk follows is the last heading of the chunks
+        before it, so the output is that of write_document.
+        
+        Args:
+            chunks: Markdown and last heading level of each chunk, in document order
+            images: Images of the chunks in document order (iterated after the chunks)
+            output_path: Path where to write the output (without extension)
+            sink: Destination for the output
+            
+        Returns:
+            The sink's result
         """
-        # Get all images from the document
-        images = self.document.get_images()
+        self.current_heading_level = 0
+        self._set_output_path(output_path)
+        
+        with tracing.span('write_markdown') as stage:
+            with sink.open_markdown(os.path.basename(self.md_file_path)) as stream:
+                for markdown, heading_level in chunks:
+                    stream.write(resolve_heading_context(markdown, self.current_heading_level))
+                    if heading_level is not None:
+                        self.current_heading_level = heading_level
+                    stage.count('chunks')
+        
+        self._write_images(images, sink)
+        return self._close_sink(sink)
+    
+    def write_markdown(self, document: Document, stream: TextIO, doc_name: Optional[str] = None) -> None:
+        """
+        Render a Document object as Markdown into a text stream
+        
+        Only one block is held in memory at a time, so any writable text
+        stream (file, socket wrapper, zip entry) can be used as the target.
+        
+        Args:
+            document: Document object to convert
+            stream: Writable text stream
+            doc_name: Name of the output document (see iter_markdown)
+        """
+        write = stream.write
+        for chunk in self.iter_markdown(document, doc_name):
+            write(chunk)
+    
+    def _generate_markdown(self) -> str:
+        """
+        Generate Markdown content from the document model
         
-        # Save each image
-        for image in images:
-            image.save(self.media_folder) 
\ No newline at end of file
+        Returns:
+            str: Complete Markdown content
+        """
+        with tracing.span('generate_markdown') as stage:
+            markdown = "".join(self.iter_markdown(self.document))
+            stage.count('paragraphs', self.paragraphs_written)
+            return markdown
\ No newline at end of file
@@ -0,0 +1,354 @@
+import contextlib
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+from typing import Any, BinaryIO, Callable, Iterator, Optional, TextIO, Union
+
+from ..models import Image
+from .archive import MediaSources, copy_raw_entry, extract_entry
+
+# Markdown larger than this is spooled to disk while a tar entry is prepared
+_SPOOL_SIZE = 8 * 1024 * 1024
+
+
+def _open_spool() -> BinaryIO:
+    """Open a temporary binary file that io.TextIOWrapper can wrap"""
+    # SpooledTemporaryFile implements the io.IOBase interface only from Python 3.11
+    if sys.version_info >= (3, 11):
+        return tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE)
+    return tempfile.TemporaryFile()
+
+
+class OutputSink:
+    """
+    Destination for the files produced by MarkdownWriter.
+    The writer first writes the Markdown through open_markdown(), then adds
+    each image with add_image(), and finally calls close() to get the result.
+    """
+
+    def open_markdown(self, name: str):
+        """
+        Open the Markdown file for writing
+
+        Args:
+            name: File name of the Markdown file (e.g. 'report.md')
+
+        Returns:
+            A context manager yielding a writable text stream
+        """
+        raise NotImplementedError
+
+    def add_image(self, image: Image, arcname: str, sources: MediaSources) -> None:
+        """
+        Add an image to the output
+
+        Args:
+            image: The image to add
+            arcname: Relative path of the image (e.g. 'report_media/document.001.png')
+            sources: Opened source packages to copy image data from
+        """
+        raise NotImplementedError
+
+    def close(self) -> Any:
+        """
+        Finish the output
+
+        Returns:
+            The sink's result (a path, bytes or None)
+        """
+        return None
+
+
+class DirectorySink(OutputSink):
+    """
+    Writes the Markdown file and the media folder into a directory.
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir: str = output_dir
+        self.md_file_path: str = ""
+
+    def open_markdown(self, name: str):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.md_file_path = os.path.join(self.output_dir, name)
+        return open(self.md_file_path, 'w', encoding='utf-8')
+
+    def add_image(self, image: Image, arcname: str, sources: MediaSources) -> None:
+        image_path = os.path.join(self.output_dir, *arcname.split('/'))
+        os.makedirs(os.path.dirname(image_path), exist_ok=True)
+        with open(image_path, 'wb') as f:
+            if image.has_source():
+                extract_entry(sources.get(image.source_file), image.source_member, f)
+            else:
+                f.write(image.content)
+
+    def close(self) -> str:
+        """Return the path of the written Markdown file"""
+        return self.md_file_path
+
+
+class ZipSink(OutputSink):
+    """
+    Writes a ZIP archive directly, without intermediate files.
+    The target can be a path or any writable binary stream (seekable or not).
+    """
+
+    def __init__(self, target: Union[str, BinaryIO]):
+        self.target = target
+        self.archive = zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED)
+
+    def open_markdown(self, name: str):
+        return io.TextIOWrapper(self.archive.open(name, 'w'), encoding='utf-8')
+
+    def add_image(self, image: Image, arcname: str, sources: MediaSources) -> None:
+        if image.has_source():
+            # Copy the compressed bytes as they are
+            copy_raw_entry(sources.get(image.source_file), image.source_member, self.archive, arcname)
+        else:
+            self.archive.writestr(arcname, image.content)
+
+    def close(self) -> Optional[str]:
+        """Return the path of the archive (None when writing to a stream)"""
+        self.archive.close()
+        return self.target if isinstance(self.target, str) else None
+
+
+class TarSink(OutputSink):
+    """
+    Writes an uncompressed tar stream, suitable for piping into other tools.
+    Each member is written as soon as it is complete; nothing is seeked.
+    """
+
+    def __init__(self, target: Union[str, BinaryIO]):
+        self.target = target
+        self._file = open(target, 'wb') if isinstance(target, str) else None
+        self.archive = tarfile.open(fileobj=self._file or target, mode='w|')
+
+    @contextlib.contextmanager
+    def open_markdown(self, name: str) -> Iterator[TextIO]:
+        # tar needs the size up front, so the text is spooled first
+        with _open_spool() as spool:
+            stream = io.TextIOWrapper(spool, encoding='utf-8')
+            yield stream
+            stream.flush()
+            size = spool.tell()
+            spool.seek(0)
+            self._add_member(name, size, spool)
+            stream.detach()
+
+    def add_image(self, image: Image, arcname: str, sources: MediaSources) -> None:
+        if image.has_source():
+            package = sources.get(image.source_file)
+            size = package.getinfo(image.source_member).file_size
+            with package.open(image.source_member) as stream:
+                self._add_member(arcname, size, stream)
+        else:
+            content = image.content
+            self._add_member(arcname, len(content), io.BytesIO(content))
+
+    def _add_member(self, name: str, size: int, stream: BinaryIO) -> None:
+        """Write one regular file into the tar stream"""
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self.archive.addfile(info, stream)
+
+    def close(self) -> Optional[str]:
+        """Return the path of the archive (None when writing to a stream)"""
+        self.archive.close()
+        if self._file is not None:
+            self._file.close()
+        return self.target if isinstance(self.target, str) else None
+
+
+class MarkdownSink(OutputSink):
+    """
+    Writes only the Markdown text; images are referenced but not stored.
+    Useful for indexers that only need the text.
+    """
+
+    def __init__(self, target: Union[str, BinaryIO]):
+        self.target = target
+
+    def open_markdown(self, name: str):
+        if isinstance(self.target, str):
+            return open(self.target, 'w', encoding='utf-8')
+        # Leave the caller's stream open when the wrapper is closed
+        return _DetachingTextWrapper(self.target)
+
+    def add_image(self, image: Image, arcname: str, sources: MediaSources) -> None:
+        pass
+
+    def close(self) -> Optional[str]:
+        """Return the path of the Markdown file (None when writing to a stream)"""
+        return self.target if isinstance(self.target, str) else None
+
+
+class BytesSink(OutputSink):
+    """
+    Builds the output in memory and returns it as bytes.
+    """
+
+    def __init__(self, archive_format: str = 'zip'):
+        self.buffer = io.BytesIO()
+        self._sink = create_stream_sink(self.buffer, archive_format)
+
+    def open_markdown(self, name: str):
+        return self._sink.open_markdown(name)
+
+    def add_image(self, image: Image, arcname: str, sources: MediaSources) -> None:
+        self._sink.add_image(image, arcname, sources)
+
+    def close(self) -> bytes:
+        """Return the produced archive (or Markdown) bytes"""
+        self._sink.close()
+        return self.buffer.getvalue()
+
+
+class CompositeSink(OutputSink):
+    """
+    Sends the same output to several sinks, rendering the Markdown only once.
+    """
+
+    def __init__(self, *sinks: OutputSink, primary: Optional[int] = None):
+        self.sinks = sinks
+        self.primary: Optional[int] = primary  # Index of the sink whose result close() returns
+
+    @contextlib.contextmanager
+    def open_markdown(self, name: str) -> Iterator['_TeeWriter']:
+        with contextlib.ExitStack() as stack:
+            streams = [stack.enter_context(sink.open_markdown(name)) for sink in self.sinks]
+            yield _TeeWriter(streams)
+
+    def add_image(self, image: Image, arcname: str, sources: MediaSources) -> None:
+        for sink in self.sinks:
+            sink.add_image(image, arcname, sources)
+
+    def close(self) -> Any:
+        """Return the result of the primary sink, or the results of all sinks in order"""
+        results = [sink.close() for sink in self.sinks]
+        return results if self.primary is None else results[self.primary]
+
+
+class _TeeWriter:
+    """Minimal text stream that forwards writes to several streams"""
+
+    def __init__(self, streams):
+        self._writes = [stream.write for stream in streams]
+
+    def write(self, text: str) -> int:
+        for write in self._writes:
+            write(text)
+        return len(text)
+
+
+class ConversionCancelled(Exception):
+    """Raised inside a conversion whose cancellation event has been set"""
+
+
+class CheckedSink(OutputSink):
+    """
+    Forwards the output to another sink, running a check before every
+    Markdown block and image. The check stops the conversion by raising
+    (e.g. MemoryBudget.check).
+    """
+
+    def __init__(self, sink: OutputSink, check: Callable[[], None]):
+        self.sink: OutputSink = sink
+        self._check = check
+
+    @contextlib.contextmanager
+    def open_markdown(self, name: str) -> Iterator['_CheckingWriter']:
+        self._check()
+        with self.sink.open_markdown(name) as stream:
+            yield _CheckingWriter(stream, self._check)
+
+    def add_image(self, image: Image, arcname: str, sources: MediaSources) -> None:
+        self._check()
+        self.sink.add_image(image, arcname, sources)
+
+    def close(self) -> Any:
+        return self.sink.close()
+
+
+class CancellableSink(CheckedSink):
+    """
+    Forwards the output to another sink until a cancellation event is set.
+    The event is checked before every Markdown block and image, so a
+    conversion running in another thread stops within one block.
+    """
+
+    def __init__(self, sink: OutputSink, event):
+        def check_event() -> None:
+            if event.is_set():
+                raise ConversionCancelled("Conversion cancelled")
+
+        # A closure rather than a bound method, so the sink is not kept alive by a cycle
+        super().__init__(sink, check_event)
+        self.event = event  # threading.Event (or anything with is_set())
+
+
+class _CheckingWriter:
+    """Minimal text stream that runs a check before each write"""
+
+    def __init__(self, stream, check):
+        self._write = stream.write
+        self._check = check
+
+    def write(self, text: str) -> int:
+        self._check()
+        return self._write(text)
+
+
+class _DetachingTextWrapper(io.TextIOWrapper):
+    """Text wrapper that flushes but does not close the underlying binary stream"""
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__(stream, encoding='utf-8', write_through=True)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.flush()
+            self.detach()
+
+
+# Formats understood by create_stream_sink()
+STREAM_FORMATS = ('zip', 'tar', 'md')
+
+
+def create_stream_sink(target: Union[str, BinaryIO], archive_format: str = 'zip') -> OutputSink:
+    """
+    Create a sink that writes a single file or stream
+
+    Args:
+        target: Output path or writable binary stream
+        archive_format: 'zip', 'tar' or 'md' (Markdown text only)
+
+    Returns:
+        OutputSink: The matching sink
+    """
+    if archive_format == 'zip':
+        return ZipSink(target)
+    if archive_format == 'tar':
+        return TarSink(target)
+    if archive_format == 'md':
+        return MarkdownSink(target)
+    raise ValueError(f"Unknown archive format: {archive_format!r} (expected one of {', '.join(STREAM_FORMATS)})")
+
+
+def create_stdout_sink(archive_format: str = 'zip') -> OutputSink:
+    """
+    Create a sink that streams the output to standard output
+
+    Args:
+        archive_format: 'zip', 'tar' or 'md' (Markdown text only)
+
+    Returns:
+        OutputSink: The matching sink
+    """
+    return create_stream_sink(sys.stdout.buffer, archive_format)
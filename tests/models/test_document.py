@@ -0,0 +1,65 @@
+import pytest
+
+from src.models.document import Document
+from src.models.image import Image
+from src.models.paragraph import Paragraph
+
+
+def _paragraph(text, image_name=None):
+    """Build a paragraph, optionally with one image"""
+    paragraph = Paragraph()
+    paragraph.text = text
+    if image_name:
+        image = Image()
+        image.new_file_name = image_name
+        paragraph.images = [image]
+    return paragraph
+
+
+class TestLazyDocument:
+    """Tests for documents whose paragraphs are produced on demand"""
+
+    def setup_method(self):
+        """Set up a lazy document over a generator that records what it produced"""
+        self.produced = []
+
+        def blocks():
+            for text, image_name in (("one", None), ("two", "document.001.png"), ("three", None)):
+                self.produced.append(text)
+                yield _paragraph(text, image_name)
+
+        self.document = Document.lazy(blocks(), "lazy.docx")
+
+    def test_paragraphs_are_produced_while_iterating(self):
+        """Test that nothing is parsed before the paragraphs are consumed"""
+        assert self.document.is_lazy
+        assert self.produced == []
+
+        first = next(self.document.paragraphs)
+
+        assert first.text == "one"
+        assert self.produced == ["one"]
+
+    def test_images_and_count_of_consumed_paragraphs_are_kept(self):
+        """Test that images stay available after their paragraphs were rendered"""
+        texts = [paragraph.text for paragraph in self.document.paragraphs]
+
+        assert texts == ["one", "two", "three"]
+        assert self.document.paragraphs.count == 3
+        assert [image.new_file_name for image in self.document.get_images()] == ["document.001.png"]
+        assert list(self.document.paragraphs) == []
+
+    def test_eager_operations_are_rejected(self):
+        """Test that adding paragraphs or collecting tables fails clearly"""
+        with pytest.raises(TypeError):
+            self.document.add_paragraph(Paragraph())
+        with pytest.raises(TypeError):
+            self.document.get_tables()
+
+    def test_close_stops_the_source(self):
+        """Test that closing releases the generator"""
+        next(self.document.paragraphs)
+        self.document.paragraphs.close()
+
+        assert list(self.document.paragraphs) == []
+        assert self.produced == ["one"]
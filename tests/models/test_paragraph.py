@@ -0,0 +1,86 @@
+import pickle
+
+from src.models.paragraph import Paragraph
+from src.models.run import Run, BOLD, ITALIC, coalesce_runs
+
+
+class TestParagraph:
+    """Tests for the compact paragraph and run model"""
+
+    def setup_method(self):
+        """Set up a heading paragraph with two runs"""
+        self.paragraph = Paragraph()
+        self.paragraph.text = "Bold and italic"
+        self.paragraph.heading_level = 2
+        self.paragraph.add_run("Bold", {"bold": True, "italic": False, "underline": False, "strike": False})
+        self.paragraph.add_run(" and italic", {"italic": True})
+
+    def test_runs_read_like_dicts(self):
+        """Test that runs keep the old dictionary access"""
+        bold, italic = self.paragraph.runs
+
+        assert bold["text"] == "Bold"
+        assert bold["bold"] is True
+        assert italic.get("bold", False) is False
+        assert dict(italic) == {"text": " and italic", "bold": False, "italic": True,
+                                "underline": False, "strike": False}
+        assert (bold.flags, italic.flags) == (BOLD, ITALIC)
+
+    def test_assigning_dict_runs_converts_them(self):
+        """Test that runs assigned as dicts are stored as compact runs"""
+        self.paragraph.runs = [{"text": "x", "strike": True}]
+
+        assert isinstance(self.paragraph.runs[0], Run)
+        assert self.paragraph.runs[0].strike
+
+    def test_adding_dict_runs_converts_them(self):
+        """Test that dicts added through the old list API are stored as compact runs"""
+        self.paragraph.runs.append({"text": "!", "bold": True})
+        self.paragraph.runs.insert(0, {"text": ">"})
+        self.paragraph.runs.extend([{"text": "?", "italic": True}])
+        self.paragraph.runs[1] = {"text": "Bold", "underline": True}
+
+        assert all(isinstance(run, Run) for run in self.paragraph.runs)
+        assert [run.text for run in self.paragraph.runs] == [">", "Bold", " and italic", "!", "?"]
+        assert self.paragraph.runs[1].underline and self.paragraph.runs[3].bold
+
+    def test_heading_can_be_set_the_old_way(self):
+        """Test that an assigned heading is kept, and None goes back to the derived text"""
+        paragraph = Paragraph()
+        paragraph.heading = "Title"
+        assert paragraph.heading == "Title"
+
+        self.paragraph.heading = "Other"
+        assert self.paragraph.heading == "Other"
+        assert pickle.loads(pickle.dumps(self.paragraph)).heading == "Other"
+
+        self.paragraph.heading = None
+        assert self.paragraph.heading == "Bold and italic"
+
+    def test_compatibility_attributes(self):
+        """Test heading, formatting and images without per-instance storage"""
+        assert self.paragraph.heading == "Bold and italic"
+        assert not hasattr(self.paragraph, "__dict__")
+        assert not self.paragraph.has_image()
+        assert self.paragraph.image is None
+
+        self.paragraph.formatting["style"] = "x"
+        self.paragraph.images.append("image")
+        assert self.paragraph.formatting == {"style": "x"}
+        assert self.paragraph.image == "image"
+
+    def test_pickle_round_trip(self):
+        """Test that slotted paragraphs can be sent to worker processes"""
+        copy = pickle.loads(pickle.dumps(self.paragraph))
+
+        assert copy.text == self.paragraph.text
+        assert [dict(run) for run in copy.runs] == [dict(run) for run in self.paragraph.runs]
+
+    def test_coalesce_runs(self):
+        """Test that adjacent runs with equal flags are merged and empty runs dropped"""
+        runs = [Run("a", BOLD), Run("", 0), Run("b", BOLD), Run("c", ITALIC), Run("d", 0)]
+
+        merged = coalesce_runs(runs)
+
+        assert [(run.text, run.flags) for run in merged] == [("ab", BOLD), ("c", ITALIC), ("d", 0)]
+        assert merged[1] is runs[3]
@@ -1,4 +1,8 @@
+import io
 import os
+import struct
+import zipfile
+import zlib
 import pytest
 from docx import Document as DocxDocument
 from unittest.mock import MagicMock, patch
@@ -6,12 +10,22 @@ from unittest.mock import MagicMock, patch
 from src.parser.docx_parser import DocxParser
 from src.models.document import Document
 from src.models.paragraph import Paragraph
-from src.models.image import Image
 from src.models.table import Table
 
 # Path to the example docx file
 EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
 
+
+def _png_bytes(width=2, height=1):
+    """Build a minimal valid PNG image"""
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+    raw = b''.join(b'\x00' + b'\x00\x00\x00' * width for _ in range(height))
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw))
+            + chunk(b'IEND', b''))
+
 class TestDocxParser:
     """Tests for the DocxParser class"""
     
@@ -241,4 +255,79 @@ class TestDocxParser:
         assert formatting[0]["italic"] is False
         assert formatting[1]["text"] == "Italic"
         assert formatting[1]["bold"] is False
-        assert formatting[1]["italic"] is True 
\ No newline at end of file
+        assert formatting[1]["italic"] is True 
+        
+    def test_extract_all_images_from_paragraph(self, tmp_path):
+        """Test that every picture in a paragraph is extracted, with its alt text"""
+        image_path = tmp_path / "pixel.png"
+        image_path.write_bytes(_png_bytes())
+        other_image_path = tmp_path / "wide.png"
+        other_image_path.write_bytes(_png_bytes(width=3))
+        docx = DocxDocument()
+        paragraph = docx.add_paragraph()
+        paragraph.add_run().add_picture(str(image_path))
+        paragraph.add_run().add_picture(str(other_image_path))
+        docx.inline_shapes[1]._inline.docPr.set('descr', 'Second picture')
+        docx_path = str(tmp_path / "images.docx")
+        docx.save(docx_path)
+        
+        document = self.parser.parse_document(docx_path)
+        
+        assert len(document.paragraphs) == 1
+        images = document.paragraphs[0].images
+        assert [image.new_file_name for image in images] == ["document.001.png", "document.002.png"]
+        assert images[1].alt_text == "Second picture"
+        assert document.paragraphs[0].image is images[0]
+        assert len(document.get_images()) == 2
+        
+    def test_repeated_images_share_one_file(self, tmp_path):
+        """Test that identical pictures map to a single output file name"""
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(_png_bytes())
+        docx = DocxDocument()
+        for _ in range(3):
+            docx.add_paragraph().add_run().add_picture(str(image_path))
+        docx.add_paragraph().add_run().add_picture(io.BytesIO(_png_bytes(width=3)))
+        docx_path = str(tmp_path / "logos.docx")
+        docx.save(docx_path)
+        
+        document = self.parser.parse_document(docx_path)
+        
+        names = [image.new_file_name for image in document.get_images()]
+        assert names == ["document.001.png"] * 3 + ["document.002.png"]
+        
+    def test_equal_image_parts_share_one_file(self, tmp_path):
+        """Test that separate image parts with the same bytes share a file, found via the package CRC"""
+        docx = DocxDocument()
+        docx.add_paragraph().add_run().add_picture(io.BytesIO(_png_bytes()))
+        docx.add_paragraph().add_run().add_picture(io.BytesIO(_png_bytes(width=3)))
+        saved = io.BytesIO()
+        docx.save(saved)
+        # Give the second part the bytes of the first
+        docx_path = str(tmp_path / "copies.docx")
+        with zipfile.ZipFile(saved) as source, zipfile.ZipFile(docx_path, 'w') as target:
+            for info in source.infolist():
+                data = source.read('word/media/image1.png' if info.filename == 'word/media/image2.png' else info)
+                target.writestr(info, data)
+        
+        document = self.parser.parse_document(docx_path)
+        
+        names = [image.new_file_name for image in document.get_images()]
+        assert names == ["document.001.png"] * 2
+        with zipfile.ZipFile(docx_path) as package:
+            info = package.getinfo('word/media/image2.png')
+        assert self.parser._image_content_key('/word/media/image2.png', None) == (info.CRC, info.file_size)
+        
+    def test_images_with_equal_keys_are_compared(self, tmp_path):
+        """Test that different images whose content keys collide keep their own files"""
+        docx = DocxDocument()
+        docx.add_paragraph().add_run().add_picture(io.BytesIO(_png_bytes()))
+        docx.add_paragraph().add_run().add_picture(io.BytesIO(_png_bytes(width=3)))
+        docx_path = str(tmp_path / "collision.docx")
+        docx.save(docx_path)
+        
+        with patch.object(DocxParser, '_image_content_key', return_value=(0, 0)):
+            document = self.parser.parse_document(docx_path)
+        
+        names = [image.new_file_name for image in document.get_images()]
+        assert names == ["document.001.png", "document.002.png"]
\ No newline at end of file
@@ -0,0 +1,29 @@
+from src.parser.media import EMU_PER_PIXEL, emu_to_pixels, format_from_signature, image_format
+
+
+class TestImageFormat:
+    """Tests for image format and size detection"""
+
+    def test_content_type_wins(self):
+        """Test that the declared content type decides the format"""
+        assert image_format('image/jpeg', b'\x89PNG\r\n\x1a\n', 'media/image1.png') == 'jpg'
+        assert image_format('image/x-emf') == 'emf'
+
+    def test_signature_fallback(self):
+        """Test formats recognised from the first bytes of the file"""
+        assert format_from_signature(b'GIF89a\x01\x00') == 'gif'
+        assert format_from_signature(b'\xff\xd8\xff\xe0') == 'jpg'
+        assert format_from_signature(b'<?xml version="1.0"?><svg xmlns="x">') == 'svg'
+        assert format_from_signature(b'\x01\x00\x00\x00' + b'\x00' * 36 + b' EMF') == 'emf'
+        assert image_format('application/octet-stream', b'GIF87a') == 'gif'
+
+    def test_part_name_fallback(self):
+        """Test that the part name is used when nothing else is known"""
+        assert image_format(None, b'unknown', 'media/image1.JPEG') == 'jpg'
+        assert image_format(None, None, 'media/image1.bin') == 'png'
+
+    def test_emu_to_pixels(self):
+        """Test conversion of drawing extents to pixels at 96 DPI"""
+        assert emu_to_pixels(914400) == 96
+        assert emu_to_pixels(EMU_PER_PIXEL * 10 + 1) == 10
+        assert emu_to_pixels(0) == 0
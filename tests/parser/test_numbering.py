@@ -0,0 +1,93 @@
+from lxml import etree
+
+from src.parser.numbering import NumberingTable
+from src.parser.styles import StyleTable
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+NUMBERING_XML = f'''<w:numbering xmlns:w="{W}">
+  <w:abstractNum w:abstractNumId="0">
+    <w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="decimal"/></w:lvl>
+    <w:lvl w:ilvl="1"><w:start w:val="1"/><w:numFmt w:val="bullet"/></w:lvl>
+    <w:lvl w:ilvl="2"><w:start w:val="1"/><w:numFmt w:val="lowerLetter"/></w:lvl>
+  </w:abstractNum>
+  <w:abstractNum w:abstractNumId="1">
+    <w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/></w:lvl>
+  </w:abstractNum>
+  <w:abstractNum w:abstractNumId="2">
+    <w:lvl w:ilvl="0"><w:numFmt w:val="none"/></w:lvl>
+  </w:abstractNum>
+  <w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>
+  <w:num w:numId="2"><w:abstractNumId w:val="0"/></w:num>
+  <w:num w:numId="3"><w:abstractNumId w:val="0"/>
+    <w:lvlOverride w:ilvl="0"><w:startOverride w:val="5"/></w:lvlOverride></w:num>
+  <w:num w:numId="4"><w:abstractNumId w:val="1"/></w:num>
+  <w:num w:numId="5"><w:abstractNumId w:val="2"/></w:num>
+</w:numbering>'''
+
+STYLES_XML = f'''<w:styles xmlns:w="{W}">
+  <w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+  <w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/>
+    <w:basedOn w:val="Normal"/><w:pPr><w:numPr><w:numId w:val="4"/></w:numPr></w:pPr></w:style>
+  <w:style w:type="paragraph" w:styleId="MyList"><w:name w:val="My List"/><w:basedOn w:val="ListBullet"/></w:style>
+</w:styles>'''
+
+
+def _paragraph(ppr=''):
+    """Build a w:p element with the given paragraph properties"""
+    return etree.fromstring(f'<w:p xmlns:w="{W}"><w:pPr>{ppr}</w:pPr></w:p>')
+
+
+def _num_pr(num_id, ilvl=0):
+    """Build the w:numPr of a list item"""
+    return f'<w:numPr><w:ilvl w:val="{ilvl}"/><w:numId w:val="{num_id}"/></w:numPr>'
+
+
+class TestNumberingTable:
+    """Tests for the NumberingTable class"""
+
+    def setup_method(self):
+        """Setup before each test method"""
+        self.styles = StyleTable.from_element(etree.fromstring(STYLES_XML.encode('utf-8')))
+        self.table = NumberingTable.from_element(etree.fromstring(NUMBERING_XML.encode('utf-8')), self.styles)
+
+    def _items(self, *references):
+        """Number a sequence of (numId, level) list items"""
+        return [self.table.list_item(num_id, level) for num_id, level in references]
+
+    def test_nested_levels_restart_deeper_counters(self):
+        """Test numbers, bullets and the restart of a level after a higher item"""
+        assert self._items(('1', 0), ('1', 1), ('1', 2), ('1', 2), ('1', 0), ('1', 2)) == [
+            (1, 1), (2, 0), (3, 1), (3, 2), (1, 2), (3, 1)]
+
+    def test_lists_of_one_abstract_num_continue(self):
+        """Test that a num without overrides continues the numbering of its abstractNum"""
+        assert self._items(('1', 0), ('1', 0), ('2', 0)) == [(1, 1), (1, 2), (1, 3)]
+
+    def test_start_override_restarts_the_list(self):
+        """Test that a startOverride gives the list its own counter"""
+        assert self._items(('1', 0), ('3', 0), ('3', 0), ('1', 0)) == [(1, 1), (1, 5), (1, 6), (1, 2)]
+
+    def test_no_list(self):
+        """Test numId 0, unknown lists and levels without a marker"""
+        assert self._items(('0', 0), ('99', 0), ('5', 0)) == [None, None, None]
+
+    def test_paragraph_list_items(self):
+        """Test direct numbering, list styles along basedOn and plain paragraphs"""
+        paragraphs = [
+            _paragraph(_num_pr(1)),
+            _paragraph('<w:pStyle w:val="ListBullet"/>'),
+            _paragraph('<w:pStyle w:val="MyList"/>'),
+            _paragraph('<w:pStyle w:val="ListBullet"/>' + _num_pr(0)),
+            _paragraph(),
+        ]
+
+        items = [self.table.paragraph_list_item(paragraph, self.styles) for paragraph in paragraphs]
+
+        assert items == [(1, 1), (1, 0), (1, 0), None, None]
+
+    def test_document_without_numbering(self):
+        """Test that a document without a numbering part has no lists"""
+        table = NumberingTable.from_element(None)
+
+        assert table.paragraph_list_item(_paragraph(_num_pr(1)), self.styles) is None
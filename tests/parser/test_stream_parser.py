@@ -0,0 +1,181 @@
+import io
+import os
+import struct
+import zipfile
+import zlib
+import pytest
+from docx import Document as DocxDocument
+from docx.shared import Inches
+
+from src.parser.docx_parser import DocxParser
+from src.parser.stream_parser import StreamingDocxParser
+from src.writer import BytesSink, MarkdownWriter
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+
+def _summary(document):
+    """Reduce a parsed document to comparable plain data"""
+    summary = []
+    for paragraph in document.paragraphs:
+        summary.append((
+            paragraph.text,
+            paragraph.heading_level,
+            (paragraph.list_level, paragraph.list_number),
+            [dict(run) for run in paragraph.runs],
+            paragraph.image.content if paragraph.image else None,
+            paragraph.table.rows if paragraph.table else None,
+        ))
+    return summary
+
+
+def _png_bytes(width):
+    """Build a minimal valid PNG image of the given width"""
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+    raw = b'\x00' + b'\x00\x00\x00' * width
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, 1, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw))
+            + chunk(b'IEND', b''))
+
+
+class TestStreamingDocxParser:
+    """Tests for the StreamingDocxParser class"""
+
+    def test_matches_docx_parser_on_example(self):
+        """Test that both engines produce the same model for the example document"""
+        if not os.path.exists(EXAMPLE_DOCX):
+            pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+
+        expected = DocxParser().parse_document(EXAMPLE_DOCX)
+        actual = StreamingDocxParser().parse_document(EXAMPLE_DOCX)
+
+        assert actual.filename == expected.filename
+        assert _summary(actual) == _summary(expected)
+
+    def test_matches_docx_parser_on_generated_document(self, tmp_path):
+        """Test headings, formatting and merged table cells"""
+        docx = DocxDocument()
+        docx.add_heading("Title heading", level=1)
+        paragraph = docx.add_paragraph("plain ")
+        paragraph.add_run("bold").bold = True
+        paragraph.add_run(" italic").italic = True
+        docx.add_paragraph("")
+        table = docx.add_table(rows=3, cols=3)
+        table.cell(0, 0).merge(table.cell(0, 1)).text = "wide"
+        table.cell(1, 2).merge(table.cell(2, 2)).text = "tall"
+        table.cell(2, 0).text = "a\tb"
+        path = str(tmp_path / "generated.docx")
+        docx.save(path)
+
+        expected = DocxParser().parse_document(path)
+        actual = StreamingDocxParser().parse_document(path)
+
+        assert _summary(actual) == _summary(expected)
+        assert actual.paragraphs[0].heading_level == 1
+        assert actual.paragraphs[2].table.rows[0][:2] == ["wide", "wide"]
+
+    def test_identical_image_parts_share_one_file(self, tmp_path):
+        """Test that separate image parts with the same bytes map to one output file"""
+        docx = DocxDocument()
+        for width in (2, 3, 4):
+            docx.add_paragraph().add_run().add_picture(io.BytesIO(_png_bytes(width)))
+        original = str(tmp_path / "original.docx")
+        docx.save(original)
+
+        # Give the second part the bytes of the first, as other producers do
+        path = str(tmp_path / "copied.docx")
+        with zipfile.ZipFile(original) as source, zipfile.ZipFile(path, 'w') as target:
+            for info in source.infolist():
+                data = source.read(info)
+                if info.filename == 'word/media/image2.png':
+                    data = source.read('word/media/image1.png')
+                target.writestr(info, data)
+
+        for parser in (DocxParser(), StreamingDocxParser()):
+            names = [image.new_file_name for image in parser.parse_document(path).get_images()]
+            assert names == ["document.001.png", "document.001.png", "document.002.png"]
+
+    def test_image_format_and_size(self, tmp_path):
+        """Test that both engines name images by format and read their size from the drawing"""
+        gif = b'GIF89a' + struct.pack('<HH', 4, 2) + b'\x00\x00\x00' + b',' + b'\x00' * 9 + b'\x02\x02\x44\x01\x00;'
+        docx = DocxDocument()
+        docx.add_paragraph().add_run().add_picture(io.BytesIO(gif), width=Inches(1), height=Inches(0.5))
+        docx.add_paragraph().add_run().add_picture(io.BytesIO(_png_bytes(2)))
+        path = str(tmp_path / "formats.docx")
+        docx.save(path)
+
+        for parser in (DocxParser(), StreamingDocxParser()):
+            images = parser.parse_document(path).get_images()
+            assert [image.new_file_name for image in images] == ["document.001.gif", "document.002.png"]
+            assert [image.image_format for image in images] == ["gif", "png"]
+            assert (images[0].width, images[0].height) == (96, 48)
+
+
+class TestLazyParsing:
+    """Tests for parsing while the writer renders"""
+
+    @pytest.mark.parametrize("parser_class", [DocxParser, StreamingDocxParser])
+    def test_lazy_output_matches_eager_output(self, parser_class):
+        """Test that a lazy document renders the same Markdown and images as an eager one"""
+        if not os.path.exists(EXAMPLE_DOCX):
+            pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+
+        outputs = []
+        for lazy in (False, True):
+            document = parser_class().parse_document(EXAMPLE_DOCX, lazy=lazy)
+            archive = MarkdownWriter().write_document(document, "example", BytesSink())
+            with zipfile.ZipFile(io.BytesIO(archive)) as package:
+                outputs.append({name: package.read(name) for name in package.namelist()})
+
+        assert outputs[1] == outputs[0]
+        assert any(name.startswith("example_media/") for name in outputs[1])
+
+    @pytest.mark.parametrize("parser_class", [DocxParser, StreamingDocxParser])
+    def test_broken_file_fails_before_rendering(self, parser_class, tmp_path):
+        """Test that a file that is not a DOCX package fails in parse_document, even when lazy"""
+        path = tmp_path / "broken.docx"
+        path.write_bytes(b"not a zip file")
+
+        with pytest.raises(Exception):
+            parser_class().parse_document(str(path), lazy=True)
+
+
+class TestRunFormatting:
+    """Tests for run formatting in both engines"""
+
+    @pytest.mark.parametrize("parser_class", [DocxParser, StreamingDocxParser])
+    def test_style_inherited_formatting(self, parser_class, tmp_path):
+        """Test that runs in character styles such as Strong are reported as formatted"""
+        docx = DocxDocument()
+        paragraph = docx.add_paragraph("plain ")
+        paragraph.add_run("strong", style="Strong")
+        paragraph.add_run(" emphasis", style="Emphasis")
+        path = str(tmp_path / "styled.docx")
+        docx.save(path)
+
+        runs = parser_class().parse_document(path).paragraphs[0].runs
+
+        assert [(run.text, run.bold, run.italic) for run in runs] == [
+            ("plain ", False, False), ("strong", True, False), (" emphasis", False, True)]
+
+
+class TestLists:
+    """Tests for list detection in both engines"""
+
+    @pytest.mark.parametrize("parser_class", [DocxParser, StreamingDocxParser])
+    def test_list_styles_are_numbered(self, parser_class, tmp_path):
+        """Test that Word lists are found from numbering.xml, not from the text"""
+        docx = DocxDocument()
+        for text, style in (("apples", "List Bullet"), ("first", "List Number"), ("", "List Number"),
+                            ("third", "List Number"), ("- not a list", None)):
+            docx.add_paragraph(text, style=style)
+        path = str(tmp_path / "lists.docx")
+        docx.save(path)
+
+        document = parser_class().parse_document(path)
+
+        assert [(p.text, p.list_level, p.list_number) for p in document.paragraphs] == [
+            ("apples", 1, 0), ("first", 1, 1), ("third", 1, 3), ("- not a list", 0, 0)]
@@ -0,0 +1,97 @@
+from lxml import etree
+
+from src.models.run import BOLD, ITALIC, UNDERLINE, STRIKE
+from src.parser.styles import StyleTable
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+STYLES_XML = f'''<w:styles xmlns:w="{W}">
+  <w:style w:type="paragraph" w:default="1" w:styleId="a"><w:name w:val="Normal"/></w:style>
+  <w:style w:type="paragraph" w:styleId="1"><w:name w:val="heading 1"/><w:basedOn w:val="a"/>
+    <w:pPr><w:outlineLvl w:val="0"/></w:pPr></w:style>
+  <w:style w:type="paragraph" w:styleId="ru2"><w:name w:val="Заголовок 2"/><w:basedOn w:val="a"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Custom"><w:name w:val="My Heading"/><w:basedOn w:val="1"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Outline"><w:name w:val="Section"/>
+    <w:pPr><w:outlineLvl w:val="3"/></w:pPr></w:style>
+  <w:style w:type="paragraph" w:styleId="Body"><w:name w:val="Body"/><w:basedOn w:val="Outline"/>
+    <w:pPr><w:outlineLvl w:val="9"/></w:pPr></w:style>
+  <w:style w:type="paragraph" w:styleId="Sub"><w:name w:val="Subtitle"/></w:style>
+  <w:style w:type="character" w:styleId="1Char"><w:name w:val="heading 1 Char"/></w:style>
+</w:styles>'''
+
+
+def _paragraph(ppr=''):
+    """Build a w:p element with the given paragraph properties"""
+    return etree.fromstring(f'<w:p xmlns:w="{W}"><w:pPr>{ppr}</w:pPr></w:p>')
+
+
+class TestStyleTable:
+    """Tests for the StyleTable class"""
+
+    def setup_method(self):
+        """Setup before each test method"""
+        self.table = StyleTable.from_element(etree.fromstring(STYLES_XML.encode('utf-8')))
+
+    def test_resolves_heading_levels(self):
+        """Test names, localized names, basedOn inheritance and outline levels"""
+        assert self.table.heading_level('a') == 0
+        assert self.table.heading_level('1') == 1
+        assert self.table.heading_level('ru2') == 2
+        assert self.table.heading_level('Custom') == 1
+        assert self.table.heading_level('Outline') == 4
+        assert self.table.heading_level('Body') == 0
+        assert self.table.heading_level('Sub') == 2
+
+    def test_unknown_styles_use_default(self):
+        """Test that missing and non-paragraph styles resolve to the default style"""
+        assert self.table.heading_level(None) == 0
+        assert self.table.heading_level('1Char') == 0
+
+    def test_paragraph_outline_level_overrides_style(self):
+        """Test that w:outlineLvl in paragraph properties wins over the style"""
+        styled = '<w:pStyle w:val="ru2"/>'
+        assert self.table.paragraph_heading_level(_paragraph(styled)) == 2
+        assert self.table.paragraph_heading_level(_paragraph(styled + '<w:outlineLvl w:val="2"/>')) == 3
+        assert self.table.paragraph_heading_level(_paragraph('<w:outlineLvl w:val="9"/>')) == 0
+
+
+FORMAT_STYLES_XML = f'''<w:styles xmlns:w="{W}">
+  <w:docDefaults><w:rPrDefault><w:rPr><w:i/></w:rPr></w:rPrDefault></w:docDefaults>
+  <w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/>
+    <w:rPr><w:i w:val="0"/></w:rPr></w:style>
+  <w:style w:type="paragraph" w:styleId="Quote"><w:name w:val="Quote"/><w:basedOn w:val="Normal"/>
+    <w:rPr><w:i/><w:u w:val="single"/></w:rPr></w:style>
+  <w:style w:type="character" w:styleId="Strong"><w:name w:val="Strong"/><w:rPr><w:b/></w:rPr></w:style>
+  <w:style w:type="character" w:styleId="Plain"><w:name w:val="Plain"/><w:basedOn w:val="Strong"/>
+    <w:rPr><w:u w:val="none"/></w:rPr></w:style>
+</w:styles>'''
+
+
+def _run_properties(rpr):
+    """Build a w:rPr element with the given content"""
+    return etree.fromstring(f'<w:rPr xmlns:w="{W}">{rpr}</w:rPr>')
+
+
+class TestStyleRunFormatting:
+    """Tests for run formatting inherited from styles"""
+
+    def setup_method(self):
+        """Setup before each test method"""
+        self.table = StyleTable.from_element(etree.fromstring(FORMAT_STYLES_XML.encode('utf-8')))
+
+    def test_paragraph_styles_merge_defaults_and_based_on(self):
+        """Test that paragraph styles override document defaults along the basedOn chain"""
+        assert self.table.default_flags == ITALIC
+        assert self.table.paragraph_run_flags(_paragraph()) == 0
+        assert self.table.paragraph_run_flags(_paragraph('<w:pStyle w:val="Quote"/>')) == ITALIC | UNDERLINE
+        assert self.table.paragraph_run_flags(_paragraph('<w:pStyle w:val="Missing"/>')) == 0
+
+    def test_character_style_and_direct_formatting(self):
+        """Test that character styles apply before direct formatting, which wins"""
+        quote = ITALIC | UNDERLINE
+
+        assert self.table.run_flags(quote, None) == quote
+        assert self.table.run_flags(0, _run_properties('<w:rStyle w:val="Strong"/>')) == BOLD
+        assert self.table.run_flags(quote, _run_properties('<w:rStyle w:val="Plain"/>')) == BOLD | ITALIC
+        assert self.table.run_flags(quote, _run_properties('<w:rStyle w:val="Strong"/><w:b w:val="0"/>'
+                                                           '<w:strike/>')) == quote | STRIKE
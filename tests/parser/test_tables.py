@@ -0,0 +1,74 @@
+from docx import Document as DocxDocument
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from src.parser.tables import extract_table
+
+
+def _python_docx_rows(table):
+    """Read the rows of a table through python-docx's cell grid"""
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+class TestExtractTable:
+    """Tests for table extraction from w:tbl elements"""
+
+    def setup_method(self):
+        """Set up a table with horizontally and vertically merged cells"""
+        self.table = DocxDocument().add_table(rows=4, cols=3)
+        for row_index, row in enumerate(self.table.rows):
+            for col_index, cell in enumerate(row.cells):
+                cell.text = f"r{row_index}c{col_index}"
+        self.table.cell(0, 0).merge(self.table.cell(0, 1)).text = "wide"
+        self.table.cell(1, 2).merge(self.table.cell(3, 2)).text = "tall"
+
+    def test_rows_match_python_docx(self):
+        """Test that merged cells repeat their text like python-docx's row.cells"""
+        table = extract_table(self.table._tbl)
+
+        assert table.rows == _python_docx_rows(self.table)
+        assert table.rows[0] == ["wide", "wide", "r0c2"]
+        assert [row[2] for row in table.rows[1:]] == ["tall"] * 3
+
+    def test_records_spans(self):
+        """Test that the spans of merged cells are recorded once, at their origin"""
+        table = extract_table(self.table._tbl)
+
+        assert table.get_span(0, 0) == (1, 2)
+        assert table.get_span(1, 2) == (3, 1)
+        assert table.get_span(2, 2) == (1, 1)
+        assert len(table.cell_spans) == 2
+
+    def test_rows_starting_after_the_first_column(self):
+        """Test rows with w:gridBefore, which python-docx leaves out of row.cells"""
+        tr = self.table.rows[3]._tr
+        tr.remove(tr.tc_lst[0])
+        tr_pr = tr.get_or_add_trPr()
+        grid_before = OxmlElement('w:gridBefore')
+        grid_before.set(qn('w:val'), '1')
+        tr_pr.append(grid_before)
+
+        table = extract_table(self.table._tbl)
+
+        assert table.rows == _python_docx_rows(self.table)
+        assert table.rows[3] == ["r3c1", "tall"]
+
+    def test_vertical_merge_below_grid_before(self):
+        """Test that a vertical merge starting after w:gridBefore is recorded at its grid column"""
+        docx_table = DocxDocument().add_table(rows=3, cols=3)
+        for row_index, row in enumerate(docx_table.rows):
+            for col_index, cell in enumerate(row.cells):
+                cell.text = f"r{row_index}c{col_index}"
+        docx_table.cell(0, 1).merge(docx_table.cell(1, 1)).text = "tall"
+        tr = docx_table.rows[0]._tr
+        tr.remove(tr.tc_lst[0])
+        grid_before = OxmlElement('w:gridBefore')
+        grid_before.set(qn('w:val'), '1')
+        tr.get_or_add_trPr().append(grid_before)
+
+        table = extract_table(docx_table._tbl)
+
+        assert table.rows[:2] == [["tall", "r0c2"], ["r1c0", "tall", "r1c2"]]
+        assert table.get_span(0, 1) == (2, 1)
+        assert table.get_span(0, 0) == (1, 1)
+        assert len(table.cell_spans) == 1
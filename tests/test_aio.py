@@ -0,0 +1,119 @@
+import asyncio
+import os
+import shutil
+import threading
+import pytest
+
+from src.aio import AsyncConverter, convert_batch_async, convert_docx_to_markdown_async
+from src.main import convert_docx_to_markdown
+from src.writer import BytesSink, ConversionCancelled
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+
+@pytest.fixture
+def example_docx(tmp_path):
+    """Copy the example document into a temporary directory"""
+    if not os.path.exists(EXAMPLE_DOCX):
+        pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+    path = tmp_path / "example.docx"
+    shutil.copy(EXAMPLE_DOCX, path)
+    return path
+
+
+class TestAsyncConversion:
+    """Tests for the asyncio API"""
+
+    def test_convert_returns_the_zip_path(self, example_docx, tmp_path):
+        """Test that the async entry point produces the same output as the blocking one"""
+        out = tmp_path / "out"
+
+        zip_path = asyncio.run(convert_docx_to_markdown_async(str(example_docx), str(out), output_format='zip'))
+
+        assert zip_path == str(out / "example.zip")
+        assert os.path.isfile(zip_path)
+
+    def test_batch_captures_errors_per_file(self, example_docx, tmp_path):
+        """Test that the async batch helper reports every file"""
+        broken = tmp_path / "broken.docx"
+        broken.write_bytes(b"not a zip")
+
+        results = asyncio.run(convert_batch_async([str(example_docx), str(broken)], str(tmp_path / "out"),
+                                                  concurrency=2, output_format='zip'))
+
+        assert [result.success for result in results] == [True, False]
+
+    def test_event_loop_stays_responsive(self, example_docx):
+        """Test that other coroutines keep running while conversions are in flight"""
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            tick_task = asyncio.create_task(ticker())
+            async with AsyncConverter(concurrency=2) as converter:
+                outputs = await asyncio.gather(*(converter.convert(str(example_docx), sink=BytesSink())
+                                                 for _ in range(3)))
+            tick_task.cancel()
+            return outputs, ticks
+
+        outputs, ticks = asyncio.run(main())
+
+        assert len({len(output) for output in outputs}) == 1
+        assert ticks > 1
+
+    def test_cancelled_conversion_raises(self, example_docx):
+        """Test that cancelling the awaiting task cancels the conversion"""
+        async def main():
+            async with AsyncConverter(concurrency=1) as converter:
+                task = asyncio.create_task(converter.convert(str(example_docx), sink=BytesSink()))
+                await asyncio.sleep(0)
+                task.cancel()
+                await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(main())
+
+    def test_cancel_event_stops_a_running_conversion(self, example_docx):
+        """Test that a set cancellation event ends the conversion with ConversionCancelled"""
+        event = threading.Event()
+        event.set()
+
+        with pytest.raises(ConversionCancelled):
+            convert_docx_to_markdown(str(example_docx), sink=BytesSink(), cancel_event=event)
+
+    def test_converter_created_outside_the_loop(self, example_docx):
+        """Test that a converter built before asyncio.run() works inside its loop"""
+        other_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(other_loop)
+        try:
+            converter = AsyncConverter(concurrency=1)
+        finally:
+            asyncio.set_event_loop(None)
+            other_loop.close()
+
+        async def main():
+            async with converter:
+                # The second conversion waits on the semaphore
+                return await asyncio.gather(*(converter.convert(str(example_docx), sink=BytesSink('md'))
+                                              for _ in range(2)))
+
+        expected = convert_docx_to_markdown(str(example_docx), sink=BytesSink('md'))
+        assert asyncio.run(main()) == [expected, expected]
+
+    def test_caller_cancel_event_is_kept(self, example_docx):
+        """Test that a cancellation event passed by the caller still stops the conversion"""
+        event = threading.Event()
+        event.set()
+
+        async def main():
+            async with AsyncConverter(concurrency=1) as converter:
+                await converter.convert(str(example_docx), sink=BytesSink('md'), cancel_event=event)
+
+        with pytest.raises(ConversionCancelled):
+            asyncio.run(main())
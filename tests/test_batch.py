@@ -0,0 +1,59 @@
+import os
+import shutil
+import pytest
+
+from src.batch import collect_tasks, convert_batch, ConversionResult
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+
+@pytest.fixture
+def input_tree(tmp_path):
+    """Create a small tree of documents to convert"""
+    if not os.path.exists(EXAMPLE_DOCX):
+        pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+
+    root = tmp_path / "in"
+    (root / "sub").mkdir(parents=True)
+    shutil.copy(EXAMPLE_DOCX, root / "a.docx")
+    shutil.copy(EXAMPLE_DOCX, root / "sub" / "b.docx")
+    (root / "~$a.docx").write_bytes(b"lock file")
+    (root / "notes.txt").write_text("not a document")
+    return root
+
+
+class TestBatch:
+    """Tests for batch conversion"""
+
+    def test_collect_tasks_mirrors_tree(self, input_tree, tmp_path):
+        """Test that nested files map to the mirrored output directory"""
+        out = str(tmp_path / "out")
+        tasks = collect_tasks(str(input_tree), out, recursive=True)
+
+        assert tasks == [
+            (os.path.join(str(input_tree), "a.docx"), os.path.normpath(out)),
+            (os.path.join(str(input_tree), "sub", "b.docx"), os.path.join(out, "sub")),
+        ]
+
+    def test_collect_tasks_non_recursive(self, input_tree, tmp_path):
+        """Test that subdirectories are skipped without recursive"""
+        tasks = collect_tasks(str(input_tree), str(tmp_path / "out"))
+
+        assert [os.path.basename(task[0]) for task in tasks] == ["a.docx"]
+
+    def test_convert_batch_reports_each_file(self, input_tree, tmp_path):
+        """Test that every file gets a result and failures are captured"""
+        (input_tree / "broken.docx").write_bytes(b"not a zip")
+        out = tmp_path / "out"
+
+        results = convert_batch(str(input_tree), str(out), recursive=True, jobs=1)
+
+        assert len(results) == 3
+        assert all(isinstance(result, ConversionResult) for result in results)
+        by_name = {os.path.basename(result.input_file): result for result in results}
+        assert by_name["a.docx"].success
+        assert os.path.isfile(by_name["a.docx"].output_path)
+        assert os.path.isfile(out / "sub" / "b.zip")
+        assert not by_name["broken.docx"].success
+        assert by_name["broken.docx"].error
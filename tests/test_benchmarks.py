@@ -0,0 +1,46 @@
+from benchmarks.corpus import CorpusSpec, generate_docx
+from benchmarks.escaping import ESCAPE_FUNCTIONS, SAMPLE_LENGTHS, benchmark_escaping
+from benchmarks.run import benchmark_document, compare_reports
+from src.parser.docx_parser import DocxParser
+
+
+class TestBenchmarks:
+    """Tests for the benchmark corpus generator and runner"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.spec = CorpusSpec('tiny', paragraphs=6, runs_per_paragraph=3, tables=2,
+                               table_rows=3, table_cols=3, merges=True, images=2,
+                               heading_depth=2, section_length=3)
+
+    def test_generated_document_has_requested_shape(self, tmp_path):
+        """Test that the generated document contains the requested elements"""
+        path = generate_docx(str(tmp_path / "tiny.docx"), self.spec)
+
+        document = DocxParser().parse_document(path)
+
+        assert len(document.get_tables()) == 2
+        assert len(document.get_images()) == 2
+        assert len([p for p in document.paragraphs if p.heading_level]) == 2
+
+    def test_benchmark_document_reports_timings(self, tmp_path):
+        """Test that a benchmark result holds separate parse and write timings"""
+        path = generate_docx(str(tmp_path / "tiny.docx"), self.spec)
+
+        result = benchmark_document(path, repeat=1)
+
+        assert result["document"] == "tiny.docx"
+        assert result["parse"]["median"] > 0
+        assert result["write"]["median"] > 0
+        assert result["peak_memory"] > 0
+
+        report = {"commit": "a", "results": [result]}
+        lines = compare_reports(report, report)
+        assert "parse x1.00" in lines[1]
+
+    def test_escaping_benchmark_times_every_function(self):
+        """Test that the escaping micro-benchmark reports each function per text"""
+        results = benchmark_escaping(number=2, repeat=1)
+
+        assert len(results) == 3 * len(SAMPLE_LENGTHS)
+        assert all(result[name] > 0 for result in results for name in ESCAPE_FUNCTIONS)
@@ -0,0 +1,95 @@
+import io
+import os
+import time
+import zipfile
+import pytest
+
+from src.cache import ConversionCache
+from src.main import convert_docx_to_markdown
+from src.writer import BytesSink
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+
+def _read_archive(data):
+    """Read all entries of an in-memory archive into a dictionary"""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+class TestConversionCache:
+    """Tests for the conversion cache"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        if not os.path.exists(EXAMPLE_DOCX):
+            pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+
+    def test_second_conversion_is_a_hit(self, tmp_path):
+        """Test that converting the same file twice reuses the cached output"""
+        cache = ConversionCache(str(tmp_path / "cache"))
+
+        first = convert_docx_to_markdown(EXAMPLE_DOCX, sink=BytesSink(), cache=cache)
+        second = convert_docx_to_markdown(EXAMPLE_DOCX, sink=BytesSink(), cache=cache)
+
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert _read_archive(second) == _read_archive(first)
+
+    def test_key_depends_on_options(self, tmp_path):
+        """Test that options influencing the output change the key"""
+        cache = ConversionCache(str(tmp_path / "cache"))
+
+        assert cache.make_key(EXAMPLE_DOCX, engine='docx') == cache.make_key(EXAMPLE_DOCX, engine='docx')
+        assert cache.make_key(EXAMPLE_DOCX, engine='docx') != cache.make_key(EXAMPLE_DOCX, engine='stream')
+
+    def test_replay_into_directory(self, tmp_path):
+        """Test that a cache hit still produces the .md file, media folder and ZIP"""
+        cache = ConversionCache(str(tmp_path / "cache"))
+        convert_docx_to_markdown(EXAMPLE_DOCX, str(tmp_path / "first"), cache=cache)
+
+        zip_path = convert_docx_to_markdown(EXAMPLE_DOCX, str(tmp_path / "second"), cache=cache)
+
+        assert cache.hits == 1
+        assert os.path.isfile(zip_path)
+        assert os.path.isfile(tmp_path / "second" / "example_min.md")
+        assert (tmp_path / "second" / "example_min.md").read_bytes() == \
+            (tmp_path / "first" / "example_min.md").read_bytes()
+
+    def test_evict_removes_least_recently_used(self, tmp_path):
+        """Test that eviction drops the oldest entries first"""
+        cache = ConversionCache(str(tmp_path / "cache"), max_size=150)
+        for index, key in enumerate(["aa01", "bb02", "cc03"]):
+            path = cache._entry_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b"x" * 100)
+            os.utime(path, (time.time() - 100 + index, time.time() - 100 + index))
+
+        cache.evict()
+
+        assert cache.get("aa01") is None
+        assert cache.get("bb02") is None
+        assert cache.get("cc03") is not None
+
+    def test_entry_evicted_before_replay_is_a_miss(self, tmp_path):
+        """Test that an entry removed between lookup and replay is converted again"""
+        cache = ConversionCache(str(tmp_path / "cache"))
+        expected = convert_docx_to_markdown(EXAMPLE_DOCX, sink=BytesSink(), cache=cache)
+        lookup = cache.get
+
+        def get_then_evict(key):
+            path = lookup(key)
+            os.remove(path)
+            return path
+
+        cache.get = get_then_evict
+        result = convert_docx_to_markdown(EXAMPLE_DOCX, sink=BytesSink(), cache=cache)
+
+        assert (cache.misses, cache.hits) == (2, 0)
+        assert _read_archive(result) == _read_archive(expected)
+
+        # The new conversion was stored again
+        del cache.get
+        convert_docx_to_markdown(EXAMPLE_DOCX, sink=BytesSink(), cache=cache)
+        assert cache.hits == 1
@@ -0,0 +1,72 @@
+import os
+import pytest
+
+from src.main import convert_docx_to_markdown
+from src.memory import MemoryBudget, MemoryBudgetExceeded, current_memory, estimate_memory
+from src.server import convert_bytes
+from src.writer import BytesSink, CheckedSink
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+_MIB = 1024 * 1024
+
+
+class TestMemoryBudget:
+    """Tests for memory-budgeted conversions"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        if not os.path.exists(EXAMPLE_DOCX):
+            pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+
+    def test_stream_engine_needs_less(self):
+        """Test that the estimate favours the stream engine, which keeps no document tree"""
+        assert 0 < estimate_memory(EXAMPLE_DOCX, 'stream') < estimate_memory(EXAMPLE_DOCX, 'docx')
+
+    def test_input_over_budget_fails_before_parsing(self):
+        """Test that a document that cannot fit is refused with the estimate in the message"""
+        # Halfway between the two estimates
+        needed = (estimate_memory(EXAMPLE_DOCX, 'stream') + estimate_memory(EXAMPLE_DOCX, 'docx')) // 2
+        budget = MemoryBudget(current_memory() + needed)
+
+        with pytest.raises(MemoryBudgetExceeded, match='--engine stream'):
+            budget.check_input(EXAMPLE_DOCX, 'docx')
+        budget.check_input(EXAMPLE_DOCX, 'stream')
+
+    def test_check_polls_every_interval(self):
+        """Test that check() reads the resident size on the first call and then every interval"""
+        budget = MemoryBudget(current_memory() + 64 * _MIB, check_interval=4)
+        budget.check()
+        budget.limit = 1
+        for _ in range(3):
+            budget.check()
+        with pytest.raises(MemoryBudgetExceeded, match='over the budget'):
+            budget.check()
+
+    def test_memory_error_is_reported(self):
+        """Test that a failed allocation inside the budget becomes MemoryBudgetExceeded"""
+        with pytest.raises(MemoryBudgetExceeded, match='budget of 64 MiB') as error:
+            with MemoryBudget(64 * _MIB):
+                raise MemoryError()
+        assert isinstance(error.value.__cause__, MemoryError)
+
+    def test_checked_sink_stops_writing(self):
+        """Test that a failing check stops the conversion and closes the sink"""
+        def check():
+            raise MemoryBudgetExceeded("over")
+
+        sink = BytesSink('md')
+        with pytest.raises(MemoryBudgetExceeded):
+            convert_docx_to_markdown(EXAMPLE_DOCX, sink=CheckedSink(sink, check))
+
+    def test_conversion_within_budget(self):
+        """Test that a budget that fits does not change the output"""
+        expected = convert_docx_to_markdown(EXAMPLE_DOCX, engine='stream', sink=BytesSink('md'))
+        max_memory = current_memory() + 256 * _MIB
+
+        assert convert_docx_to_markdown(EXAMPLE_DOCX, engine='stream', sink=BytesSink('md'),
+                                        max_memory=max_memory) == expected
+        with open(EXAMPLE_DOCX, 'rb') as f:
+            assert convert_bytes(f.read(), name='example_min', output_format='md', engine='stream',
+                                 max_memory=max_memory) == expected
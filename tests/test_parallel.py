@@ -0,0 +1,62 @@
+import io
+import os
+import zipfile
+import pytest
+
+from src.main import convert_docx_to_markdown
+from src.parallel import write_document_parallel
+from src.parser.stream_parser import StreamingDocxParser
+from src.writer import BytesSink, MarkdownWriter
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+
+def _read_archive(data):
+    """Read all entries of an in-memory archive into a dictionary"""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+class TestParallelConversion:
+    """Tests for converting one document in worker processes"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        if not os.path.exists(EXAMPLE_DOCX):
+            pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+
+    def test_block_sources_parse_like_the_stream(self):
+        """Test that blocks parsed from their sources match the streamed paragraphs"""
+        streamed = list(StreamingDocxParser().parse_document(EXAMPLE_DOCX).paragraphs)
+
+        parser = StreamingDocxParser()
+        sources = list(parser.iter_block_sources(EXAMPLE_DOCX))
+        worker = StreamingDocxParser()
+        worker.style_table = parser.style_table
+        parsed = [paragraph for paragraph in map(worker.parse_block_source, sources) if paragraph is not None]
+
+        assert len(sources) >= len(parsed) == len(streamed)
+        assert [(p.text, p.heading_level, p.list_level, p.list_number) for p in parsed] == \
+            [(p.text, p.heading_level, p.list_level, p.list_number) for p in streamed]
+        assert [image.new_file_name for p in parsed for image in p.images] == \
+            [image.new_file_name for p in streamed for image in p.images]
+
+    def test_output_matches_serial_conversion(self):
+        """Test that small chunks on two workers give the archive of a serial conversion"""
+        expected = convert_docx_to_markdown(EXAMPLE_DOCX, engine='stream', sink=BytesSink(),
+                                            sized_images=True)
+        writer = MarkdownWriter(sized_images=True)
+
+        output = write_document_parallel(EXAMPLE_DOCX, 'example_min', BytesSink(), writer, jobs=2, chunk_size=3)
+
+        assert _read_archive(output) == _read_archive(expected)
+
+    def test_render_jobs_option(self):
+        """Test that render_jobs needs the stream engine and keeps the Markdown"""
+        expected = convert_docx_to_markdown(EXAMPLE_DOCX, engine='stream', sink=BytesSink('md'))
+
+        assert convert_docx_to_markdown(EXAMPLE_DOCX, engine='stream', sink=BytesSink('md'),
+                                        render_jobs=2) == expected
+        with pytest.raises(ValueError, match='stream engine'):
+            convert_docx_to_markdown(EXAMPLE_DOCX, engine='docx', sink=BytesSink('md'), render_jobs=2)
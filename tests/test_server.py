@@ -0,0 +1,176 @@
+import http.client
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+import pytest
+
+from src.server import DEFAULT_TIMEOUT, ConversionServer, convert_bytes
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+
+def _slow_convert_bytes(data, **options):
+    """Stand-in for convert_bytes that takes longer than the test timeout"""
+    time.sleep(1.5)
+    return b''
+
+
+def _crashing_convert_bytes(data, **options):
+    """Stand-in for convert_bytes whose worker dies, as when it is killed over its memory limit"""
+    os._exit(1)
+
+
+@pytest.fixture(scope='module')
+def server():
+    """Run a server with one worker and no queue on a free localhost port"""
+    server = ConversionServer(('127.0.0.1', 0), workers=1, queue_size=0, max_size=4 * 1024 * 1024, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(server, method, path, body=None):
+    """Send a request to the server and return the status, headers and body"""
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=60)
+    try:
+        connection.request(method, path, body=body)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def _request_headers(server, path, length):
+    """Announce a body of the given length but send only the headers, as a refused client would"""
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=60)
+    try:
+        connection.putrequest('POST', path)
+        connection.putheader('Content-Length', str(length))
+        connection.endheaders()
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+@pytest.fixture(scope='module')
+def docx_bytes():
+    """Content of the example document"""
+    if not os.path.exists(EXAMPLE_DOCX):
+        pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+    with open(EXAMPLE_DOCX, 'rb') as f:
+        return f.read()
+
+
+class TestConversionServer:
+    """Tests for the HTTP conversion service, on localhost"""
+
+    def test_convert_returns_zip(self, server, docx_bytes):
+        """Test that a .docx body is answered with the zip of its conversion"""
+        status, headers, body = _request(server, 'POST', '/convert?name=report.docx', docx_bytes)
+
+        assert status == 200
+        assert headers['Content-Type'] == 'application/zip'
+        assert 'report.zip' in headers['Content-Disposition']
+        with zipfile.ZipFile(io.BytesIO(body)) as archive:
+            names = archive.namelist()
+        assert 'report.md' in names
+        assert any(name.startswith('report_media/') for name in names)
+
+    def test_convert_returns_markdown(self, server, docx_bytes):
+        """Test that format=md returns the same Markdown as an in-process conversion"""
+        status, headers, body = _request(server, 'POST', '/convert?format=md&engine=stream', docx_bytes)
+
+        assert status == 200
+        assert headers['Content-Type'].startswith('text/markdown')
+        assert body == convert_bytes(docx_bytes, output_format='md', engine='stream')
+
+    def test_invalid_document_is_rejected(self, server):
+        """Test that a body that is not a DOCX package gets 422"""
+        status, _, body = _request(server, 'POST', '/convert', b'not a docx')
+
+        assert status == 422
+        assert json.loads(body)['error'].startswith('Conversion failed')
+
+    def test_size_limit(self, server):
+        """Test that bodies above the limit get 413 without being converted"""
+        status, headers, _ = _request_headers(server, '/convert', server.max_size + 1)
+
+        assert status == 413
+        assert headers['Connection'] == 'close'
+
+    def test_busy_server_returns_503(self, server, docx_bytes):
+        """Test that requests beyond the workers and queue are refused"""
+        assert server.slots.acquire(blocking=False)
+        try:
+            status, headers, _ = _request_headers(server, '/convert', len(docx_bytes))
+        finally:
+            server.slots.release()
+
+        assert status == 503
+        assert headers['Retry-After'] == '1'
+
+    def test_bad_options_and_health(self, server):
+        """Test option validation and the health endpoint"""
+        assert _request(server, 'POST', '/convert?format=pdf', b'data')[0] == 400
+        assert _request(server, 'GET', '/missing')[0] == 404
+
+        status, _, body = _request(server, 'GET', '/health')
+
+        assert status == 200
+        assert json.loads(body) == {"status": "ok", "workers": 1, "queue_size": 0, "in_flight": 0}
+
+    def test_failed_bind_stops_the_workers(self, server):
+        """Test that the worker pool is shut down when the address is taken"""
+        pools = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        with patch('src.server.ProcessPoolExecutor', RecordingPool), pytest.raises(OSError):
+            ConversionServer(server.server_address[:2], workers=1, quiet=True)
+
+        with pytest.raises(RuntimeError, match='shutdown'):
+            pools[0].submit(os.getpid)
+
+    def test_timed_out_conversion_keeps_its_slot(self, server, docx_bytes):
+        """Test that a conversion still running after a timeout makes the next request get 503"""
+        server.conversion_timeout = 0.3
+        try:
+            # Submitted by reference, so the worker runs the stand-in too
+            with patch('src.server.convert_bytes', _slow_convert_bytes):
+                assert _request(server, 'POST', '/convert', docx_bytes)[0] == 504
+                assert _request_headers(server, '/convert', len(docx_bytes))[0] == 503
+
+                deadline = time.monotonic() + 10
+                while server.in_flight and time.monotonic() < deadline:
+                    time.sleep(0.05)
+
+            # Once the worker is done, the slot is free again
+            assert server.in_flight == 0
+            assert server.slots.acquire(blocking=False)
+            server.slots.release()
+        finally:
+            server.conversion_timeout = DEFAULT_TIMEOUT
+
+    def test_pool_is_replaced_after_a_worker_dies(self, server, docx_bytes):
+        """Test that requests succeed again once a worker has died"""
+        with patch('src.server.convert_bytes', _crashing_convert_bytes):
+            assert _request(server, 'POST', '/convert?format=md', docx_bytes)[0] == 500
+        assert _request(server, 'POST', '/convert?format=md', docx_bytes)[0] == 200
+
+        # A worker dying between requests breaks the pool before the next submit
+        with pytest.raises(BrokenProcessPool):
+            server.pool.submit(os._exit, 1).result()
+        assert _request(server, 'POST', '/convert?format=md', docx_bytes)[0] == 200
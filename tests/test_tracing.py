@@ -0,0 +1,103 @@
+import io
+import json
+import os
+import time
+from unittest.mock import patch
+import pytest
+
+from src import tracing
+from src.main import convert_docx_to_markdown
+from src.parser.docx_parser import DocxParser
+from src.writer import BytesSink, MarkdownWriter
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+
+class TestTracing:
+    """Tests for conversion tracing spans"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.spans = []
+
+    def teardown_method(self):
+        """Leave tracing disabled for other tests"""
+        tracing.disable()
+
+    def test_disabled_spans_are_no_ops(self):
+        """Test that spans do nothing while tracing is disabled"""
+        with tracing.span('stage') as stage:
+            stage.count('items', 3)
+
+        assert not tracing.is_enabled()
+        assert stage is tracing.span('other')
+
+    def test_nested_spans_are_exported(self):
+        """Test that finished spans reach the exporter with parent, duration and counts"""
+        tracing.enable(self.spans.append)
+
+        with tracing.span('outer'):
+            with tracing.span('inner') as inner:
+                inner.count('rows', 2)
+                inner.count('rows')
+
+        assert [span.name for span in self.spans] == ['inner', 'outer']
+        assert self.spans[0].parent is self.spans[1]
+        assert self.spans[0].counts == {'rows': 3}
+        assert self.spans[1].duration >= self.spans[0].duration
+
+    def test_json_lines_export(self):
+        """Test that spans are written as one JSON object per line"""
+        stream = io.StringIO()
+        tracing.enable(tracing.JsonLinesExporter(stream))
+
+        with tracing.span('stage') as stage:
+            stage.set('file', 'a.docx')
+
+        record = json.loads(stream.getvalue())
+        assert record['name'] == 'stage'
+        assert record['attributes'] == {'file': 'a.docx'}
+
+    def test_parser_records_stages(self):
+        """Test that parsing a document records its stages"""
+        if not os.path.exists(EXAMPLE_DOCX):
+            pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+        tracing.enable(self.spans.append)
+
+        DocxParser().parse_document(EXAMPLE_DOCX)
+
+        by_name = {span.name: span for span in self.spans}
+        assert {'load_package', 'process_elements', 'parse_table', 'parse_document'} <= set(by_name)
+        assert by_name['process_elements'].counts['paragraphs'] > 0
+
+    @pytest.mark.parametrize("engine", ['docx', 'stream'])
+    def test_parse_spans_leave_out_writer_time(self, engine):
+        """Test that lazily parsed blocks are traced apart from the writer that renders them"""
+        if not os.path.exists(EXAMPLE_DOCX):
+            pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+        tracing.enable(self.spans.append)
+        format_paragraph = MarkdownWriter._format_paragraph
+        delay = 0.005
+
+        def slow_format_paragraph(writer, paragraph):
+            time.sleep(delay)
+            return format_paragraph(writer, paragraph)
+
+        with patch.object(MarkdownWriter, '_format_paragraph', slow_format_paragraph):
+            convert_docx_to_markdown(EXAMPLE_DOCX, engine=engine, sink=BytesSink('md'))
+
+        by_name = {span.name: span for span in self.spans}
+        convert = by_name['convert']
+        parse_document = by_name['parse_document']
+        process_elements = by_name['process_elements']
+        writer_time = delay * process_elements.counts['paragraphs']
+
+        assert parse_document.parent is convert
+        assert by_name['load_package'].parent is parse_document
+        assert process_elements.parent is convert
+        assert by_name['parse_table'].parent is process_elements
+        assert by_name['write_markdown'].parent is convert
+        assert parse_document.start + parse_document.duration <= process_elements.start
+        assert parse_document.duration < writer_time
+        assert process_elements.duration < writer_time <= by_name['write_markdown'].duration
@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+import pytest
+from docx import Document as DocxDocument
+
+from src.watch import FolderWatcher, MANIFEST_NAME
+
+# Path to the example docx file
+EXAMPLE_DOCX = os.path.join('docs', 'example_min.docx')
+
+
+def _write_docx(path, text):
+    """Save a one-paragraph document"""
+    docx = DocxDocument()
+    docx.add_paragraph(text)
+    docx.save(str(path))
+
+
+class TestFolderWatcher:
+    """Tests for the watch-folder mode"""
+
+    def setup_method(self):
+        """Setup before each test method"""
+        if not os.path.exists(EXAMPLE_DOCX):
+            pytest.skip(f"Example file {EXAMPLE_DOCX} not found")
+
+    def _watcher(self, tmp_path, **kwargs):
+        """Create a watcher over tmp_path/in that writes zips to tmp_path/out"""
+        kwargs.setdefault('settle', False)
+        return FolderWatcher(str(tmp_path / "in"), str(tmp_path / "out"), jobs=1, output_format='zip', **kwargs)
+
+    def test_converts_only_new_or_changed_files(self, tmp_path):
+        """Test that unchanged, touched and re-saved files are not converted again"""
+        (tmp_path / "in" / "sub").mkdir(parents=True)
+        shutil.copy(EXAMPLE_DOCX, tmp_path / "in" / "a.docx")
+        _write_docx(tmp_path / "in" / "sub" / "b.docx", "first version")
+
+        first = self._watcher(tmp_path).run_once()
+        assert sorted(os.path.basename(result.input_file) for result in first.converted) == ["a.docx", "b.docx"]
+        assert (tmp_path / "out" / "sub" / "b.zip").is_file()
+
+        # A new watcher picks up the state from the manifest
+        touched = tmp_path / "in" / "a.docx"
+        os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10 ** 9))
+        second = self._watcher(tmp_path).run_once()
+        assert second.converted == [] and second.unchanged == 2
+
+        _write_docx(tmp_path / "in" / "sub" / "b.docx", "second version")
+        third = self._watcher(tmp_path).run_once()
+        assert [os.path.basename(result.input_file) for result in third.converted] == ["b.docx"]
+
+        manifest = json.loads((tmp_path / "out" / MANIFEST_NAME).read_text())
+        assert manifest["entries"][os.path.join("sub", "b.docx")]["outputs"] == [os.path.join("sub", "b.zip")]
+
+    def test_deleted_inputs_lose_their_outputs(self, tmp_path):
+        """Test that the outputs of a deleted input are removed"""
+        (tmp_path / "in").mkdir()
+        _write_docx(tmp_path / "in" / "gone.docx", "short-lived")
+        watcher = self._watcher(tmp_path)
+        watcher.run_once()
+        assert (tmp_path / "out" / "gone.zip").is_file()
+
+        os.remove(tmp_path / "in" / "gone.docx")
+        result = watcher.run_once()
+
+        assert result.removed == ["gone.docx"]
+        assert not (tmp_path / "out" / "gone.zip").exists()
+        assert watcher.manifest.entries == {}
+
+    def test_waits_for_writes_to_settle(self, tmp_path):
+        """Test that a changed file is converted once two scans agree on it"""
+        (tmp_path / "in").mkdir()
+        _write_docx(tmp_path / "in" / "new.docx", "being written")
+        watcher = self._watcher(tmp_path, settle=True)
+
+        first = watcher.run_once()
+        second = watcher.run_once()
+
+        assert first.pending == 1 and first.converted == []
+        assert len(second.converted) == 1 and second.converted[0].success
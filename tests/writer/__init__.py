@@ -0,0 +1 @@
+# Writer tests package initialization
@@ -0,0 +1,84 @@
+import io
+import zipfile
+from unittest.mock import patch
+
+from src.writer.archive import copy_raw_entry
+
+
+class _Unseekable(io.RawIOBase):
+    """Write-only stream that cannot seek, like a pipe"""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+
+def _make_source():
+    """Build a source archive with a deflated and a stored entry"""
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, 'w') as source:
+        source.writestr('word/media/image1.png', b'png' * 1000, compress_type=zipfile.ZIP_DEFLATED)
+        source.writestr('word/media/image2.jpeg', b'\xff\xd8jpeg', compress_type=zipfile.ZIP_STORED)
+    data.seek(0)
+    return zipfile.ZipFile(data)
+
+
+class TestCopyRawEntry:
+    """Tests for copying compressed zip entries"""
+
+    def test_copies_entries_without_recompressing(self):
+        """Test that copied entries keep their compressed bytes and stay readable"""
+        source = _make_source()
+        target_data = io.BytesIO()
+
+        with zipfile.ZipFile(target_data, 'w', zipfile.ZIP_DEFLATED) as target:
+            target.writestr('doc.md', 'text')
+            copy_raw_entry(source, 'word/media/image1.png', target, 'doc_media/a.png')
+            copy_raw_entry(source, 'word/media/image2.jpeg', target, 'doc_media/b.jpeg')
+
+        with zipfile.ZipFile(target_data) as result:
+            assert result.testzip() is None
+            assert result.read('doc_media/a.png') == b'png' * 1000
+            assert result.read('doc_media/b.jpeg') == b'\xff\xd8jpeg'
+            copied = result.getinfo('doc_media/a.png')
+            original = source.getinfo('word/media/image1.png')
+            assert copied.compress_type == zipfile.ZIP_DEFLATED
+            assert copied.compress_size == original.compress_size
+
+    def test_copies_into_unseekable_stream(self):
+        """Test that raw copies work when the archive is streamed"""
+        source = _make_source()
+        stream = _Unseekable()
+
+        with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as target:
+            copy_raw_entry(source, 'word/media/image1.png', target, 'a.png')
+            target.writestr('doc.md', 'text')
+
+        with zipfile.ZipFile(io.BytesIO(stream.buffer.getvalue())) as result:
+            assert result.testzip() is None
+            assert result.read('a.png') == b'png' * 1000
+            assert result.read('doc.md') == b'text'
+
+    def test_recompresses_without_zipfile_internals(self):
+        """Test that the public ZipFile API is used when the internals are not available"""
+        source = _make_source()
+        stream = _Unseekable()
+
+        with patch('src.writer.archive._RAW_COPY_ATTRIBUTES', ('_no_such_attribute',)), \
+                patch('src.writer.archive._append_raw') as append_raw, \
+                zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as target:
+            copy_raw_entry(source, 'word/media/image1.png', target, 'a.png')
+            copy_raw_entry(source, 'word/media/image2.jpeg', target, 'b.jpeg')
+            target.writestr('doc.md', 'text')
+
+        append_raw.assert_not_called()
+        with zipfile.ZipFile(io.BytesIO(stream.buffer.getvalue())) as result:
+            assert result.testzip() is None
+            assert result.read('a.png') == b'png' * 1000
+            assert result.read('b.jpeg') == b'\xff\xd8jpeg'
+            assert result.getinfo('b.jpeg').compress_type == zipfile.ZIP_STORED
@@ -0,0 +1,97 @@
+from src.writer.escaping import escape_markdown
+from src.writer.markdown_writer import MarkdownWriter
+from src.models.paragraph import Paragraph
+
+
+class TestEscaping:
+    """Tests for the Markdown escaping"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.writer = MarkdownWriter()
+
+    def test_all_special_characters_are_escaped(self):
+        """Test that every special character gets a backslash"""
+        assert escape_markdown("a\\b*c_d#e`f[g]h(i)j|k<l>m-n") == \
+            "a\\\\b\\*c\\_d\\#e\\`f\\[g\\]h\\(i\\)j\\|k\\<l\\>m\\-n"
+
+    def test_plain_text_is_unchanged(self):
+        """Test that text without special characters is returned as is"""
+        assert escape_markdown("plain text, 100% ok!") == "plain text, 100% ok!"
+
+    def test_hyphen_at_line_start_is_kept(self):
+        """Test that a hyphen is only escaped after the start of a line"""
+        assert escape_markdown("- well-known\n- item") == "- well\\-known\n- item"
+        assert escape_markdown("-x", at_line_start=False) == "\\-x"
+
+    def test_plus_is_escaped_only_at_line_start(self):
+        """Test that a plus that could start a list is escaped"""
+        assert escape_markdown("+ a + b\n+ c") == "\\+ a + b\n\\+ c"
+        assert escape_markdown("+1", at_line_start=False) == "+1"
+
+    def test_escaped_backslash_before_hyphen(self):
+        """Test that a backslash before a line-start hyphen keeps both escapes"""
+        assert escape_markdown("\\-a\n\\-b") == "\\\\\\-a\n\\\\\\-b"
+
+    def test_runs_after_the_line_start_escape_hyphens(self):
+        """Test that the writer tells the escaping where each run starts"""
+        paragraph = Paragraph()
+        paragraph.text = "- item co-op -x"
+        paragraph.add_run("- item ", {})
+        paragraph.add_run("co", {"bold": True})
+        paragraph.add_run("-op -x", {})
+
+        markdown = self.writer._format_text_with_runs(paragraph)
+
+        assert markdown == "- item **co**\\-op \\-x"
+
+    def test_ordered_list_number_is_escaped_at_line_start(self):
+        """Test that a number and dot that would start an ordered list get a backslash"""
+        assert escape_markdown("1. Not a list\n12. Nor this") == "1\\. Not a list\n12\\. Nor this"
+        assert escape_markdown("2024.") == "2024\\."
+        assert escape_markdown("1.5 kg, see 2. below") == "1.5 kg, see 2. below"
+        assert escape_markdown("1. item", at_line_start=False) == "1. item"
+
+    def test_paragraph_starting_with_a_number_stays_text(self):
+        """Test that a paragraph beginning with '1. ' does not turn into a list"""
+        paragraph = Paragraph()
+        paragraph.text = "1. Introduction"
+        paragraph.add_run("1. Introduction", {})
+
+        assert self.writer._format_paragraph(paragraph) == "1\\. Introduction\n\n"
+
+        paragraph.runs = []
+        assert self.writer._format_paragraph(paragraph) == "1\\. Introduction\n\n"
+
+    def test_heading_text_is_escaped(self):
+        """Test that special characters cannot break the bold heading markup"""
+        heading = Paragraph()
+        heading.text = "Use *args, __init__ and `[x]`"
+        heading.heading_level = 2
+
+        assert self.writer._format_paragraph(heading) == \
+            "\t- **Use \\*args, \\_\\_init\\_\\_ and \\`\\[x\\]\\`**\n\n"
+
+    def test_formatted_runs_are_escaped(self):
+        """Test that bold and italic text is escaped inside its markers"""
+        paragraph = Paragraph()
+        paragraph.text = "a*b_c-d [x](y) and more"
+        paragraph.add_run("a*b_c-d [x](y)", {"bold": True})
+        paragraph.add_run(" and ", {})
+        paragraph.add_run("more", {"italic": True})
+
+        assert self.writer._format_paragraph(paragraph) == \
+            "**a\\*b\\_c\\-d \\[x\\]\\(y\\)** and *more*\n\n"
+
+    def test_list_item_text_starts_a_block(self):
+        """Test that list item text cannot open another list after the marker"""
+        for text, expected in (("2. literal", "3. 2\\. literal"), ("+ x", "3. \\+ x"), ("- x", "3. \\- x")):
+            item = Paragraph()
+            item.text = text
+            item.list_level, item.list_number = 1, 3
+            item.add_run(text, {})
+
+            assert self.writer._format_paragraph(item) == f"{expected}\n\n"
+
+            item.runs = []
+            assert self.writer._format_paragraph(item) == f"{expected}\n\n"
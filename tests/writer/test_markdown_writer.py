@@ -0,0 +1,220 @@
+import io
+import tarfile
+import zipfile
+from unittest.mock import patch
+
+from src.writer.markdown_writer import MarkdownWriter
+from src.writer.sinks import BytesSink, DirectorySink
+from src.models.document import Document
+from src.models.paragraph import Paragraph
+from src.models.image import Image
+from src.models.table import Table, escape_cell
+
+
+def _make_document():
+    """Build a small document with a heading and a body paragraph"""
+    document = Document()
+    document.filename = "sample.docx"
+
+    heading = Paragraph()
+    heading.text = "Intro"
+    heading.heading_level = 1
+    document.add_paragraph(heading)
+
+    body = Paragraph()
+    body.text = "Body text"
+    body.add_run("Body text", {"bold": False, "italic": False, "underline": False, "strike": False})
+    document.add_paragraph(body)
+    return document
+
+
+def _add_image(document):
+    """Append a paragraph with an in-memory image"""
+    image = Image()
+    image.content = b"image bytes"
+    image.new_file_name = "document.001.png"
+    paragraph = Paragraph()
+    paragraph.image = image
+    document.add_paragraph(paragraph)
+
+
+def _add_table(document, rows):
+    """Append a paragraph holding a table with the given rows"""
+    table = Table()
+    for row in rows:
+        table.add_row(row)
+    paragraph = Paragraph()
+    paragraph.table = table
+    document.add_paragraph(paragraph)
+    return table
+
+
+class TestMarkdownWriter:
+    """Tests for the MarkdownWriter class"""
+
+    def setup_method(self):
+        """Setup before each test method"""
+        self.writer = MarkdownWriter()
+
+    def test_iter_markdown_yields_one_chunk_per_block(self):
+        """Test that the generator renders block by block"""
+        chunks = list(self.writer.iter_markdown(_make_document()))
+
+        assert chunks == ["- **Intro**\n\n", "\tBody text\n\n"]
+
+    def test_write_markdown_streams_into_text_stream(self):
+        """Test that write_markdown produces the same content as the generator"""
+        document = _make_document()
+        stream = io.StringIO()
+
+        self.writer.write_markdown(document, stream)
+
+        assert stream.getvalue() == "".join(MarkdownWriter().iter_markdown(document))
+
+    def test_bytes_sink_returns_zip_archive(self):
+        """Test that a BytesSink receives the markdown and media without touching the disk"""
+        document = _make_document()
+        _add_image(document)
+
+        data = self.writer.write_document(document, "out/sample", BytesSink())
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.namelist() == ["sample.md", "sample_media/document.001.png"]
+            assert "![image](sample_media/document.001.png)" in archive.read("sample.md").decode("utf-8")
+            assert archive.read("sample_media/document.001.png") == b"image bytes"
+
+    def test_bytes_sink_tar_format(self):
+        """Test that a tar stream holds the same members"""
+        document = _make_document()
+        _add_image(document)
+
+        data = self.writer.write_document(document, "sample", BytesSink("tar"))
+
+        with tarfile.open(fileobj=io.BytesIO(data)) as archive:
+            assert archive.getnames() == ["sample.md", "sample_media/document.001.png"]
+
+    def test_directory_sink_writes_only_files(self, tmp_path):
+        """Test that the directory sink writes the .md file and media folder but no archive"""
+        document = _make_document()
+        _add_image(document)
+
+        md_path = self.writer.write_document(document, str(tmp_path / "sample"), DirectorySink(str(tmp_path)))
+
+        assert md_path == str(tmp_path / "sample.md")
+        assert (tmp_path / "sample_media" / "document.001.png").read_bytes() == b"image bytes"
+        assert not (tmp_path / "sample.zip").exists()
+
+    def test_repeated_image_is_written_once(self):
+        """Test that images sharing a file name are stored only once"""
+        document = _make_document()
+        _add_image(document)
+        _add_image(document)
+
+        data = self.writer.write_document(document, "sample", BytesSink())
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            names = archive.namelist()
+            markdown = archive.read("sample.md").decode("utf-8")
+        assert names.count("sample_media/document.001.png") == 1
+        assert markdown.count("document.001.png") == 2
+
+    def test_sized_image_references(self):
+        """Test that image references carry the picture size when requested"""
+        document = _make_document()
+        _add_image(document)
+        image = document.get_images()[0]
+        image.width, image.height = 120, 40
+        writer = MarkdownWriter(sized_images=True)
+
+        data = writer.write_document(document, "sample", BytesSink('md'))
+
+        assert b"(sample_media/document.001.png){width=120px height=40px}" in data
+
+    def test_table_rows_are_streamed_and_escaped(self):
+        """Test that tables are yielded row by row with pipes and line breaks escaped"""
+        document = _make_document()
+        _add_table(document, [["Name", "Value"], ["a|b", "line 1\nline 2"]])
+
+        chunks = list(self.writer.iter_markdown(document, "sample"))
+
+        assert chunks[2:] == [
+            "\t| Name | Value |\n",
+            "\t| :- | :- |\n",
+            "\t| a\\|b | line 1<br>line 2 |\n",
+            "\n",
+        ]
+
+    def test_aligned_table(self):
+        """Test that aligned tables pad every cell to the column width"""
+        document = _make_document()
+        table = _add_table(document, [["Item", "Qty"], ["Apples", "12"], ["Kiwi"]])
+        table.set_column_alignment(1, 'right')
+        writer = MarkdownWriter(align_tables=True)
+
+        markdown = "".join(writer.iter_markdown(document, "sample"))
+
+        assert markdown.endswith(
+            "\t| Item   | Qty |\n"
+            "\t| :----- | --: |\n"
+            "\t| Apples |  12 |\n"
+            "\t| Kiwi   |     |\n"
+            "\n"
+        )
+
+    def test_aligned_table_escapes_each_cell_once(self):
+        """Test that the width scan and the rendering share the escaped cells"""
+        table = Table()
+        for row in (["a|b", "c"], ["d", "e\nf"]):
+            table.add_row(row)
+
+        with patch('src.models.table.escape_cell', wraps=escape_cell) as escape:
+            lines = list(table.iter_markdown(aligned=True))
+
+        assert escape.call_count == 4
+        assert lines[0] == "| a\\|b | c      |"
+        assert lines[2] == "| d    | e<br>f |"
+
+    def test_fragmented_runs_are_coalesced(self):
+        """Test that runs with the same formatting share one pair of markers"""
+        paragraph = Paragraph()
+        paragraph.text = "foo bar baz *qux*"
+        for text, formatting in (("foo", {"bold": True}), (" bar", {"bold": True}), ("", {}),
+                                 (" baz", {"bold": True, "italic": True}), (" *qux*", {})):
+            paragraph.add_run(text, formatting)
+
+        markdown = self.writer._format_text_with_runs(paragraph)
+
+        assert markdown == "**foo bar***** baz*** \\*qux\\*"
+
+    def test_list_items_are_nested(self):
+        """Test that list items get their marker and one tab per list level"""
+        document = _make_document()
+        for text, level, number in (("fruit", 1, 0), ("apples", 2, 1), ("pears", 2, 2), ("-5 kg", 1, 0)):
+            item = Paragraph()
+            item.text = text
+            item.list_level, item.list_number = level, number
+            item.add_run(text, {})
+            document.add_paragraph(item)
+
+        markdown = "".join(self.writer.iter_markdown(document, "sample"))
+
+        assert markdown.endswith("\t- fruit\n\n\t\t1. apples\n\n\t\t2. pears\n\n\t- \\-5 kg\n\n")
+
+    def test_chunks_resolve_to_serial_output(self):
+        """Test that chunks rendered on their own join to the serial Markdown"""
+        document = _make_document()
+        _add_table(document, [["a", "b"], ["1", "2"]])
+        for level in (2, 0, 1):
+            paragraph = Paragraph()
+            paragraph.text = f"Section {level}" if level else "Text\nmore text"
+            paragraph.heading_level = level
+            document.add_paragraph(paragraph)
+        expected = "".join(self.writer.iter_markdown(document, "sample"))
+
+        paragraphs = list(document.paragraphs)
+        for size in (1, 2, 4):
+            chunks = [MarkdownWriter().render_chunk(paragraphs[start:start + size])
+                      for start in range(0, len(paragraphs), size)]
+            sink = BytesSink('md')
+
+            assert MarkdownWriter().write_rendered(chunks, [], "sample", sink).decode('utf-8') == expected